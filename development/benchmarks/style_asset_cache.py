@@ -0,0 +1,68 @@
+"""Compare the time to create the image assets of a theme when they are
+drawn with PIL, when they are drawn and saved to an empty asset cache,
+and when they are loaded from the cache on a warm start.
+
+    python development/benchmarks/style_asset_cache.py [themename]
+
+Each run starts a new process, so that the warm run loads the assets
+saved by the cold run as an application would at its next start.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+THEME = sys.argv[1] if len(sys.argv) > 1 else "flatly"
+
+
+def build_assets():
+    """Create the assets of every color of the theme and print the time"""
+    import ttkbootstrap as ttk
+
+    app = ttk.Window(themename=THEME)
+    style = ttk.Style.get_instance()
+    builder = style._get_builder()
+    colors = style.colors
+    labels = ["default"] + list(colors)
+    start = perf_counter()
+    for label in labels:
+        color = colors.primary if label == "default" else colors.get(label)
+        builder.create_checkbutton_assets(label)
+        builder.create_radiobutton_assets(label)
+        builder.create_round_toggle_assets(label)
+        builder.create_square_toggle_assets(label)
+        builder.create_scale_assets(label)
+        builder.create_striped_progressbar_assets(20, label)
+        builder.create_scrollbar_assets(color, colors.fg, colors.fg)
+        builder.create_round_scrollbar_assets(color, colors.fg, colors.fg)
+        builder.create_arrow_assets(color, colors.fg, colors.fg)
+        builder.create_sizegrip_assets(color)
+        builder.create_date_button_assets(color)
+    print(f"{(perf_counter() - start) * 1000:.1f}")
+    app.destroy()
+
+
+def timed(label, environment):
+    output = subprocess.run(
+        [sys.executable, __file__, THEME, "--child"],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    print(f"{label:<24} {float(output.split()[-1]):8.1f} ms")
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        build_assets()
+        sys.exit()
+    with tempfile.TemporaryDirectory() as directory:
+        environment = dict(os.environ)
+        environment["TTKBOOTSTRAP_ASSET_CACHE"] = "0"
+        timed("cache disabled", environment)
+        environment["TTKBOOTSTRAP_ASSET_CACHE"] = directory
+        timed("cold cache", environment)
+        timed("warm cache", environment)
+        timed("warm cache (again)", environment)
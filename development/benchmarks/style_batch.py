@@ -0,0 +1,88 @@
+"""Compare the number of Tcl round-trips made by the style and the time
+to build every registered style of a new theme, with each style
+command sent separately and with the commands batched.
+
+    python development/benchmarks/style_batch.py [themename]
+
+The styles of a set of widgets are registered with the "litera" theme,
+and then the theme is changed, which builds each registered style for
+the new theme. Each run starts a new process, and the asset cache is
+disabled so both runs draw the same images.
+"""
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+THEME = sys.argv[1] if len(sys.argv) > 1 else "darkly"
+COLORS = ["primary", "secondary", "success", "info", "warning", "danger"]
+
+
+class CountingTcl:
+    """Count the calls made to the interpreter through the style"""
+
+    def __init__(self, tkapp):
+        self.tkapp = tkapp
+        self.count = 0
+
+    def call(self, *args):
+        self.count += 1
+        return self.tkapp.call(*args)
+
+    def eval(self, script):
+        self.count += 1
+        return self.tkapp.eval(script)
+
+    def __getattr__(self, name):
+        return getattr(self.tkapp, name)
+
+
+def build_theme(batching):
+    """Change the theme and print the round-trips and time"""
+    import ttkbootstrap as ttk
+
+    ttk.Style.batching = batching
+    app = ttk.Window(themename="litera")
+    for color in COLORS:
+        ttk.Button(app, bootstyle=color)
+        ttk.Button(app, bootstyle=f"{color}-outline")
+        ttk.Label(app, bootstyle=color)
+        ttk.Checkbutton(app, bootstyle=color)
+        ttk.Checkbutton(app, bootstyle=f"{color}-round-toggle")
+        ttk.Radiobutton(app, bootstyle=color)
+        ttk.Entry(app, bootstyle=color)
+        ttk.Combobox(app, bootstyle=color)
+        ttk.Notebook(app, bootstyle=color)
+        ttk.Scale(app, bootstyle=color)
+        ttk.Progressbar(app, bootstyle=f"{color}-striped")
+        ttk.Scrollbar(app, bootstyle=f"{color}-round")
+        ttk.Treeview(app, bootstyle=color)
+    style = app.style
+    counter = CountingTcl(style.tk)
+    style.tk = counter
+    start = perf_counter()
+    style.theme_use(THEME)
+    elapsed = perf_counter() - start
+    print(counter.count, f"{elapsed * 1000:.1f}")
+    app.destroy()
+
+
+def timed(label, batching):
+    environment = dict(os.environ, TTKBOOTSTRAP_ASSET_CACHE="0")
+    output = subprocess.run(
+        [sys.executable, __file__, THEME, "--child", str(int(batching))],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    count, elapsed = output.split()[-2:]
+    print(f"{label:<16} {int(count):6d} round-trips {float(elapsed):8.1f} ms")
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        build_theme(sys.argv[3] == "1")
+        sys.exit()
+    timed("unbatched", False)
+    timed("batched", True)
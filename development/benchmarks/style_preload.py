@@ -0,0 +1,67 @@
+"""Compare the latency of the first change to a second theme with and
+without preloading the theme, and of a repeated change.
+
+    python development/benchmarks/style_preload.py [themename]
+
+Each run starts a new process, and the asset cache is disabled so the
+images of the theme are drawn.
+"""
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+THEME = sys.argv[1] if len(sys.argv) > 1 else "darkly"
+COLORS = ["primary", "secondary", "success", "info", "warning", "danger"]
+
+
+def timed(style, themename):
+    start = perf_counter()
+    style.theme_use(themename)
+    return (perf_counter() - start) * 1000
+
+
+def toggle(preload):
+    """Change the theme and back again and print the latencies"""
+    import ttkbootstrap as ttk
+
+    app = ttk.Window(themename="litera")
+    for color in COLORS:
+        ttk.Button(app, bootstyle=color).pack()
+        ttk.Checkbutton(app, bootstyle=f"{color}-round-toggle").pack()
+        ttk.Radiobutton(app, bootstyle=color).pack()
+        ttk.Entry(app, bootstyle=color).pack()
+        ttk.Scale(app, bootstyle=color).pack()
+        ttk.Progressbar(app, bootstyle=f"{color}-striped").pack()
+    app.update()
+    style = app.style
+    if preload:
+        style.preload_themes([THEME])
+        while style._preload_queue:
+            app.update()
+    first = timed(style, THEME)
+    timed(style, "litera")
+    repeat = timed(style, THEME)
+    print(f"{first:.1f} {repeat:.1f}")
+    app.destroy()
+
+
+def run(label, preload):
+    environment = dict(os.environ, TTKBOOTSTRAP_ASSET_CACHE="0")
+    output = subprocess.run(
+        [sys.executable, __file__, THEME, "--child", str(int(preload))],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    first, repeat = output.split()[-2:]
+    print(f"{label:<16} first {float(first):8.1f} ms   repeat {float(repeat):8.1f} ms")
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        toggle(sys.argv[3] == "1")
+        sys.exit()
+    run("no preload", False)
+    run("preloaded", True)
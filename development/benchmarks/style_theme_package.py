@@ -0,0 +1,79 @@
+"""Compare the time to create a theme with the style builder and to
+load it from a compiled theme package.
+
+    python development/benchmarks/style_theme_package.py [themename]
+
+The package is compiled with the styles of a set of common widgets,
+and each run starts a new process so that the theme is created once.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+THEME = sys.argv[1] if len(sys.argv) > 1 else "darkly"
+COLORS = ["primary", "secondary", "success", "info", "warning", "danger"]
+
+
+def create_widgets(app):
+    import ttkbootstrap as ttk
+
+    for color in COLORS:
+        ttk.Button(app, bootstyle=color)
+        ttk.Button(app, bootstyle=f"{color}-outline")
+        ttk.Checkbutton(app, bootstyle=color)
+        ttk.Checkbutton(app, bootstyle=f"{color}-round-toggle")
+        ttk.Radiobutton(app, bootstyle=color)
+        ttk.Entry(app, bootstyle=color)
+        ttk.Combobox(app, bootstyle=color)
+        ttk.Scale(app, bootstyle=color)
+        ttk.Progressbar(app, bootstyle=f"{color}-striped")
+        ttk.Scrollbar(app, bootstyle=f"{color}-round")
+
+
+def compile_package(path):
+    import ttkbootstrap as ttk
+
+    app = ttk.Window(themename="litera")
+    create_widgets(app)
+    app.style.compile_theme(THEME, path=path)
+    app.destroy()
+
+
+def create_theme(path):
+    """Create the theme and the widgets and print the time"""
+    import ttkbootstrap as ttk
+
+    if path:
+        ttk.Style.add_theme_package(path)
+    start = perf_counter()
+    app = ttk.Window(themename=THEME)
+    create_widgets(app)
+    app.update_idletasks()
+    print(f"{(perf_counter() - start) * 1000:.1f}")
+    app.destroy()
+
+
+def timed(label, path=""):
+    environment = dict(os.environ, TTKBOOTSTRAP_ASSET_CACHE="0")
+    output = subprocess.run(
+        [sys.executable, __file__, THEME, "--child", path],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    print(f"{label:<24} {float(output.split()[-1]):8.1f} ms")
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        create_theme(sys.argv[3])
+        sys.exit()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, f"{THEME}.tcl")
+        compile_package(path)
+        print(f"package size {os.path.getsize(path):,} bytes")
+        timed("style builder")
+        timed("theme package", path)
@@ -0,0 +1,42 @@
+"""Time autofitting the columns of a large unpaginated Tableview.
+
+    python development/benchmarks/tableview_autofit.py [records]
+
+The first call measures the characters of the font and the distinct
+values of each column; the second call reuses the widths of the
+columns because the data has not changed.
+"""
+import sys
+from random import Random
+from time import perf_counter
+
+import ttkbootstrap as ttk
+from ttkbootstrap.tableview import Tableview
+
+RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+COLUMNS = 20
+
+random = Random(0)
+coldata = [f"Column {i}" for i in range(COLUMNS)]
+rowdata = [
+    [random.randrange(10 ** random.randrange(1, 9)) for _ in range(COLUMNS)]
+    for _ in range(RECORDS)
+]
+
+
+def timed(label, func, *args):
+    start = perf_counter()
+    func(*args)
+    print(f"{label:<16} {(perf_counter() - start) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    app = ttk.Window()
+    dt = Tableview(app, coldata=coldata, rowdata=rowdata, paginated=False)
+    print(f"{RECORDS:,} records, {COLUMNS} columns")
+    timed("first", dt.autofit_columns)
+    timed("cached", dt.autofit_columns)
+    dt.tablerows[0].values = [0] * COLUMNS
+    timed("changed", dt.autofit_columns)
+    timed("sample=100", dt.autofit_columns, 100)
+    app.destroy()
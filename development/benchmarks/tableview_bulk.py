@@ -0,0 +1,68 @@
+"""Time the bulk row operations of the Tableview.
+
+    python development/benchmarks/tableview_bulk.py
+
+For each size, the records are appended, the same number of records
+is inserted in the middle of the table, and 10% of the records are
+deleted by iid. The legacy one-at-a-time insert is timed for
+comparison at the smaller sizes, where it finishes in reasonable time.
+"""
+import gc
+from time import perf_counter
+
+import ttkbootstrap as ttk
+from ttkbootstrap.tableview import Tableview
+
+SIZES = [10_000, 100_000, 1_000_000]
+LEGACY_LIMIT = 100_000
+
+coldata = ["Serial", "Company", "Users"]
+
+
+def make_rowdata(count):
+    return [(f"A{i:07d}", f"Company {i % 97}", i % 500) for i in range(count)]
+
+
+def timed(func, *args):
+    gc.collect()
+    start = perf_counter()
+    func(*args)
+    return perf_counter() - start
+
+
+def legacy_insert(dt, index, rowdata):
+    # the behavior of insert_rows before the bulk operations
+    for values in reversed(rowdata):
+        dt.insert_row(index, values)
+
+
+def run(app, count, **kwargs):
+    dt = Tableview(app, coldata=coldata, paginated=True, **kwargs)
+    rowdata = make_rowdata(count)
+    results = {}
+    results["append_rows"] = timed(dt.append_rows, rowdata)
+    results["insert_rows_at"] = timed(dt.insert_rows_at, count // 2, rowdata)
+
+    # only records that have been shown have an iid
+    doomed = dt.tablerows[: count // 10]
+    for row in doomed:
+        row.build()
+    iids = [row.iid for row in doomed]
+    results["delete_rows"] = timed(dt.delete_rows, None, iids)
+
+    if count <= LEGACY_LIMIT:
+        results["legacy insert"] = timed(legacy_insert, dt, count // 2, rowdata)
+    dt.destroy()
+    return results
+
+
+if __name__ == "__main__":
+    app = ttk.Window()
+    app.withdraw()
+    for columnar in (False, True):
+        print(f"columnar={columnar}")
+        for count in SIZES:
+            results = run(app, count, columnar=columnar)
+            line = "  ".join(f"{k}: {v:7.3f}s" for k, v in results.items())
+            print(f"  {count:>9,}  {line}")
+    app.destroy()
@@ -0,0 +1,50 @@
+"""Time opening a large csv file with Tableview.open_csv.
+
+    python development/benchmarks/tableview_csv.py [records]
+
+A temporary file is written first. The first page is shown from the
+first indexed block; the rest of the file is indexed in the
+background.
+"""
+import csv
+import os
+import sys
+import tempfile
+from random import Random
+from time import perf_counter, sleep
+
+import ttkbootstrap as ttk
+from ttkbootstrap.tableview import Tableview
+
+RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+
+random = Random(0)
+fruits = ["apple", "banana", "cherry"]
+
+if __name__ == "__main__":
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    with os.fdopen(fd, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Serial", "Fruit", "Count", "Score"])
+        for i in range(RECORDS):
+            writer.writerow(
+                (i, random.choice(fruits), random.randrange(100), random.random())
+            )
+    size = os.path.getsize(path)
+    print(f"{RECORDS:,} records, {size / 1e6:,.0f} MB")
+
+    app = ttk.Window()
+    dt = Tableview(app, paginated=True)
+    start = perf_counter()
+    provider = dt.open_csv(path)
+    print(f"{'first page':<16} {(perf_counter() - start) * 1000:8.1f} ms")
+    while provider.progress is not None:
+        app.update()
+        sleep(0.01)
+    print(f"{'indexed':<16} {(perf_counter() - start) * 1000:8.1f} ms")
+    start = perf_counter()
+    dt.goto_last_page()
+    print(f"{'last page':<16} {(perf_counter() - start) * 1000:8.1f} ms")
+    dt.set_provider(None)
+    app.destroy()
+    os.remove(path)
@@ -0,0 +1,55 @@
+"""Time stacked row filters on a large Tableview.
+
+    python development/benchmarks/tableview_filter.py [records]
+
+The first pass evaluates and caches the column values; the following
+passes reuse them. Narrowing adds the filters one at a time, so each
+filter is evaluated on the records of the previous one only.
+"""
+import sys
+from random import Random
+from time import perf_counter
+
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from ttkbootstrap.tableview import Tableview
+
+RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+random = Random(0)
+coldata = ["Serial", "Fruit", "Count", "Score"]
+fruits = ["apple", "banana", "cherry"]
+rowdata = [
+    (i, random.choice(fruits), random.randrange(100), random.random())
+    for i in range(RECORDS)
+]
+
+
+def timed(label, func, *args):
+    start = perf_counter()
+    func(*args)
+    print(f"{label:<16} {(perf_counter() - start) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    app = ttk.Window()
+    for columnar in (False, True):
+        print(f"{RECORDS:,} records, columnar={columnar}")
+        dt = Tableview(app, coldata=coldata, paginated=True, columnar=columnar)
+        dt.insert_rows(END, rowdata)
+        dt.load_table_data()
+        fruit, count, score = (col.cid for col in dt.tablecolumns[1:])
+        filters = [
+            (fruit, "equals", "apple"),
+            (count, "range", (10, 60)),
+            (score, "range", (0.1, 0.9)),
+        ]
+        timed("first pass", dt.set_row_filters, filters)
+        timed("cached", dt.set_row_filters, filters)
+        dt.reset_row_filters()
+        start = perf_counter()
+        for rowfilter in filters:
+            dt.add_row_filter(*rowfilter)
+        print(f"{'narrowing':<16} {(perf_counter() - start) * 1000:8.1f} ms")
+        dt.destroy()
+    app.destroy()
@@ -0,0 +1,54 @@
+"""Time loading a large csv file with Tableview.load_csv.
+
+    python development/benchmarks/tableview_load_csv.py [records]
+
+A temporary file is written first. The first page is shown after the
+first chunk is parsed; the window keeps processing events while the
+rest of the file is loaded. The longest gap between two updates of
+the window is reported.
+"""
+import csv
+import os
+import sys
+import tempfile
+from random import Random
+from time import perf_counter
+
+import ttkbootstrap as ttk
+from ttkbootstrap.tableview import Tableview
+
+RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+
+random = Random(0)
+fruits = ["apple", "banana", "cherry"]
+
+if __name__ == "__main__":
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    with os.fdopen(fd, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Serial", "Fruit", "Count", "Score"])
+        for i in range(RECORDS):
+            writer.writerow(
+                (i, random.choice(fruits), random.randrange(100), random.random())
+            )
+    print(f"{RECORDS:,} records")
+
+    app = ttk.Window()
+    dt = Tableview(app, paginated=True)
+    dt.pack()
+    start = last = perf_counter()
+    dt.load_csv(path)
+    firstpage = None
+    longest = 0
+    while dt._csvimport is not None:
+        app.update()
+        now = perf_counter()
+        longest = max(longest, now - last)
+        last = now
+        if firstpage is None and dt.view.get_children():
+            firstpage = now - start
+    print(f"{'first page':<16} {firstpage * 1000:8.1f} ms")
+    print(f"{'loaded':<16} {(perf_counter() - start) * 1000:8.1f} ms")
+    print(f"{'longest update':<16} {longest * 1000:8.1f} ms")
+    app.destroy()
+    os.remove(path)
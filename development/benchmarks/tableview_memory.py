@@ -0,0 +1,50 @@
+"""Compare the memory used per record by the default Tableview row
+objects and the columnar store.
+
+    python development/benchmarks/tableview_memory.py [rowcount]
+"""
+import sys
+import gc
+import tracemalloc
+from random import choice, randint, random
+
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from ttkbootstrap.tableview import Tableview
+
+ROWCOUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+coldata = ["Serial", "Company", "Users", "Score"]
+companies = ["IzzyCo", "Kimdee Inc.", "Farmadding Co.", "Marzale LLC"]
+
+
+def make_rowdata():
+    return [
+        (f"A{i:07d}", choice(companies), randint(1, 500), random())
+        for i in range(ROWCOUNT)
+    ]
+
+
+def measure(app, **kwargs):
+    rowdata = make_rowdata()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    dt = Tableview(app, coldata=coldata, rowdata=rowdata, paginated=True, **kwargs)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    dt.destroy()
+    return (after - before) / ROWCOUNT
+
+
+if __name__ == "__main__":
+    app = ttk.Window()
+    app.withdraw()
+    rows = measure(app)
+    columns = measure(app, columnar=True)
+    print(f"records:          {ROWCOUNT:,}")
+    print(f"row objects:      {rows:8.1f} bytes/record")
+    print(f"columnar store:   {columns:8.1f} bytes/record")
+    print(f"reduction:        {1 - columns / rows:8.1%}")
+    app.destroy()
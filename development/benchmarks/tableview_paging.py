@@ -0,0 +1,50 @@
+"""Time page flips of a paginated Tableview with large pages.
+
+    python development/benchmarks/tableview_paging.py [pagesize]
+
+Every page is visited once first so that the records exist in the
+Treeview; the timed flips then measure the view refresh only.
+"""
+import sys
+from time import perf_counter
+
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from ttkbootstrap.tableview import Tableview
+
+PAGESIZE = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+PAGES = 10
+FLIPS = 50
+
+coldata = ["Serial", "Company", "Users"]
+rowdata = [(f"A{i:07d}", f"Company {i % 97}", i % 500) for i in range(PAGESIZE * PAGES)]
+
+if __name__ == "__main__":
+    app = ttk.Window()
+    colors = app.style.colors
+    dt = Tableview(
+        app,
+        coldata=coldata,
+        rowdata=rowdata,
+        paginated=True,
+        pagesize=PAGESIZE,
+        stripecolor=(colors.light, None),
+    )
+    dt.pack(fill=BOTH, expand=YES)
+    app.update()
+
+    for _ in range(PAGES):
+        dt.goto_next_page()
+    dt.goto_first_page()
+    app.update()
+
+    start = perf_counter()
+    for i in range(FLIPS):
+        if i % 2:
+            dt.goto_prev_page()
+        else:
+            dt.goto_next_page()
+        app.update_idletasks()
+    elapsed = (perf_counter() - start) / FLIPS
+    print(f"pagesize {PAGESIZE:,}: {elapsed * 1000:.1f} ms per page flip")
+    app.destroy()
@@ -0,0 +1,47 @@
+"""Time sorting a Tableview by a column.
+
+    python development/benchmarks/tableview_sort.py [records]
+
+The first sort of each column infers its datatype and caches its sort
+order; the following sorts reuse or reverse the cached order.
+"""
+import sys
+from random import Random
+from time import perf_counter
+
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from ttkbootstrap.tableview import Tableview
+
+RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+random = Random(0)
+coldata = ["Serial", "Company", "Score"]
+rowdata = [
+    (i, f"Company {random.randrange(RECORDS)}", random.random())
+    for i in range(RECORDS)
+]
+
+
+def timed(label, func, *args, **kwargs):
+    start = perf_counter()
+    func(*args, **kwargs)
+    print(f"{label:<24} {(perf_counter() - start) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    app = ttk.Window()
+    for columnar in (False, True):
+        print(f"{RECORDS:,} records, columnar={columnar}")
+        dt = Tableview(app, coldata=coldata, paginated=True, columnar=columnar)
+        dt.insert_rows(END, rowdata)
+        dt.load_table_data()
+        for column in dt.tablecolumns[1:]:
+            name = column.headertext
+            timed(f"{name} first sort", dt.sort_column_data, cid=column.cid)
+            timed(f"{name} reverse", dt.sort_column_data, cid=column.cid)
+        first, second = dt.tablecolumns[1:]
+        timed("cached column", dt.sort_column_data, cid=first.cid)
+        timed("multi-column", dt.sort_column_data, cid=second.cid, multisort=True)
+        dt.destroy()
+    app.destroy()
@@ -0,0 +1,60 @@
+"""Time paging through a large table with SqliteDataProvider.
+
+    python development/benchmarks/tableview_sqlite.py [records]
+
+Moving to the next page continues from the last record of the
+previous page (keyset pagination); jumping to a page counts past the
+records before it with OFFSET.
+"""
+import sqlite3
+import sys
+from random import Random
+from time import perf_counter
+
+from ttkbootstrap.tableview import SqliteDataProvider
+
+RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+PAGESIZE = 25
+
+random = Random(0)
+connection = sqlite3.connect(":memory:")
+connection.execute("CREATE TABLE data (serial INTEGER, fruit TEXT, score REAL)")
+connection.execute("CREATE INDEX data_score ON data (score)")
+connection.executemany(
+    "INSERT INTO data VALUES (?, ?, ?)",
+    ((i, random.choice(["apple", "banana", "cherry"]), random.random())
+     for i in range(RECORDS)),
+)
+
+
+def timed(label, func, *args):
+    start = perf_counter()
+    func(*args)
+    print(f"{label:<24} {(perf_counter() - start) * 1000:8.1f} ms")
+
+
+def last_pages(provider, pages=20):
+    """Fetch the last pages one after the other"""
+    offset = RECORDS - pages * PAGESIZE
+    provider.fetch(offset, PAGESIZE)
+    for _ in range(pages - 1):
+        offset += PAGESIZE
+        provider.fetch(offset, PAGESIZE)
+
+
+def jump_pages(provider, pages=20):
+    """Fetch the last pages out of order, so each uses OFFSET"""
+    for page in range(pages, 0, -1):
+        provider.fetch(RECORDS - page * PAGESIZE, PAGESIZE)
+
+
+if __name__ == "__main__":
+    provider = SqliteDataProvider(connection, table="data")
+    print(f"{RECORDS:,} records")
+    timed("count", provider.row_count)
+    for sortorder in ([], [(2, False)]):
+        provider.sort(sortorder)
+        label = "sorted" if sortorder else "unsorted"
+        timed(f"next page, {label}", last_pages, provider)
+        timed(f"jump to page, {label}", jump_pages, provider)
+    timed("export", lambda: sum(1 for _ in provider.iter_rows()))
@@ -0,0 +1,60 @@
+"""Compare the time the Tk thread is blocked when a large columnar
+Tableview is sorted, filtered and searched on the Tk thread and in a
+pool of worker processes.
+
+    python development/benchmarks/tableview_workers.py [records] [workers]
+
+With workers, the "blocked" time is the time the call takes to return,
+during which the event loop cannot run, and the "done" time is the
+time until the result is shown.
+"""
+import sys
+from random import Random
+from time import perf_counter
+
+import ttkbootstrap as ttk
+from ttkbootstrap.tableview import Tableview
+
+RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+WORKERS = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+random = Random(0)
+coldata = ["Name", "Count", "Price"]
+rowdata = [
+    [f"name{random.randrange(100_000)}", random.randrange(1000), random.random()]
+    for _ in range(RECORDS)
+]
+
+
+def timed(label, dt, func, *args):
+    start = perf_counter()
+    func(*args)
+    blocked = perf_counter() - start
+    while dt._pooljob is not None:
+        dt.update()
+    done = perf_counter() - start
+    print(f"{label:<24} blocked {blocked * 1000:8.1f} ms   done {done * 1000:8.1f} ms")
+
+
+def run(app, workers):
+    dt = Tableview(
+        app, coldata=coldata, rowdata=rowdata, paginated=True, columnar=True,
+        workers=workers,
+    )
+    print(f"workers={workers}")
+    timed("sort text", dt, dt.sort_column_data, None, "0")
+    timed("sort numeric", dt, dt.sort_column_data, None, "2")
+    timed("filter regex", dt, dt.set_row_filters, [("0", "regex", "name1.*5$")])
+    timed("filter range", dt, dt.set_row_filters, [("1", "range", (100, 200))])
+    dt.reset_table()
+    dt.searchcriteria = "me99"
+    timed("search", dt, dt._search_table_data)
+    dt.destroy()
+
+
+if __name__ == "__main__":
+    app = ttk.Window()
+    print(f"{RECORDS:,} records")
+    run(app, None)
+    run(app, WORKERS)
+    app.destroy()
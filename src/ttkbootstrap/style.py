@@ -1,11 +1,19 @@
+import base64
 import json
+import os
 import re
+import sys
 import colorsys
+import hashlib
 import tkinter as tk
 from tkinter import font
+from contextlib import contextmanager
+from functools import wraps
 from math import ceil
+from time import perf_counter
 from tkinter import TclError, ttk
 from typing import Any, Callable
+from weakref import WeakSet
 from PIL import ImageTk, ImageDraw, Image, ImageFont
 from ttkbootstrap.constants import *
 from ttkbootstrap.themes.standard import STANDARD_THEMES
@@ -427,6 +435,275 @@ class ThemeDefinition:
         )
 
 
+def _package_version():
+    """Return the installed version of ttkbootstrap, or the modification
+    time of this module when the package is not installed"""
+    global _VERSION
+    if _VERSION is None:
+        try:
+            from importlib.metadata import version
+
+            _VERSION = version("ttkbootstrap")
+        except Exception:
+            _VERSION = f"dev-{os.stat(__file__).st_mtime_ns}"
+    return _VERSION
+
+
+_VERSION = None
+
+
+class AssetCache:
+    """A persistent cache of the image assets of the themes.
+
+    The images drawn by the `create_*_assets` methods of the style
+    builder are saved as PNG data in the user cache directory, keyed
+    by a hash of the builder method, its arguments, the theme colors,
+    the windowing system, the scaling factor and the ttkbootstrap
+    version. When the same assets are needed again, including at the
+    next start of the application, they are loaded from the cache
+    rather than drawn with PIL.
+
+    The cache is limited to `maxsize` bytes; when it grows larger, the
+    least recently used entries are removed. The cache is disabled by
+    setting the `TTKBOOTSTRAP_ASSET_CACHE` environment variable to
+    `0`, or another directory is used by setting the variable to the
+    path of the directory.
+
+    Examples:
+
+        ```python
+        # disable the cache before the style is created
+        Style.asset_cache.enabled = False
+
+        # remove all cached assets
+        Style.asset_cache.clear()
+        ```
+    """
+
+    ENVIRONMENT = "TTKBOOTSTRAP_ASSET_CACHE"
+
+    def __init__(self, directory=None, maxsize=8 * 1024 * 1024, enabled=True):
+        """
+        Parameters:
+
+            directory (str):
+                The directory of the cached assets. Defaults to the
+                `ttkbootstrap` directory in the user cache directory.
+
+            maxsize (int):
+                The maximum size of the cache in bytes.
+
+            enabled (bool):
+                If `False`, assets are neither loaded from nor saved
+                to the cache.
+        """
+        setting = os.environ.get(self.ENVIRONMENT, "")
+        if setting.lower() in ("0", "false", "no", "off"):
+            enabled = False
+        elif setting and directory is None:
+            directory = setting
+        self.directory = directory or os.path.join(
+            AssetCache.user_cache_dir(), "assets"
+        )
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self._usage = None  # bytes used, counted when first needed
+
+    @staticmethod
+    def user_cache_dir():
+        """Return the platform specific cache directory of the user
+        for ttkbootstrap.
+
+        Returns:
+
+            str:
+                The path of the directory.
+        """
+        if sys.platform == "win32":
+            base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(
+                "~\\AppData\\Local"
+            )
+            return os.path.join(base, "ttkbootstrap", "Cache")
+        if sys.platform == "darwin":
+            return os.path.expanduser("~/Library/Caches/ttkbootstrap")
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(
+            "~/.cache"
+        )
+        return os.path.join(base, "ttkbootstrap")
+
+    @property
+    def version(self):
+        """The version of ttkbootstrap that drew the assets. When the
+        package is not installed, the modification time of this module
+        is used, so that changes to the drawing code are not hidden by
+        the cache."""
+        return _package_version()
+
+    def key(self, *parts):
+        """Return the cache key of the parts that determine an asset.
+
+        Parameters:
+
+            *parts (Any):
+                Values with a stable `repr`.
+
+        Returns:
+
+            str:
+                The hexadecimal hash of the parts and the version.
+        """
+        text = repr((self.version,) + parts)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:40]
+
+    def load(self, key):
+        """Return the shape and base64 PNG data of the cached images
+        of the key, or `None` if the key is not cached.
+
+        Parameters:
+
+            key (str):
+                The cache key.
+
+        Returns:
+
+            Union[Tuple[Any, List[str]], None]:
+                The structure of the image indices returned by the
+                builder method, and the data of each image.
+        """
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="ascii") as f:
+                lines = f.read().splitlines()
+            os.utime(path)
+            return json.loads(lines[0]), lines[1:]
+        except (OSError, ValueError, IndexError):
+            return None
+
+    def save(self, key, shape, images):
+        """Save the images of the key. The cache is then pruned to
+        the maximum size. Errors writing the cache are ignored.
+
+        Parameters:
+
+            key (str):
+                The cache key.
+
+            shape (Any):
+                The structure of the image indices returned by the
+                builder method.
+
+            images (List[str]):
+                The base64 PNG data of each image.
+        """
+        if not self.enabled:
+            return
+        path = self._path(key)
+        content = "\n".join([json.dumps(shape)] + list(images))
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp = f"{path}.{os.getpid()}.tmp"
+            with open(temp, "w", encoding="ascii") as f:
+                f.write(content)
+            os.replace(temp, path)
+        except OSError:
+            return
+        if self._usage is not None:
+            self._usage += len(content)
+        if self.size() > self.maxsize:
+            self.prune()
+
+    def discard(self, key):
+        """Remove the cached images of the key.
+
+        Parameters:
+
+            key (str):
+                The cache key.
+        """
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+        self._usage = None
+
+    def size(self):
+        """Return the size of the cached images in bytes.
+
+        Returns:
+
+            int:
+                The number of bytes.
+        """
+        if self._usage is None:
+            self._usage = sum(size for _, size, _ in self._entries())
+        return self._usage
+
+    def prune(self, maxsize=None):
+        """Remove the least recently used entries until the cache is
+        no larger than maxsize.
+
+        Parameters:
+
+            maxsize (int):
+                The size to prune to, in bytes; the `maxsize` of the
+                cache if not given.
+        """
+        maxsize = self.maxsize if maxsize is None else maxsize
+        entries = sorted(self._entries())
+        usage = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if usage <= maxsize:
+                break
+            try:
+                os.remove(path)
+                usage -= size
+            except OSError:
+                pass
+        self._usage = usage
+
+    def clear(self):
+        """Remove all cached images"""
+        self.prune(0)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.txt")
+
+    def _entries(self):
+        """Return the time of last use, size and path of each entry"""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(".txt"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+
+class _LazyAssetCache:
+    """Creates the asset cache of the `Style` class when it is first
+    used, rather than when the module is imported, and replaces itself
+    with the cache"""
+
+    def __get__(self, instance, owner):
+        cache = AssetCache()
+        Style.asset_cache = cache
+        return cache
+
+
+# the bindtag of the widgets that wait for their style to be built
+_LAZY_MAP_TAG = "TtkbootstrapLazyStyle"
+
+
 class Style(ttk.Style):
     """A singleton class for creating and managing the application
     theme and widget styles.
@@ -455,6 +732,11 @@ class Style(ttk.Style):
     """
 
     instance = None
+    asset_cache = _LazyAssetCache()  # an AssetCache once first used
+    batching = True  # build styles in batches of Tcl commands
+    lazy_build = False  # build the styles of unmapped widgets in idle time
+    LAZYSLICE = 0.01  # seconds of style building in each idle callback
+    _theme_packages = {}  # theme name to the header and script of a package
 
     def __new__(cls, theme=None):
         if Style.instance is None:
@@ -478,6 +760,15 @@ class Style(ttk.Style):
         self._style_registry = set()  # all styles used
         self._theme_styles = {}  # styles used in theme
         self._theme_names = set()
+        self._pending_styles = {}  # styles to build in idle time, in order
+        self._waiting_widgets = {}  # unmapped widgets by pending style
+        self._styled_widgets = WeakSet()  # ttk widgets created by the api
+        self._lazyjob = None
+        self._mapfuncid = None  # the <Map> binding while styles are pending
+        self._preload_queue = []  # themes to build in idle time
+        self._preload_styles = None  # styles to build for the first theme
+        self._preload_budget = 0.01
+        self._preloadjob = None
         self._load_themes()
         super().__init__()
 
@@ -563,6 +854,11 @@ class Style(ttk.Style):
         runtime. Otherwise, pass the theme name into the Style
         constructor to instantiate the style with a theme.
 
+        When `Style.lazy_build` is `True`, only the styles of the mapped
+        widgets are built before the theme change is published. The
+        other registered styles are built in idle time, or as soon as
+        a widget that uses one of them is mapped.
+
         Parameters:
 
             themename (str):
@@ -582,18 +878,94 @@ class Style(ttk.Style):
         existing_themes = super().theme_names()
         if themename in existing_themes:
             self.theme = self._theme_definitions.get(themename)
-            super().theme_use(themename)
-            self._create_ttk_styles_on_theme_change()
+            with self.batch():
+                super().theme_use(themename)
+                self._create_ttk_styles_on_theme_change()
             Publisher.publish_message(Channel.STD)
         # setup a new theme
         elif themename in self._theme_names:
             self.theme = self._theme_definitions.get(themename)
-            self._theme_objects[themename] = StyleBuilderTTK()
-            self._create_ttk_styles_on_theme_change()
+            with self.batch():
+                if self._load_theme_package(themename):
+                    ttk.Style.theme_use(self, themename)
+                else:
+                    self._theme_objects[themename] = StyleBuilderTTK()
+                self._create_ttk_styles_on_theme_change()
             Publisher.publish_message(Channel.STD)
         else:
             raise TclError(themename, "is not a valid theme.")
 
+    @contextmanager
+    def batch(self):
+        """A context in which the style commands are batched. The
+        commands that configure, map and layout styles are queued as
+        Tcl lists and evaluated as a single script when the context
+        exits, or earlier when another style command needs their
+        result. Styles are built in a batch when the theme changes and
+        when a style is created for a widget.
+
+        Errors in the queued commands are raised when the batch is
+        evaluated. Set `Style.batching` to `False` to send each
+        command as it is made.
+
+        Examples:
+
+            ```python
+            with style.batch():
+                for color in style.colors:
+                    style.configure(f"{color}.TLabel", padding=10)
+            ```
+        """
+        if not Style.batching or isinstance(
+            self.tk, (_TclBatch, _TclRecorder)
+        ):
+            # not batching, already batching or building another
+            # theme, or recording a theme
+            yield
+            return
+        tkapp = self.tk
+        batch = _TclBatch(tkapp)
+        self.tk = batch
+        try:
+            yield
+        finally:
+            self.tk = tkapp
+            batch.flush()
+
+    def preload_themes(self, names, budget_ms=10):
+        """Build themes in idle time without using them, so that a
+        later `theme_use` only needs to change the theme. The styles
+        registered so far, and their images, are built for each theme
+        in turn, spending at most about `budget_ms` milliseconds in
+        each idle callback. Styles registered later are built when the
+        theme is used, as usual.
+
+        Parameters:
+
+            names (Iterable[str]):
+                The names of the themes to build.
+
+            budget_ms (int):
+                The time to spend building styles in each idle
+                callback, in milliseconds.
+
+        Examples:
+
+            ```python
+            app = ttk.Window(themename="flatly")
+            # ... create the widgets ...
+            app.style.preload_themes(["darkly"])
+            ```
+        """
+        for name in names:
+            if name not in self._theme_names:
+                raise TclError(name, "is not a valid theme.")
+            if name not in self._preload_queue:
+                self._preload_queue.append(name)
+        self._preload_budget = budget_ms / 1000
+        if self._preload_queue and self._preloadjob is None:
+            self._preloadjob = self.master.after_idle(self._preload_step)
+
     def style_exists_in_theme(self, ttkstyle: str):
         """Check if a style exists in the current theme.
 
@@ -612,6 +984,145 @@ class Style(ttk.Style):
         exists_in_registry = ttkstyle in self._style_registry
         return exists_in_theme and exists_in_registry
 
+    def compile_theme(self, themename, ttkstyles=None, path=None):
+        """Compile a theme into a Tcl script that creates the theme,
+        the given styles and their images. When the script is added
+        with `Style.add_theme_package` before the theme is first used,
+        the theme is loaded with a single `eval` rather than built by
+        the style builder. Styles that are not in the package are
+        built as usual when they are needed.
+
+        The commands are recorded while the theme is built under a
+        temporary name, so a theme that is in use can be compiled.
+        The images are drawn for the windowing system and scaling of
+        the current display; a package is ignored on a display that
+        differs, or by another version of ttkbootstrap, and the theme
+        is built instead.
+
+        Parameters:
+
+            themename (str):
+                The name of the theme to compile.
+
+            ttkstyles (Iterable[str]):
+                The ttk styles to include, such as `success.TButton`.
+                Defaults to the styles used by the application so far.
+
+            path (str):
+                If given, the script is written to this file.
+
+        Returns:
+
+            str:
+                The Tcl script.
+
+        Examples:
+
+            ```python
+            # when the application is built, after creating its widgets
+            style.compile_theme("darkly", path="darkly.tcl")
+
+            # when the application starts, before the theme is used
+            Style.add_theme_package("darkly.tcl")
+            app = ttk.Window(themename="darkly")
+            ```
+        """
+        definition = self._theme_definitions.get(themename)
+        if definition is None:
+            raise TclError(themename, "is not a valid theme.")
+        if ttkstyles is None:
+            ttkstyles = sorted(self._style_registry)
+
+        existing = set(super().theme_names())
+        number = 1
+        while f"{themename}-compile{number}" in existing:
+            number += 1
+        tempname = f"{themename}-compile{number}"
+        colors = {
+            label: definition.colors.get(label)
+            for label in Colors.label_iter()
+        }
+        self.register_theme(ThemeDefinition(tempname, colors, definition.type))
+
+        current = self.theme
+        registry = set(self._style_registry)
+        tkapp = self.tk
+        recorder = _TclRecorder(tkapp)
+        self.tk = recorder
+        try:
+            self.theme = self._theme_definitions[tempname]
+            builder = StyleBuilderTTK()
+            self._theme_objects[tempname] = builder
+            for ttkstyle in ttkstyles:
+                self._build_ttkstyle(ttkstyle)
+            styles = sorted(self._theme_styles[tempname])
+        finally:
+            self.tk = tkapp
+            self.theme = current
+            ttk.Style.theme_use(self, current.name)
+            self._style_registry = registry
+            self._theme_names.discard(tempname)
+            self._theme_definitions.pop(tempname)
+            self._theme_styles.pop(tempname)
+            self._theme_objects.pop(tempname, None)
+
+        # give the images names that are unique to the theme
+        images = {}
+        commands = []
+        for args in recorder.commands:
+            command = _rename_images(
+                _tcl_list(args), builder.theme_images, images, themename
+            )
+            commands.append(f"    {command}")
+        lines = [
+            "# ttkbootstrap theme package",
+            f"# theme: {themename}",
+            f"# version: {_package_version()}",
+            f"# windowingsystem: {tkapp.call('tk', 'windowingsystem')}",
+            f"# scaling: {tkapp.call('tk', 'scaling')}",
+        ]
+        for name, newname in images.items():
+            data = _png_data(tkapp, name)
+            lines.append(
+                f"image create photo {newname} -format png -data {data}"
+            )
+        lines.append(
+            f"ttk::style theme create {_tcl_word(themename)} "
+            f"-parent {TTK_CLAM} -settings {{"
+        )
+        lines.extend(commands)
+        lines.append("}")
+        lines.append(f"list {_tcl_list(styles)}")
+        script = "\n".join(lines) + "\n"
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(script)
+        return script
+
+    @staticmethod
+    def add_theme_package(path):
+        """Add a theme package created by `compile_theme`. The theme is
+        loaded from the package when it is first used. A package that
+        is added after its theme was first used has no effect.
+
+        Parameters:
+
+            path (str):
+                The path of the theme package.
+        """
+        with open(path, encoding="utf-8") as f:
+            script = f.read()
+        header = {}
+        for line in script.splitlines():
+            if not line.startswith("# "):
+                break
+            key, _, value = line[2:].partition(": ")
+            header[key] = value
+        themename = header.get("theme")
+        if not themename:
+            raise ValueError(f"{path} is not a ttkbootstrap theme package")
+        Style._theme_packages[themename] = (header, script)
+
     @staticmethod
     def get_instance():
         """Returns and instance of the style class"""
@@ -650,6 +1161,30 @@ class Style(ttk.Style):
         """Calls configure of superclass; used by style builder classes."""
         super().configure(style, **kw)
 
+    def _load_theme_package(self, themename):
+        """Create the theme from its theme package, if one was added.
+        Returns `False` if there is no package for this display and
+        version, and the theme must be built."""
+        package = Style._theme_packages.pop(themename, None)
+        if package is None:
+            return False
+        header, script = package
+        winsys = str(self.tk.call("tk", "windowingsystem"))
+        scaling = str(self.tk.call("tk", "scaling"))
+        if (
+            header.get("version") != _package_version()
+            or header.get("windowingsystem") != winsys
+            or header.get("scaling") != scaling
+        ):
+            return False
+        styles = self.tk.splitlist(self.tk.eval(script))
+        # styles that are not in the package are built when needed
+        self._theme_objects[themename] = StyleBuilderTTK(build=False)
+        self._theme_styles[themename].update(styles)
+        # the package styles are built by the other themes as well
+        self._style_registry.update(styles)
+        return True
+
     def _load_themes(self):
         """Load all ttkbootstrap defined themes"""
         # create a theme definition object for each theme, this will be
@@ -683,13 +1218,199 @@ class Style(ttk.Style):
 
     def _create_ttk_styles_on_theme_change(self):
         """Create existing styles when the theme changes"""
-        for ttkstyle in self._style_registry:
-            if not self.style_exists_in_theme(ttkstyle):
-                color = Bootstyle.ttkstyle_widget_color(ttkstyle)
-                method_name = Bootstyle.ttkstyle_method_name(string=ttkstyle)
-                builder: StyleBuilderTTK = self._get_builder()
-                method: Callable = builder.name_to_method(method_name)
-                method(builder, color)
+        self._cancel_lazy_build()
+        pending = [
+            ttkstyle
+            for ttkstyle in self._style_registry
+            if not self.style_exists_in_theme(ttkstyle)
+        ]
+        if Style.lazy_build and pending:
+            self._start_lazy_build(pending)
+            return
+        for ttkstyle in pending:
+            self._build_ttkstyle(ttkstyle)
+
+    def _build_ttkstyle(self, ttkstyle):
+        """Build the ttk style in the current theme, unless it exists.
+        A builder method may build more than one style."""
+        if self.style_exists_in_theme(ttkstyle):
+            return
+        color = Bootstyle.ttkstyle_widget_color(ttkstyle)
+        method_name = Bootstyle.ttkstyle_method_name(string=ttkstyle)
+        builder: StyleBuilderTTK = self._get_builder()
+        method: Callable = builder.name_to_method(method_name)
+        method(builder, color)
+
+    def _start_lazy_build(self, pending):
+        """Build the pending styles that are used by mapped widgets,
+        and schedule the others to be built in idle time. Until their
+        style is built, unmapped widgets fall back to the base style
+        of the new theme, such as `TButton`, and are then updated."""
+        pendingset = set(pending)
+        visible = set()
+        waiting = {}
+        for widget in list(self._styled_widgets):
+            try:
+                ttkstyle = str(widget.cget("style"))
+                if ttkstyle not in pendingset:
+                    continue
+                if widget.winfo_ismapped():
+                    visible.add(ttkstyle)
+                else:
+                    waiting.setdefault(ttkstyle, []).append(widget)
+            except TclError:
+                continue
+        for ttkstyle in pending:
+            if ttkstyle in visible:
+                self._build_ttkstyle(ttkstyle)
+        self._pending_styles = {
+            ttkstyle: None for ttkstyle in pending if ttkstyle not in visible
+        }
+        self._waiting_widgets = waiting
+        if not self._pending_styles:
+            return
+        # only the waiting widgets have the bindtag of the <Map> binding
+        for widgets in waiting.values():
+            for widget in widgets:
+                widget.bindtags(widget.bindtags() + (_LAZY_MAP_TAG,))
+        if self._mapfuncid is None:
+            self._mapfuncid = self.master.bind_class(
+                _LAZY_MAP_TAG, "<Map>", self._on_widget_map
+            )
+        self._lazyjob = self.master.after_idle(self._lazy_build_step)
+
+    def _lazy_build_step(self):
+        """Build pending styles for `LAZYSLICE` seconds and schedule
+        the next step"""
+        self._lazyjob = None
+        built = []
+        start = perf_counter()
+        with self.batch():
+            while (
+                self._pending_styles
+                and perf_counter() - start < Style.LAZYSLICE
+            ):
+                ttkstyle = next(iter(self._pending_styles))
+                del self._pending_styles[ttkstyle]
+                self._build_ttkstyle(ttkstyle)
+                built.append(ttkstyle)
+        for ttkstyle in built:
+            self._update_waiting_widgets(ttkstyle)
+        if self._pending_styles:
+            self._lazyjob = self.master.after_idle(self._lazy_build_step)
+        else:
+            self._unbind_widget_map()
+
+    def _on_widget_map(self, event):
+        """Build the style of a widget that is mapped before its style
+        was built in idle time"""
+        if not self._pending_styles:
+            return
+        widget = event.widget
+        if not isinstance(widget, ttk.Widget):
+            return
+        try:
+            ttkstyle = str(widget.cget("style"))
+        except TclError:
+            return
+        if ttkstyle in self._pending_styles:
+            del self._pending_styles[ttkstyle]
+            with self.batch():
+                self._build_ttkstyle(ttkstyle)
+            self._update_waiting_widgets(ttkstyle)
+
+    def _update_waiting_widgets(self, ttkstyle):
+        """Set the style again on the widgets that use it, so that
+        their layout is updated"""
+        for widget in self._waiting_widgets.pop(ttkstyle, ()):
+            try:
+                widget.tk.call(widget._w, "configure", "-style", ttkstyle)
+                self._untag_widget(widget)
+            except TclError:
+                pass  # the widget was destroyed
+
+    @staticmethod
+    def _untag_widget(widget):
+        """Remove the bindtag of the <Map> binding from a widget"""
+        tags = widget.bindtags()
+        if _LAZY_MAP_TAG in tags:
+            widget.bindtags([tag for tag in tags if tag != _LAZY_MAP_TAG])
+
+    def _cancel_lazy_build(self):
+        """Stop building the styles of the previous theme"""
+        if self._lazyjob is not None:
+            self.master.after_cancel(self._lazyjob)
+            self._lazyjob = None
+        for widgets in self._waiting_widgets.values():
+            for widget in widgets:
+                try:
+                    self._untag_widget(widget)
+                except TclError:
+                    pass  # the widget was destroyed
+        self._pending_styles = {}
+        self._waiting_widgets = {}
+        self._unbind_widget_map()
+
+    def _unbind_widget_map(self):
+        """Remove the <Map> binding of the lazy build. The binding is
+        on a bindtag of its own, so no other binding is changed."""
+        funcid = self._mapfuncid
+        if funcid is None:
+            return
+        self._mapfuncid = None
+        self.master.unbind_class(_LAZY_MAP_TAG, "<Map>")
+        self.master.deletecommand(funcid)
+
+    def _preload_step(self):
+        """Build the styles of the themes being preloaded until the
+        time budget is spent, and schedule the next step"""
+        self._preloadjob = None
+        deadline = perf_counter() + self._preload_budget
+        while self._preload_queue and perf_counter() < deadline:
+            themename = self._preload_queue[0]
+            if self._preload_styles is None:
+                if themename not in self._theme_objects:
+                    self._create_preloaded_theme(themename)
+                self._preload_styles = sorted(self._style_registry)
+                continue
+            if not self._preload_styles:
+                # the theme is complete
+                self._preload_queue.pop(0)
+                self._preload_styles = None
+                continue
+            with self._theme_settings(themename):
+                while self._preload_styles and perf_counter() < deadline:
+                    self._build_ttkstyle(self._preload_styles.pop())
+        if self._preload_queue:
+            self._preloadjob = self.master.after_idle(self._preload_step)
+
+    def _create_preloaded_theme(self, themename):
+        """Create a theme and its default style without using it"""
+        if self._load_theme_package(themename):
+            return
+        self.theme_create(themename, TTK_CLAM)
+        with self._theme_settings(themename):
+            builder = StyleBuilderTTK(build=False)
+            self._theme_objects[themename] = builder
+            builder.update_ttk_theme_settings()
+
+    @contextmanager
+    def _theme_settings(self, themename):
+        """A context in which styles are built for a theme that need
+        not be the current theme. The style commands are evaluated in
+        the settings of the theme, and the theme definition is the
+        definition of the theme."""
+        current = self.theme
+        tkapp = self.tk
+        batch = _TclBatch(tkapp, themename)
+        self.theme = self._theme_definitions[themename]
+        self.tk = batch
+        try:
+            yield
+        finally:
+            self.tk = tkapp
+            self.theme = current
+            batch.flush()
 
     def load_user_themes(self, file):
         """Load user themes saved in json format"""
@@ -1054,6 +1775,233 @@ class StyleBuilderTK:
         )
 
 
+class _TclRecorder:
+    """Forwards calls to a Tcl interpreter and records the commands
+    that create or configure styles"""
+
+    def __init__(self, tkapp):
+        self._tkapp = tkapp
+        self.commands = []
+
+    def call(self, *args):
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+        if len(args) > 3 and args[0] == "ttk::style":
+            command = args[1]
+            if (
+                (command in ("configure", "map") and len(args) > 4)
+                or (command == "layout" and len(args) == 4)
+                or (command == "element" and args[2] == "create")
+            ):
+                self.commands.append(args)
+        return self._tkapp.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._tkapp, name)
+
+
+# evaluates each command of a batch, in the settings of a theme if one
+# is named, so that a command that fails does not stop the others, and
+# raises the first error when all have run
+_BATCH_LAMBDA = """{themename commands} {
+    set message {}
+    foreach command $commands {
+        if {$themename ne {}} {
+            set command [list ttk::style theme settings $themename $command]
+        }
+        if {[catch $command result] && $message eq {}} {
+            set message $result
+        }
+    }
+    if {$message ne {}} {
+        return -code error $message
+    }
+}"""
+
+
+class _TclBatch:
+    """Forwards calls to a Tcl interpreter, queuing the commands that
+    configure, map and layout styles. The queue is evaluated with a
+    single call when it is flushed, or before any other command except
+    the `tk` and `image` commands, which cannot depend on the styles.
+    Each queued command is evaluated even if an earlier one fails, and
+    the first error is raised after the last command. Elements are
+    created immediately so that an error creating an element is raised
+    where it can be handled.
+
+    If a theme name is given, the style commands are evaluated in the
+    settings of that theme rather than the current theme."""
+
+    def __init__(self, tkapp, themename=None):
+        self._tkapp = tkapp
+        self._themename = themename
+        self._queue = []
+
+    def call(self, *args):
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+        if args and args[0] == "ttk::style":
+            command = args[1] if len(args) > 1 else ""
+            if (command in ("configure", "map") and len(args) > 4) or (
+                command == "layout" and len(args) == 4
+            ):
+                # passed to Tcl as a list, which is quoted by Tcl
+                self._queue.append(args)
+                return ""
+            if self._themename is not None:
+                self.flush()
+                return self._tkapp.call(
+                    "ttk::style",
+                    "theme",
+                    "settings",
+                    self._themename,
+                    _tcl_list(args),
+                )
+        if args and args[0] not in ("tk", "image"):
+            self.flush()
+        return self._tkapp.call(*args)
+
+    def eval(self, script):
+        self.flush()
+        return self._tkapp.eval(script)
+
+    def flush(self):
+        """Evaluate the queued commands"""
+        if self._queue:
+            commands = tuple(self._queue)
+            self._queue.clear()
+            self._tkapp.call(
+                "apply", _BATCH_LAMBDA, self._themename or "", commands
+            )
+
+    def __getattr__(self, name):
+        return getattr(self._tkapp, name)
+
+
+_TCL_SPECIAL = re.compile(r'[\s"$;\[\]\\{}]')
+
+
+def _tcl_word(value):
+    """Return the value quoted as a single word of a Tcl list. A list
+    or tuple is quoted as a nested list."""
+    if isinstance(value, (list, tuple)):
+        # the braces of the quoted words are balanced or escaped
+        return f"{{{_tcl_list(value)}}}"
+    value = str(value)
+    if not value:
+        return "{}"
+    if "\\" in value or "{" in value or "}" in value:
+        # braces cannot quote a backslash or unbalanced braces
+        value = _TCL_SPECIAL.sub(lambda m: "\\" + m.group(0), value)
+        return value.replace("\n", "n")
+    if _TCL_SPECIAL.search(value) or value[0] == '"':
+        return f"{{{value}}}"
+    return value
+
+
+def _tcl_list(values):
+    """Return the values quoted as the words of a Tcl list"""
+    return " ".join(_tcl_word(value) for value in values)
+
+
+def _rename_images(command, theme_images, images, themename):
+    """Return the command with the names of the theme images replaced
+    by names that are unique to the theme; new names are added to
+    images. The names may be words of a list in a single argument, so
+    each word of the command is checked. The characters of the theme
+    name that are not allowed in a bare Tcl word are replaced."""
+    prefix = re.sub(r"\W", "_", themename)
+
+    def rename(match):
+        word = match.group(0)
+        if word not in theme_images:
+            return word
+        if word not in images:
+            images[word] = f"ttkbootstrap_{prefix}_{len(images)}"
+        return images[word]
+
+    return re.sub(r"[^\s{}]+", rename, command)
+
+
+def _cached_assets(method):
+    """Load the images of a `create_*_assets` method from the asset
+    cache when they have been drawn before, and save them to the cache
+    when they are drawn. The images are returned with the structure of
+    names that the method returns."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache: AssetCache = Style.asset_cache
+        if not cache.enabled:
+            return method(self, *args, **kwargs)
+        colors = self.colors
+        key = cache.key(
+            method.__name__,
+            args,
+            sorted(kwargs.items()),
+            self.theme.type,
+            [colors.get(label) for label in Colors.label_iter()],
+            self.style.tk.call("tk", "windowingsystem"),
+            self._scale_factor(),
+        )
+        cached = cache.load(key)
+        if cached is not None:
+            shape, images = cached
+            try:
+                names = []
+                for data in images:
+                    image = tk.PhotoImage(
+                        master=self.style.master, data=data, format="png"
+                    )
+                    self.theme_images[image.name] = image
+                    names.append(image.name)
+                return _unflatten_names(shape, names)
+            except (TclError, IndexError, TypeError):
+                cache.discard(key)
+
+        result = method(self, *args, **kwargs)
+        names = []
+        shape = _flatten_names(result, names)
+        try:
+            images = [_png_data(self.style.master.tk, name) for name in names]
+        except TclError:
+            return result  # the png format is not supported
+        cache.save(key, shape, images)
+        return result
+
+    return wrapper
+
+
+def _png_data(tkapp, name):
+    """Return the base64 PNG data of the image name. Tk returns the
+    data of the png format as bytes or as base64 text depending on the
+    version."""
+    data = tkapp.call(name, "data", "-format", "png")
+    if isinstance(data, str):
+        try:
+            base64.b64decode(data, validate=True)
+            return data
+        except ValueError:
+            data = data.encode("latin-1")
+    return base64.b64encode(data).decode("ascii")
+
+
+def _flatten_names(result, names):
+    """Append the image names of the result to names and return the
+    structure of the result with each name replaced by its index"""
+    if isinstance(result, (tuple, list)):
+        return [_flatten_names(item, names) for item in result]
+    names.append(str(result))
+    return len(names) - 1
+
+
+def _unflatten_names(shape, names):
+    """Return the names in the structure of the result"""
+    if isinstance(shape, list):
+        return tuple(_unflatten_names(item, names) for item in shape)
+    return names[shape]
+
+
 class StyleBuilderTTK:
     """A class containing methods for building new ttk widget styles on
     demand.
@@ -1063,11 +2011,19 @@ class StyleBuilderTTK:
     user.
     """
 
-    def __init__(self):
+    def __init__(self, build=True):
+        """
+        Parameters:
+
+            build (bool):
+                If `False`, the ttk theme is not created; the theme was
+                loaded from a theme package.
+        """
         self.style: Style = Style.get_instance()
         self.theme_images = {}
         self.builder_tk = StyleBuilderTK()
-        self.create_theme()
+        if build:
+            self.create_theme()
 
     @staticmethod
     def name_to_method(method_name):
@@ -1113,18 +2069,22 @@ class StyleBuilderTTK:
             size (Union[int, List, Tuple]):
                 A single integer or an iterable of integers
         """
+        factor = self._scale_factor()
+
+        if isinstance(size, int) or isinstance(size, float):
+            return ceil(size * factor)
+        elif isinstance(size, tuple) or isinstance(size, list):
+            return [ceil(x * factor) for x in size]
+
+    def _scale_factor(self):
+        """Return the factor by which `scale_size` scales sizes"""
         winsys = self.style.master.tk.call("tk", "windowingsystem")
         if winsys == "aqua":
             BASELINE = 1.000492368291482
         else:
             BASELINE = 1.33398982438864281
         scaling = self.style.master.tk.call("tk", "scaling")
-        factor = scaling / BASELINE
-
-        if isinstance(size, int) or isinstance(size, float):
-            return ceil(size * factor)
-        elif isinstance(size, tuple) or isinstance(size, list):
-            return [ceil(x * factor) for x in size]
+        return scaling / BASELINE
 
     def create_theme(self):
         """Create and style a new ttk theme. A wrapper around internal
@@ -1328,6 +2288,7 @@ class StyleBuilderTTK:
         self.style._register_ttkstyle(h_ttkstyle)
         self.style._register_ttkstyle(v_ttkstyle)
 
+    @_cached_assets
     def create_striped_progressbar_assets(self, thickness, colorname=DEFAULT):
         """Create the striped progressbar image and return as a
         `PhotoImage`
@@ -1587,6 +2548,7 @@ class StyleBuilderTTK:
         self.style._register_ttkstyle(h_ttkstyle)
         self.style._register_ttkstyle(v_ttkstyle)
 
+    @_cached_assets
     def create_scale_assets(self, colorname=DEFAULT, size=14):
         """Create the assets used for the ttk.Scale widget.
 
@@ -1873,6 +2835,7 @@ class StyleBuilderTTK:
         self.style._register_ttkstyle(h_ttkstyle)
         self.style._register_ttkstyle(v_ttkstyle)
 
+    @_cached_assets
     def create_arrow_assets(self, arrowcolor, pressed, active):
         """Create arrow assets used for various widget buttons.
 
@@ -1932,6 +2895,7 @@ class StyleBuilderTTK:
 
         return normal_names, pressed_names, active_names
 
+    @_cached_assets
     def create_round_scrollbar_assets(self, thumbcolor, pressed, active):
         """Create image assets to be used when building the round
         scrollbar style.
@@ -2129,6 +3093,7 @@ class StyleBuilderTTK:
         self.style._register_ttkstyle(h_ttkstyle)
         self.style._register_ttkstyle(v_ttkstyle)
 
+    @_cached_assets
     def create_scrollbar_assets(self, thumbcolor, pressed, active):
         """Create the image assets used to build the standard scrollbar
         style.
@@ -2489,7 +3454,6 @@ class StyleBuilderTTK:
             header_style = f"{colorname}.{STYLE}.Heading"
             hover = Colors.update_hsv(background, vd=0.1)
 
-
         # treeview header
         self.style._build_configure(
             header_style,
@@ -2911,6 +3875,7 @@ class StyleBuilderTTK:
         # register ttkstyle
         self.style._register_ttkstyle(ttkstyle)
 
+    @_cached_assets
     def create_square_toggle_assets(self, colorname=DEFAULT):
         """Create the image assets used to build a square toggle
         style.
@@ -3006,6 +3971,7 @@ class StyleBuilderTTK:
         """
         self.create_round_toggle_style(colorname)
 
+    @_cached_assets
     def create_round_toggle_assets(self, colorname=DEFAULT):
         """Create image assets for the round toggle style.
 
@@ -3486,6 +4452,7 @@ class StyleBuilderTTK:
         # register ttkstyle
         self.style._register_ttkstyle(ttkstyle)
 
+    @_cached_assets
     def create_radiobutton_assets(self, colorname=DEFAULT):
         """Create the image assets used to build the radiobutton style.
 
@@ -3627,6 +4594,7 @@ class StyleBuilderTTK:
         # register ttkstyle
         self.style._register_ttkstyle(ttkstyle)
 
+    @_cached_assets
     def create_date_button_assets(self, foreground):
         """Create the image assets used to build the date button
         style. This button style applied to the button in the
@@ -4093,6 +5061,7 @@ class StyleBuilderTTK:
         # register ttkstyle
         self.style._register_ttkstyle(ttkstyle)
 
+    @_cached_assets
     def create_checkbutton_assets(self, colorname=DEFAULT):
         """Create the image assets used to build the standard
         checkbutton style.
@@ -4491,6 +5460,7 @@ class StyleBuilderTTK:
         self.style._register_ttkstyle(h_ttkstyle)
         self.style._register_ttkstyle(v_ttkstyle)
 
+    @_cached_assets
     def create_sizegrip_assets(self, color):
         """Create image assets used to build the sizegrip style.
 
@@ -4962,6 +5932,9 @@ class Bootstyle:
                 )
                 self.configure(style=ttkstyle)
 
+            # the widgets restyled when the theme changes
+            Style.get_instance()._styled_widgets.add(self)
+
         return __init__
 
     @staticmethod
@@ -5047,7 +6020,8 @@ class Bootstyle:
             method_name = Bootstyle.ttkstyle_method_name(widget, ttkstyle)
             builder: StyleBuilderTTK = style._get_builder()
             builder_method = builder.name_to_method(method_name)
-            builder_method(builder, widget_color)
+            with style.batch():
+                builder_method(builder, widget_color)
 
         # subscribe popdown style to theme changes
         try:
@@ -1,33 +1,164 @@
+import csv
+import io
+import os
+import re
+import threading
 import tkinter as tk
 import ttkbootstrap as ttk
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import MutableSequence
+from itertools import compress, count, islice
+from operator import and_, attrgetter, eq
 from ttkbootstrap.constants import *
-from math import ceil
-from datetime import datetime
+from math import ceil, fsum, isfinite
+from datetime import date, datetime
+from decimal import Decimal
+from functools import partial
+from heapq import nlargest, nsmallest
+from numbers import Real
+from queue import Empty, Full, Queue
+from time import perf_counter
 from tkinter import font
 from ttkbootstrap import utility
 from typing import Any, Dict, List, Union
 from ttkbootstrap.localization import MessageCatalog
 
+try:
+    # optional; used to vectorize operations on numeric columns
+    import numpy
+except ImportError:
+    numpy = None
+
 UPARROW = "⬆"
 DOWNARROW = "⬇"
 ASCENDING = 0
 DESCENDING = 1
 
+# the datatype of the values that are ordered together when sorting
+_DATATYPES = {
+    str: "text",
+    int: "numeric",
+    float: "numeric",
+    bool: "numeric",
+    Decimal: "numeric",
+    datetime: "datetime",
+    date: "date",
+    type(None): None,
+}
+_DATATYPE_RANKS = {"numeric": 0, "text": 1, "datetime": 2, "date": 3}
+
+
+def _type_datatype(valuetype):
+    """Return the datatype name of a value type"""
+    try:
+        return _DATATYPES[valuetype]
+    except KeyError:
+        pass
+    if issubclass(valuetype, datetime):
+        return "datetime"
+    if issubclass(valuetype, date):
+        return "date"
+    if issubclass(valuetype, str):
+        return "text"
+    if issubclass(valuetype, (Real, Decimal)):
+        return "numeric"
+    return valuetype.__name__
+
+
+def _infer_datatype(values):
+    """Infer the datatype of a column from its values. Blank values,
+    `None` and the empty string, are ignored. Returns 'mixed' when the
+    values are of more than one datatype and `None` when all values
+    are blank."""
+    kinds = {_type_datatype(t) for t in set(map(type, values))}
+    kinds.discard(None)
+    if "text" in kinds and len(kinds) > 1:
+        if not any(v for v in values if isinstance(v, str)):
+            kinds.discard("text")
+    if not kinds:
+        return None
+    if len(kinds) == 1:
+        return kinds.pop()
+    return "mixed"
+
+
+def _mixed_sort_key(value):
+    """Order a value by its datatype first and then by its value"""
+    kind = _type_datatype(type(value))
+    return _DATATYPE_RANKS.get(kind, len(_DATATYPE_RANKS)), kind, value
+
+
+def _sort_order(records, values, datatype):
+    """Return the records in ascending order of their values, with the
+    blank values first. The values are never converted; the values of
+    a mixed column are ordered by datatype and then by value."""
+    if datatype is None:
+        return list(records)
+    present, keys, blank = records, values, []
+    if None in values or (datatype != "text" and "" in values):
+        present, keys = [], []
+        for record, value in zip(records, values):
+            if value is None or value == "":
+                blank.append(record)
+            else:
+                present.append(record)
+                keys.append(value)
+    if datatype == "mixed":
+        keys = [_mixed_sort_key(value) for value in keys]
+
+    if numpy is not None and datatype == "numeric":
+        keyarray = numpy.asarray(keys)
+        if keyarray.dtype.kind in "iuf":
+            indices = numpy.argsort(keyarray, kind="stable").tolist()
+            return blank + [present[i] for i in indices]
+    try:
+        # the positions of the records are sorted by their keys
+        indices = sorted(range(len(keys)), key=keys.__getitem__)
+    except TypeError:
+        # values of a type without an ordering keep their order
+        if datatype != "mixed":
+            return blank + list(present)
+        keys = [key[:2] for key in keys]
+        indices = sorted(range(len(keys)), key=keys.__getitem__)
+    return blank + [present[i] for i in indices]
+
+
+def _sort_ranks(order, values, datatype):
+    """Map each record of a sort order to the rank of its value; equal
+    values share a rank."""
+    ranks = {}
+    rank = 0
+    previous = ranks  # a sentinel that is not equal to any key
+    for record, value in zip(order, values):
+        if value is None or value == "":
+            key = None
+        elif datatype == "mixed":
+            key = _mixed_sort_key(value)
+        else:
+            key = value
+        if key != previous:
+            rank += 1
+            previous = key
+        ranks[record] = rank
+    return ranks
+
 
 class TableColumn:
     """Represents a column in a Tableview object"""
 
     def __init__(
-            self,
-            tableview,
-            cid,
-            text,
-            image="",
-            command="",
-            anchor=W,
-            width=200,
-            minwidth=20,
-            stretch=False,
+        self,
+        tableview,
+        cid,
+        text,
+        image="",
+        command="",
+        anchor=W,
+        width=200,
+        minwidth=20,
+        stretch=False,
+        formatter=None,
     ):
         """
         Parameters:
@@ -61,11 +192,21 @@ class TableColumn:
                 Specifies whether or not the column width should be
                 adjusted whenever the widget is resized or the user
                 drags the column separator.
+
+            formatter (Callable[[Any], str]):
+                A function that returns the text shown for a value of
+                the column. See `Tableview.insert_column`.
         """
         self._table = tableview
         self._cid = cid
+        self._formatter = formatter
         self._headertext = text
         self._sort = ASCENDING
+        self._datatype = None  # data version and inferred datatype
+        self._sortcache = None  # data version, sort order, and ranks
+        self._filtercache = None  # data version, records, and values
+        # data version, sample, records, measure and width
+        self._autofitcache = None
         self._settings_column = {}
         self._settings_heading = {}
 
@@ -92,6 +233,12 @@ class TableColumn:
         """The text on the header label"""
         return self._headertext
 
+    @property
+    def formatter(self):
+        """The function that formats the values of the column for
+        display, or `None`"""
+        return self._formatter
+
     @property
     def columnsort(self):
         """Indicates how the column is to be sorted when the sorting
@@ -102,6 +249,14 @@ class TableColumn:
     def columnsort(self, value):
         self._sort = value
 
+    @property
+    def datatype(self):
+        """The datatype of the values in the column; one of 'numeric',
+        'text', 'datetime', 'date', or 'mixed', or `None` when the
+        column has no values. The datatype is inferred from the data
+        once and again only after the data has changed."""
+        return self._table._column_datatype(self)
+
     @property
     def cid(self):
         """A unique column identifier"""
@@ -148,9 +303,15 @@ class TableColumn:
                 return self.view.column(self.cid, opt)
             elif opt in ("command", "text", "image"):
                 return self.view.heading(self.cid, opt)
+            elif opt == "formatter":
+                return self._formatter
             else:
                 return
 
+        if "formatter" in kwargs:
+            self._formatter = kwargs["formatter"]
+            self._table._reset_formatters()
+
         # configure column and heading
         for k, v in kwargs.items():
             if k in ("anchor", "width", "minwidth", "stretch"):
@@ -190,9 +351,24 @@ class TableColumn:
         if index is None:
             return
 
-        for row in self._table.tablerows:
-            row.values.pop(index)
-            row.refresh()
+        if self._table._groupby is self:
+            self._table.group_by()
+        self._table._untrack_aggregates(self)
+        self._table._dataversion += 1
+        self._table._keyindex = None
+        self._table._reset_formatters()
+        if self._table._keycolumn is self:
+            self._table._keycolumn = None
+        if self._table._searchindex is not None:
+            self._table._searchindex.clear()
+        if self._table._columnar:
+            self._table._store.delete_column(index)
+            for row in self._table.iidmap.values():
+                row.refresh()
+        else:
+            for row in self._table.tablerows:
+                row.values.pop(index)
+                row.refresh()
 
         # actual columns
         cols = list(self.view.cget("columns"))
@@ -292,19 +468,31 @@ class TableRow:
         if self._iid is None:
             self.build()
 
+        if self._table._virtual:
+            # virtual rows are displayed through a shared pool item
+            item = self._table._virtual_slot(self)
+        else:
+            item = self.iid
+
         if opt is not None:
-            return self.view.item(self.iid, opt)
+            if item is None:
+                return
+            return self.view.item(item, opt)
         elif 'values' in kwargs:
             values = kwargs.pop('values')
             self.values = values
-        else:
-            self.view.item(self.iid, **kwargs)
+        elif item is not None:
+            self.view.item(item, **kwargs)
 
     def show(self, striped=False):
         """Show the row in the data table view"""
         if self._iid is None:
             self.build()
+        if self._table._virtual:
+            return
         self.view.reattach(self.iid, "", END)
+        if self in self._table._dirtyrows:
+            self.refresh()
 
         # remove existing stripes
         tags = list(self.view.item(self.iid, "tags"))
@@ -316,32 +504,50 @@ class TableRow:
         # add stripes (if needed)
         if striped:
             tags.append("striped")
+            self._table._striped.add(self.iid)
+        else:
+            self._table._striped.discard(self.iid)
         self.view.item(self.iid, tags=tags)
 
     def delete(self):
         """Delete the row from the dataset"""
-        if self.iid:
-            self._table.iidmap.pop(self.iid)
-            self._table.tablerows_visible.remove(self)
-            self._table._tablerows.remove(self)
-            self._table.load_table_data()
-            self.view.delete(self.iid)
+        self._table._delete_table_rows([self])
 
     def hide(self):
         """Remove the row from the data table view"""
+        if self._table._virtual:
+            return
         self.view.detach(self.iid)
 
     def refresh(self):
         """Syncs the tableview values with the object values"""
-        if self._iid:
-            self.view.item(self.iid, values=self.values)
+        self._table._reindex_row(self)
+        self._table._dirtyrows.discard(self)
+        if self._iid is None:
+            return
+        values = self._table._display_values(self)
+        if self._table._virtual:
+            item = self._table._virtual_slot(self)
+            if item is not None:
+                self.view.item(item, values=values)
+        else:
+            self.view.item(self.iid, values=values)
 
     def build(self):
         """Create the row object in the `Treeview` and capture
         the resulting item id (iid).
+
+        When the table is in virtual mode, no `Treeview` item is
+        created; the row receives a logical iid and is displayed
+        through one of the pooled items as it scrolls into view.
         """
         if self._iid is None:
-            self._iid = self.view.insert("", END, values=self.values)
+            if self._table._virtual:
+                self._iid = self._table._virtual_iid()
+            else:
+                self._iid = self.view.insert(
+                    "", END, values=self._table._display_values(self)
+                )
             self._table.iidmap[self.iid] = self
 
 
@@ -353,6 +559,2005 @@ class TableEvent:
         self.row = row
 
 
+class _TextMeasure:
+    """Measures the width of text in a font as the sum of the widths
+    of its characters. Each character is measured once with a Tcl call
+    and the width of each string is memoized, so measuring repeated
+    or similar values does not call Tcl. Kerning is not accounted for,
+    so the width is an estimate suited to sizing columns."""
+
+    _memosize = 100_000
+
+    def __init__(self, tkfont):
+        self._font = tkfont
+        self._chars = {}  # character to width
+        self._memo = {}  # string to width
+
+    @classmethod
+    def for_font(cls, tkfont, measures, scaling):
+        """Return the measure of a font, shared by fonts with the same
+        attributes at the same scaling.
+
+        Parameters:
+
+            tkfont (Font):
+                The font that is measured.
+
+            measures (Dict):
+                The measures of the fonts of a single interpreter,
+                which is where the fonts exist.
+
+            scaling (float):
+                The pixels per point of the interpreter.
+        """
+        key = (scaling, tuple(sorted(tkfont.actual().items())))
+        measure = measures.get(key)
+        if measure is None:
+            measure = measures[key] = cls(tkfont)
+        return measure
+
+    def measure(self, text):
+        """Return the width of the text in pixels"""
+        width = self._memo.get(text)
+        if width is None:
+            chars = self._chars
+            for char in set(text).difference(chars):
+                chars[char] = self._font.measure(char)
+            width = sum(map(chars.__getitem__, text))
+            if len(self._memo) >= self._memosize:
+                self._memo.clear()
+            self._memo[text] = width
+        return width
+
+
+class RowFilter:
+    """A predicate on the values of a table column that selects the
+    records shown in a Tableview. Row filters are stacked with
+    `Tableview.add_row_filter` or `Tableview.set_row_filters`; a record
+    is shown when it passes every filter.
+
+    The predicate is evaluated for all values of the column at once
+    and results in a mask. Numeric columns are compared as numpy
+    arrays when numpy is installed. Values are never converted; a
+    value that cannot be compared with the criteria does not match.
+
+    The predicates are:
+
+    * equals - the value equals `value`.
+    * in - the value is a member of the iterable `value`.
+    * range - the value is between the `(low, high)` tuple `value`,
+      inclusive. Either bound may be `None`. Use numbers or dates.
+    * regex - the text of the value matches the regular expression
+      `value` anywhere.
+    * null - the value is blank; `None`, an empty string or NaN.
+    """
+
+    PREDICATES = ("equals", "in", "range", "regex", "null")
+
+    def __init__(self, column, predicate, value=None, invert=False):
+        """
+        Parameters:
+
+            column (TableColumn):
+                The column that is filtered.
+
+            predicate (str):
+                One of 'equals', 'in', 'range', 'regex', or 'null'.
+
+            value (Any):
+                The criteria of the predicate.
+
+            invert (bool):
+                If `True`, the filter selects the records that do
+                not match the predicate.
+        """
+        if predicate not in self.PREDICATES:
+            raise ValueError(
+                f"{predicate!r} is not a valid predicate; "
+                f"use one of {', '.join(self.PREDICATES)}"
+            )
+        if predicate == "in":
+            value = frozenset(value)
+        elif predicate == "range":
+            low, high = value
+            value = (low, high)
+        elif predicate == "regex":
+            value = re.compile(value)
+        self.column = column
+        self.predicate = predicate
+        self.value = value
+        self.invert = invert
+
+    def __repr__(self):
+        return (
+            f"RowFilter({self.column.headertext!r}, {self.predicate!r}, "
+            f"{self.value!r}, invert={self.invert})"
+        )
+
+    def test(self, value):
+        """Return `True` if the value matches the predicate, ignoring
+        `invert`."""
+        predicate = self.predicate
+        try:
+            if predicate == "equals":
+                return bool(value == self.value)
+            if predicate == "in":
+                return value in self.value
+            if predicate == "range":
+                low, high = self.value
+                return (low is None or low <= value) and (
+                    high is None or value <= high
+                )
+            if predicate == "regex":
+                if value is None:
+                    return False
+                text = value if isinstance(value, str) else str(value)
+                return self.value.search(text) is not None
+        except TypeError:
+            # the value cannot be compared with the criteria
+            return False
+        # null
+        return value is None or value == "" or value != value
+
+    def mask(self, values):
+        """Return the mask of the values that pass the filter; a numpy
+        boolean array when numpy is installed, otherwise a list of
+        bools. The values are a list, a numeric numpy array, or the
+        encoded values of a column."""
+        if isinstance(values, _EncodedValues):
+            # the predicate is tested once for each distinct value
+            mask = self._mask(values.categories)[values.codes]
+        elif numpy is not None and isinstance(values, numpy.ndarray):
+            mask = self._vector_mask(values)
+            if mask is None:
+                mask = self._mask(values.tolist())
+        else:
+            mask = self._mask(values)
+        if self.invert:
+            if numpy is not None:
+                return ~mask
+            return [not m for m in mask]
+        return mask
+
+    def _mask(self, values):
+        """Test each value; builtin functions are used where they are
+        safe for faster evaluation."""
+        test = self.test
+        if self.predicate == "equals":
+            test = partial(eq, self.value)
+        elif self.predicate == "in":
+            test = self.value.__contains__
+        elif self.predicate == "regex":
+            # the values of a text column are matched directly
+            if all(type(v) is str for v in values):
+                test = self.value.search
+        if numpy is not None:
+            try:
+                return numpy.fromiter(map(test, values), bool, len(values))
+            except TypeError:
+                return numpy.fromiter(
+                    map(self.test, values), bool, len(values)
+                )
+        try:
+            return [bool(m) for m in map(test, values)]
+        except TypeError:
+            return list(map(self.test, values))
+
+    def _vector_mask(self, values):
+        """Evaluate the predicate on a numeric array. Returns `None`
+        when the predicate is not vectorized."""
+        predicate = self.predicate
+        if predicate == "equals":
+            if isinstance(self.value, Real):
+                return values == self.value
+            return numpy.zeros(len(values), bool)
+        if predicate == "in":
+            members = [v for v in self.value if isinstance(v, Real)]
+            return numpy.isin(values, members)
+        if predicate == "range":
+            low, high = self.value
+            mask = numpy.ones(len(values), bool)
+            bounds = ((low, numpy.greater_equal), (high, numpy.less_equal))
+            for bound, compare in bounds:
+                if bound is None:
+                    continue
+                if not isinstance(bound, Real):
+                    return numpy.zeros(len(values), bool)
+                mask &= compare(values, bound)
+            return mask
+        if predicate == "null":
+            if values.dtype.kind == "f":
+                return numpy.isnan(values)
+            return numpy.zeros(len(values), bool)
+        return None
+
+
+class _EncodedValues:
+    """The values of a column encoded as a numpy array of codes into
+    the list of distinct values. Requires numpy."""
+
+    def __init__(self, values):
+        categories = {}
+        code = categories.setdefault
+        self.codes = numpy.fromiter(
+            (code(v, len(categories)) for v in values), numpy.intp, len(values)
+        )
+        self.categories = list(categories)
+
+
+class ColumnStore:
+    """Columnar storage for the records of a Tableview.
+
+    Each column is stored in its own container; integer columns in
+    an `array('q')`, float columns in an `array('d')` and all other
+    columns in a list. A column is demoted to a list as soon as it
+    receives a value that does not fit its type. Records are
+    identified by their integer position in the store (the rowid),
+    which does not change when the records are sorted or filtered.
+
+    When NumPy is installed, the numeric columns are exposed to
+    NumPy without copying for vectorized sorting and filtering.
+    """
+
+    TYPECODES = {int: "q", float: "d"}
+
+    def __init__(self, colcount=0):
+        """
+        Parameters:
+
+            colcount (int):
+                The number of columns to create.
+        """
+        self.columns = []
+        self.size = 0
+        self.extend_columns(colcount)
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def colcount(self):
+        """The number of columns in the store"""
+        return len(self.columns)
+
+    def extend_columns(self, colcount, fillvalue=""):
+        """Add columns until there are `colcount` columns. Existing
+        records receive the fillvalue."""
+        while len(self.columns) < colcount:
+            self.columns.append([fillvalue] * self.size)
+
+    def delete_column(self, index):
+        """Remove the column at index"""
+        self.columns.pop(index)
+
+    def _store_value(self, rowid, index, value):
+        """Write value to the column at index, demoting the column to
+        a list when the value does not fit the column type."""
+        col = self.columns[index]
+        if isinstance(col, array):
+            if type(value) is int and col.typecode == "q":
+                try:
+                    col[rowid] = value
+                    return
+                except OverflowError:
+                    pass
+            elif type(value) is float and col.typecode == "d":
+                col[rowid] = value
+                return
+            col = self.columns[index] = list(col)
+        col[rowid] = value
+
+    def append(self, values):
+        """Add a record to the store and return the rowid"""
+        rowid = self.size
+        values = list(values)
+        self.extend_columns(len(values))
+        for index, col in enumerate(self.columns):
+            try:
+                value = values[index]
+            except IndexError:
+                value = ""
+            if rowid == 0 and type(value) in self.TYPECODES:
+                # infer the column type from the first record
+                col = self.columns[index] = array(self.TYPECODES[type(value)])
+            if isinstance(col, array):
+                col.append(0)
+                self._store_value(rowid, index, value)
+            else:
+                col.append(value)
+        self.size += 1
+        return rowid
+
+    def get_row(self, rowid):
+        """Return the values of a record as a list"""
+        return [col[rowid] for col in self.columns]
+
+    def set_row(self, rowid, values):
+        """Replace the values of a record"""
+        values = list(values)
+        self.extend_columns(len(values))
+        for index in range(len(self.columns)):
+            try:
+                value = values[index]
+            except IndexError:
+                value = ""
+            self._store_value(rowid, index, value)
+
+    def get_value(self, rowid, index):
+        """Return the value of a single cell"""
+        return self.columns[index][rowid]
+
+    def set_value(self, rowid, index, value):
+        """Replace the value of a single cell"""
+        self._store_value(rowid, index, value)
+
+    def iter_rows(self, rowids):
+        """Yield the values of each record in rowids"""
+        columns = self.columns
+        for rowid in rowids:
+            yield [col[rowid] for col in columns]
+
+    def numeric(self, index):
+        """Return a zero-copy NumPy view of a numeric column, or None
+        if the column is not numeric or NumPy is not installed. The
+        view must be released before records are added."""
+        col = self.columns[index]
+        if numpy is None or not isinstance(col, array) or len(col) == 0:
+            return None
+        return numpy.frombuffer(col, dtype=col.typecode)
+
+    def sort(self, rowids, index, reverse=False):
+        """Return rowids sorted by the values of the column at index"""
+        values = self.numeric(index)
+        if values is not None and len(rowids) > 0:
+            rowids = numpy.frombuffer(rowids, dtype="q")
+            keys = values[rowids]
+            if reverse:
+                # negate rather than flip to keep equal values in order
+                keys = -keys
+            order = numpy.argsort(keys, kind="stable")
+            return array("q", rowids[order].tobytes())
+        col = self.columns[index]
+        return array("q", sorted(rowids, key=col.__getitem__, reverse=reverse))
+
+    def search(self, rowids, criteria):
+        """Return the rowids of records that contain the criteria in
+        any column; case insensitive."""
+        criteria = str(criteria).lower()
+        remaining = list(rowids)
+        matched = set()
+        for col in self.columns:
+            hits = [i for i in remaining if criteria in str(col[i]).lower()]
+            if not hits:
+                continue
+            matched.update(hits)
+            remaining = [i for i in remaining if i not in matched]
+        return array("q", [i for i in rowids if i in matched])
+
+    def equals(self, rowids, index, value):
+        """Return the rowids where the column at index equals value"""
+        values = self.numeric(index)
+        if (
+            values is not None
+            and len(rowids) > 0
+            and type(value) in self.TYPECODES
+        ):
+            rowids = numpy.frombuffer(rowids, dtype="q")
+            mask = values[rowids] == value
+            return array("q", rowids[mask].tobytes())
+        col = self.columns[index]
+        return array("q", [i for i in rowids if col[i] == value])
+
+    def clear(self):
+        """Remove all records; the column types are inferred again
+        from the next record."""
+        self.columns = [[] for _ in self.columns]
+        self.size = 0
+
+
+class _RowValues(list):
+    """The values of a columnar record. Assigning an item writes the
+    value through to the column store."""
+
+    def __init__(self, row):
+        super().__init__(row._table._store.get_row(row._rowid))
+        self._row = row
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        if isinstance(index, slice):
+            self._row._table._store.set_row(self._row._rowid, self)
+        else:
+            self._row._table._store.set_value(self._row._rowid, index, value)
+
+
+class _ColumnarTableRow(TableRow):
+    """A lightweight view of a record in the column store of a
+    Tableview. Views are created on demand and compare equal when
+    they refer to the same record."""
+
+    def __init__(self, tableview, rowid):
+        self.view = tableview.view
+        self._table = tableview
+        self._rowid = rowid
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, _ColumnarTableRow)
+            and other._rowid == self._rowid
+            and other._table is self._table
+        )
+
+    def __hash__(self):
+        return hash(self._rowid)
+
+    @property
+    def _values(self):
+        return _RowValues(self)
+
+    @property
+    def values(self):
+        """The table row values"""
+        return _RowValues(self)
+
+    @values.setter
+    def values(self, values):
+        self._table._store.set_row(self._rowid, values)
+        self.refresh()
+
+    @property
+    def _iid(self):
+        return self._table._rowiids.get(self._rowid)
+
+    @_iid.setter
+    def _iid(self, value):
+        self._table._rowiids[self._rowid] = value
+
+    @property
+    def _sort(self):
+        return self._rowid
+
+
+class _RowList(MutableSequence):
+    """An ordered list of records in a column store. The rowids are
+    kept in an `array('q')` and row views are created as the items
+    are accessed."""
+
+    def __init__(self, tableview, rowids=()):
+        self._table = tableview
+        self.ids = array("q", rowids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._table._row_view(i) for i in self.ids[index]]
+        return self._table._row_view(self.ids[index])
+
+    def __setitem__(self, index, row):
+        if isinstance(index, slice):
+            self.ids[index] = array("q", [r._rowid for r in row])
+        else:
+            self.ids[index] = row._rowid
+
+    def __delitem__(self, index):
+        del self.ids[index]
+
+    def __iter__(self):
+        view = self._table._row_view
+        for rowid in self.ids:
+            yield view(rowid)
+
+    def __contains__(self, row):
+        return getattr(row, "_rowid", None) in self.ids
+
+    def insert(self, index, row):
+        self.ids.insert(index, row._rowid)
+
+    def append(self, row):
+        self.ids.append(row._rowid)
+
+    def index(self, row, *args):
+        return self.ids.index(row._rowid, *args)
+
+    def clear(self):
+        del self.ids[:]
+
+    def copy(self):
+        return _RowList(self._table, self.ids)
+
+
+_ATTACHED_COLUMNS = {}  # the data version and columns attached by a worker
+
+
+def _attach_column(columns, position):
+    """Return the values of a column shared by `_WorkerPool.share_column`.
+    Numeric columns are read from the shared memory without copying.
+    The columns are kept by the worker process until the data version
+    changes."""
+    from multiprocessing import shared_memory
+    import pickle
+
+    version, specs = columns
+    if _ATTACHED_COLUMNS.get("version") != version:
+        _ATTACHED_COLUMNS.clear()
+        _ATTACHED_COLUMNS["version"] = version
+    name, kind, size, nbytes = specs[position]
+    entry = _ATTACHED_COLUMNS.get(name)
+    if entry is not None:
+        return entry[1]
+    block = shared_memory.SharedMemory(name=name)
+    if kind == "pickle":
+        values = pickle.loads(block.buf[:nbytes])
+        block.close()
+        block = None
+    elif numpy is not None:
+        values = numpy.frombuffer(block.buf, dtype=kind, count=size)
+    else:
+        values = block.buf[:nbytes].cast(kind)
+    _ATTACHED_COLUMNS[name] = (block, values)
+    return values
+
+
+def _attach_rowids(name, start, stop):
+    """Return a copy of the rowids from start to stop of a shared rowid
+    array"""
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        records = array("q")
+        records.frombytes(bytes(block.buf[start * 8 : stop * 8]))
+    finally:
+        block.close()
+    if numpy is not None:
+        return numpy.frombuffer(records, dtype="q")
+    return records
+
+
+def _gather_values(values, rowids):
+    """Return the values of a shared column for the rowids as a list,
+    or as a numpy array when the column is numeric"""
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return values[rowids]
+    return [values[i] for i in rowids]
+
+
+def _write_result(spec, offset, data):
+    """Write the result of a task to a shared result block"""
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(name=spec)
+    try:
+        block.buf[offset : offset + len(data)] = data
+    finally:
+        block.close()
+
+
+def _pool_sort(columns, rowids, result, start, stop, keys):
+    """Sort the shared rowids by the keys; (position, datatype,
+    descending) of each sorted column. The datatype is inferred from
+    the values when it is `None`. The sorted rowids are written to the
+    result block."""
+    records = _attach_rowids(rowids, start, stop)
+    count = len(records)
+    if len(keys) == 1:
+        position, datatype, descending = keys[0]
+        values = _gather_values(_attach_column(columns, position), records)
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            if descending:
+                # negate rather than flip to keep equal values in order
+                values = -values
+            order = numpy.argsort(values, kind="stable").tolist()
+        else:
+            values = list(values)
+            if datatype is None:
+                datatype = _infer_datatype(values)
+            order = _sort_order(range(count), values, datatype)
+            if descending:
+                ranks = _sort_ranks(
+                    order, [values[i] for i in order], datatype
+                )
+                order = sorted(
+                    range(count), key=ranks.__getitem__, reverse=True
+                )
+    else:
+        # stable sort by each column from the last to the first
+        order = list(range(count))
+        for position, datatype, descending in reversed(keys):
+            values = _gather_values(_attach_column(columns, position), records)
+            if numpy is not None and isinstance(values, numpy.ndarray):
+                values = values.tolist()
+            else:
+                values = list(values)
+            if datatype is None:
+                datatype = _infer_datatype(values)
+            ascending = _sort_order(range(count), values, datatype)
+            ranks = _sort_ranks(
+                ascending, [values[i] for i in ascending], datatype
+            )
+            order = sorted(order, key=ranks.__getitem__, reverse=descending)
+    if numpy is not None:
+        data = records[numpy.asarray(order, dtype=numpy.intp)].tobytes()
+    else:
+        data = array("q", [records[i] for i in order]).tobytes()
+    _write_result(result, start * 8, data)
+
+
+def _pool_filter(columns, rowids, result, start, stop, filters):
+    """Write the mask of the shared rowids from start to stop that pass
+    every filter; (position, predicate, value, invert) of each filter."""
+    records = _attach_rowids(rowids, start, stop)
+    mask = None
+    for position, predicate, value, invert in filters:
+        rowfilter = RowFilter(None, predicate, value, invert)
+        values = _gather_values(_attach_column(columns, position), records)
+        if numpy is not None and isinstance(values, list):
+            values = _EncodedValues(values)
+        passed = rowfilter.mask(values)
+        if mask is None:
+            mask = passed
+        elif numpy is not None:
+            mask &= passed
+        else:
+            mask = list(map(and_, mask, passed))
+    if numpy is not None:
+        data = numpy.asarray(mask, dtype=bool).tobytes()
+    else:
+        data = bytes(mask)
+    _write_result(result, start, data)
+
+
+def _pool_search(columns, rowids, result, start, stop, criteria):
+    """Write the mask of the shared rowids from start to stop with a
+    value in any column that contains the lowercase criteria"""
+    records = _attach_rowids(rowids, start, stop)
+    found = bytearray(len(records))
+    for position in columns[1]:
+        values = _gather_values(_attach_column(columns, position), records)
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            values = values.tolist()
+        for i, value in enumerate(values):
+            if not found[i] and criteria in str(value).lower():
+                found[i] = 1
+    _write_result(result, start, bytes(found))
+
+
+class _WorkerPool:
+    """A pool of worker processes that sort, filter and search the
+    records of a `ColumnStore` so that the Tk thread stays responsive.
+
+    The columns are copied into shared memory once per data version;
+    numeric columns as their raw buffer, which the workers read without
+    copying, and other columns pickled, which each worker loads once.
+    Each task reads a slice of a shared array of rowids and writes a
+    sorted permutation or a mask into a shared result block.
+
+    On platforms that start worker processes by spawning, such as
+    Windows and macOS, the main module of the application must be
+    guarded by `if __name__ == '__main__':`.
+    """
+
+    def __init__(self, workers):
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.columns = {}  # maps position to the version, column and block
+
+    def block(self, size):
+        """Create a shared memory block of size bytes"""
+        from multiprocessing import shared_memory
+
+        return shared_memory.SharedMemory(create=True, size=max(1, size))
+
+    def share(self, data):
+        """Copy bytes-like data to a new shared memory block"""
+        data = memoryview(data).cast("B")
+        block = self.block(len(data))
+        block.buf[: len(data)] = data
+        return block
+
+    def share_column(self, store, position, version):
+        """Return the spec of a column of the store in shared memory,
+        copying the column only when the data has changed"""
+        import pickle
+
+        column = store.columns[position]
+        entry = self.columns.get(position)
+        if entry is not None:
+            if entry[0] == version and entry[1] is column:
+                return entry[3]
+            self.release(entry[2])
+        if isinstance(column, array):
+            kind = column.typecode
+            data = memoryview(column)
+        else:
+            kind = "pickle"
+            data = pickle.dumps(column, protocol=pickle.HIGHEST_PROTOCOL)
+        block = self.share(data)
+        spec = (block.name, kind, len(column), memoryview(data).nbytes)
+        self.columns[position] = (version, column, block, spec)
+        return spec
+
+    def submit(self, function, *args):
+        return self.executor.submit(function, *args)
+
+    def chunks(self, count):
+        """Split count records into a slice for each worker"""
+        size = max(1, -(-count // self.workers))
+        return [(i, min(i + size, count)) for i in range(0, count, size)]
+
+    @staticmethod
+    def release(block):
+        block.close()
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+    def shutdown(self):
+        try:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        except TypeError:
+            # cancel_futures was added in Python 3.9
+            self.executor.shutdown(wait=False)
+        for entry in self.columns.values():
+            self.release(entry[2])
+        self.columns.clear()
+
+
+class _PoolJob:
+    """A sort, filter or search that is running in the worker pool.
+    When the tasks are done, finish is called with the result, or
+    fallback is called when the data has changed in the meantime."""
+
+    def __init__(
+        self, futures, blocks, size, positions, version, finish, fallback
+    ):
+        self.futures = futures
+        self.blocks = blocks  # the shared rowids and result
+        self.size = size  # the size of the result in bytes
+        self.positions = positions  # the positions of the shared columns
+        self.version = version
+        self.finish = finish
+        self.fallback = fallback
+
+    @property
+    def done(self):
+        return sum(future.done() for future in self.futures)
+
+    def cancel(self):
+        for future in self.futures:
+            future.cancel()
+        self.release()
+
+    def release(self):
+        for block in self.blocks:
+            _WorkerPool.release(block)
+        self.blocks = []
+
+
+class _SearchIndex:
+    """An incrementally maintained index for the case-insensitive
+    substring search of a Tableview. The lowercase text of each
+    record is cached so that a search is a single containment test
+    per record. Optionally, an inverted index of the character
+    trigrams of each record narrows the records that are tested to
+    those containing every trigram of the search criteria.
+
+    Records are keyed by the `TableRow` object, or by the rowid when
+    the table is columnar.
+    """
+
+    SEPARATOR = "\x1f"
+    GRAMSIZE = 3
+
+    def __init__(self, ngram=False):
+        self.ngram = ngram
+        self.text = {}  # maps key to the lowercase text of the record
+        self.grams = {}  # maps trigram to the keys that contain it
+        self.version = 0
+        self.built = False
+
+    def _grams(self, text):
+        size = self.GRAMSIZE
+        return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+    def add(self, key, values):
+        """Index the values of a record"""
+        text = self.SEPARATOR.join([str(v).lower() for v in values])
+        self.text[key] = text
+        if self.ngram:
+            grams = self.grams
+            for gram in self._grams(text):
+                keys = grams.get(gram)
+                if keys is None:
+                    grams[gram] = {key}
+                else:
+                    keys.add(key)
+        self.version += 1
+
+    def remove(self, key):
+        """Remove a record from the index"""
+        text = self.text.pop(key, None)
+        if text is None:
+            return
+        if self.ngram:
+            grams = self.grams
+            for gram in self._grams(text):
+                keys = grams.get(gram)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del grams[gram]
+        self.version += 1
+
+    def update(self, key, values):
+        """Re-index a record whose values have changed"""
+        self.remove(key)
+        self.add(key, values)
+
+    def clear(self):
+        self.text.clear()
+        self.grams.clear()
+        self.built = False
+        self.version += 1
+
+    def candidates(self, criteria):
+        """Return the set of keys that contain every trigram of the
+        criteria, or None if the trigram index cannot be used."""
+        if not self.ngram or len(criteria) < self.GRAMSIZE:
+            return None
+        postings = []
+        for gram in self._grams(criteria):
+            keys = self.grams.get(gram)
+            if not keys:
+                return set()
+            postings.append(keys)
+        postings.sort(key=len)
+        result = set(postings[0])
+        for keys in postings[1:]:
+            result &= keys
+            if not result:
+                break
+        return result
+
+    def search(self, keys, criteria, chunksize=50000):
+        """A generator that tests the keys, in order, for the lowercase
+        criteria. The generator yields after each chunk of keys so
+        that a search can be spread over several event loop cycles and
+        returns the list of matching keys.
+        """
+        text = self.text
+        candidates = self.candidates(criteria)
+        matches = []
+        for start in range(0, len(keys), chunksize):
+            chunk = keys[start : start + chunksize]
+            if candidates is None:
+                matches.extend(
+                    [k for k in chunk if criteria in text.get(k, "")]
+                )
+            else:
+                matches.extend(
+                    [
+                        k
+                        for k in chunk
+                        if k in candidates and criteria in text.get(k, "")
+                    ]
+                )
+            yield
+        return matches
+
+
+def _add_partial(partials, value):
+    """Add a float to the partial sums of `math.fsum`, which hold the
+    exact sum of the floats added. A float is removed exactly by
+    adding its negative."""
+    i = 0
+    for partial in partials:
+        if abs(value) < abs(partial):
+            value, partial = partial, value
+        high = value + partial
+        low = partial - (high - value)
+        if low:
+            partials[i] = low
+            i += 1
+        value = high
+    partials[i:] = [value]
+
+
+class _RunningAggregate:
+    """The count, sum, minimum, maximum, mean and distinct count of the
+    values of a column, maintained as values are added and removed.
+    Blank values, `None` and the empty string, are not counted, and
+    the sum and mean are of the numeric values only. Values are
+    distinct by type as well as by value, so `1`, `1.0` and `True` are
+    counted separately.
+
+    The sum is kept exactly: integers and decimals in running totals,
+    and floats as the partial sums of `math.fsum`, so it does not
+    drift as values are added and removed. The minimum and maximum
+    are found again from the distinct values only after the current
+    minimum or maximum has been removed."""
+
+    def __init__(self):
+        self.counts = {}  # maps type and value to the value and occurrences
+        self.count = 0
+        self.numbers = 0
+        self.integers = 0  # the sum of the integers and booleans
+        self.decimals = Decimal(0)
+        self.decimalcount = 0
+        self.partials = []  # the partial sums of the finite floats
+        self.floatcount = 0
+        self.special = {}  # maps 'inf', '-inf' and 'nan' to occurrences
+        self.low = None
+        self.high = None
+        self.stale = False
+
+    @staticmethod
+    def _key(value):
+        """Return the key of a value in the counts"""
+        if value != value:
+            return (type(value), "nan")
+        key = (type(value), value)
+        try:
+            hash(key)
+        except TypeError:
+            return (type(value), repr(value))
+        return key
+
+    def add(self, value):
+        if value is None or value == "":
+            return
+        key = self._key(value)
+        entry = self.counts.get(key)
+        if entry is None:
+            self.counts[key] = [value, 1]
+        else:
+            entry[1] += 1
+        self.count += 1
+        if _type_datatype(type(value)) == "numeric":
+            self.numbers += 1
+            self._add_number(value, 1)
+        if self.stale:
+            return
+        try:
+            sortkey = _mixed_sort_key(value)
+            if self.low is None or sortkey < _mixed_sort_key(self.low):
+                self.low = value
+            if self.high is None or sortkey > _mixed_sort_key(self.high):
+                self.high = value
+        except TypeError:
+            self.stale = True
+
+    def remove(self, value):
+        if value is None or value == "":
+            return
+        key = self._key(value)
+        entry = self.counts.get(key)
+        if entry is None:
+            return
+        if entry[1] == 1:
+            del self.counts[key]
+            extremes = [
+                self._key(v) for v in (self.low, self.high) if v is not None
+            ]
+            if key in extremes:
+                self.stale = True
+        else:
+            entry[1] -= 1
+        self.count -= 1
+        if _type_datatype(type(value)) == "numeric":
+            self.numbers -= 1
+            self._add_number(value, -1)
+
+    def _add_number(self, value, sign):
+        """Add a number to the running sum, or subtract it if sign is
+        negative"""
+        if isinstance(value, float):
+            self.floatcount += sign
+            if isfinite(value):
+                _add_partial(self.partials, value if sign > 0 else -value)
+            else:
+                name = "nan" if value != value else str(value)
+                self.special[name] = self.special.get(name, 0) + sign
+        elif isinstance(value, Decimal):
+            self.decimalcount += sign
+            self.decimals += value if sign > 0 else -value
+        else:
+            self.integers += value if sign > 0 else -value
+
+    def _sum(self):
+        """Return the sum of the numbers. The sum is a float if there
+        are floats, otherwise a decimal if there are decimals, or an
+        integer."""
+        if self.floatcount:
+            special = self.special
+            if special.get("nan") or (
+                special.get("inf") and special.get("-inf")
+            ):
+                return float("nan")
+            if special.get("inf"):
+                return float("inf")
+            if special.get("-inf"):
+                return float("-inf")
+            return fsum(
+                self.partials + [float(self.integers), float(self.decimals)]
+            )
+        if self.decimalcount:
+            return self.decimals + self.integers
+        return self.integers
+
+    def result(self):
+        """Return the aggregates as a dictionary"""
+        if self.stale:
+            values = [entry[0] for entry in self.counts.values()]
+            try:
+                self.low = min(values, key=_mixed_sort_key, default=None)
+                self.high = max(values, key=_mixed_sort_key, default=None)
+            except TypeError:
+                self.low = self.high = None
+            self.stale = False
+        numbers = self.numbers
+        total = self._sum() if numbers else None
+        return {
+            "count": self.count,
+            "sum": total,
+            "min": self.low,
+            "max": self.high,
+            "mean": total / numbers if numbers else None,
+            "distinct": len(self.counts),
+        }
+
+
+class _Aggregates:
+    """The running aggregates of columns of a Tableview over a set of
+    records. The values of the aggregated columns of each record are
+    kept, as in the search index, so that the previous values of a
+    changed record can be removed from the aggregates.
+
+    Records are keyed by the `TableRow` object, or by the rowid when
+    the table is columnar. The source is the filtered records that
+    were aggregated, or `None` for all records.
+    """
+
+    def __init__(self, positions, source=None):
+        self.positions = positions
+        self.source = source
+        self.columns = [_RunningAggregate() for _ in positions]
+        self.records = {}  # maps key to the aggregated values
+
+    def add(self, key, values):
+        size = len(values)
+        cells = tuple(values[p] if p < size else None for p in self.positions)
+        self.records[key] = cells
+        for aggregate, value in zip(self.columns, cells):
+            aggregate.add(value)
+
+    def remove(self, key):
+        cells = self.records.pop(key, None)
+        if cells is None:
+            return
+        for aggregate, value in zip(self.columns, cells):
+            aggregate.remove(value)
+
+    def update(self, key, values):
+        """Update the aggregates after the values of a record have
+        changed. Records that are not aggregated are ignored."""
+        if key in self.records:
+            self.remove(key)
+            self.add(key, values)
+
+
+class DataProvider:
+    """The interface of a source of records that a Tableview fetches
+    one page at a time rather than holding every record; see
+    `Tableview.set_provider`.
+
+    A provider must implement `fetch`, and should implement
+    `row_count` when the number of records is known. Sorting,
+    filtering and searching are optional; a provider that supports
+    them applies them to the records it returns from `fetch` and
+    `row_count`. The default methods return `False` to indicate that
+    the operation is not supported, in which case the table is left
+    unchanged.
+    """
+
+    columns = None
+    """The names of the columns, or `None`. When a provider with
+    column names is set on a table without columns, the columns are
+    created from the names."""
+
+    def row_count(self):
+        """Return the number of records after any filters and search
+        criteria are applied, or `None` if the number is not known."""
+        return None
+
+    def fetch(self, offset, limit):
+        """Return a list of the values of up to limit records,
+        starting with the record at offset. A short or empty list
+        indicates the end of the records.
+
+        Parameters:
+
+            offset (int):
+                The index of the first record.
+
+            limit (int):
+                The maximum number of records.
+        """
+        raise NotImplementedError
+
+    def sort(self, sortorder):
+        """Order the records.
+
+        Parameters:
+
+            sortorder (List[Tuple[int, bool]]):
+                The column index and whether the order is descending,
+                for each sort key; the first is the primary key. An
+                empty list restores the original order.
+
+        Returns:
+
+            bool:
+                `True` if the records are sorted.
+        """
+        return False
+
+    def filter(self, filters):
+        """Show only the records that pass every filter.
+
+        Parameters:
+
+            filters (List[RowFilter]):
+                The row filters; an empty list removes all filters.
+                The column index of a filter is
+                `rowfilter.column.tableindex`.
+
+        Returns:
+
+            bool:
+                `True` if the records are filtered.
+        """
+        return False
+
+    def search(self, criteria):
+        """Show only the records that contain the criteria in any
+        column; case insensitive.
+
+        Parameters:
+
+            criteria (str):
+                The search text; an empty string removes the search.
+
+        Returns:
+
+            bool:
+                `True` if the records are searched.
+        """
+        return False
+
+    def iter_rows(self, pagesize=1000):
+        """Yield the values of every record, in order, fetching them
+        a page at a time.
+
+        Parameters:
+
+            pagesize (int):
+                The number of records fetched at a time.
+        """
+        offset = 0
+        while True:
+            rows = self.fetch(offset, pagesize)
+            yield from rows
+            if len(rows) < pagesize:
+                return
+            offset += pagesize
+
+
+class ListDataProvider(DataProvider):
+    """A data provider over a list of records held in memory. This is
+    the reference implementation of the `DataProvider` interface and
+    supports sorting, filtering and searching.
+    """
+
+    def __init__(self, rowdata):
+        """
+        Parameters:
+
+            rowdata (Iterable[Iterable]):
+                The values of each record.
+        """
+        self._rows = [list(values) for values in rowdata]
+        self._sortorder = []
+        self._filters = []
+        self._criteria = ""
+        self._view = None  # record indices in view; None for all records
+
+    def _values(self, index, indices):
+        rows = self._rows
+        return [
+            rows[i][index] if len(rows[i]) > index else None for i in indices
+        ]
+
+    def _update_view(self):
+        """Apply the search, filters and sort to the record indices"""
+        if not (self._criteria or self._filters or self._sortorder):
+            self._view = None
+            return
+        rows = self._rows
+        indices = list(range(len(rows)))
+        if self._criteria:
+            criteria = self._criteria.lower()
+            indices = [
+                i
+                for i in indices
+                if any(criteria in str(v).lower() for v in rows[i])
+            ]
+        for rowfilter in self._filters:
+            values = self._values(rowfilter.column.tableindex, indices)
+            mask = rowfilter.mask(values)
+            if numpy is not None:
+                mask = mask.tolist()
+            indices = list(compress(indices, mask))
+        # stable sort by each key from the last to the first
+        for index, descending in reversed(self._sortorder):
+            values = self._values(index, range(len(rows)))
+            datatype = _infer_datatype(values)
+            order = _sort_order(range(len(rows)), values, datatype)
+            ranks = _sort_ranks(order, [values[i] for i in order], datatype)
+            indices.sort(key=ranks.__getitem__, reverse=descending)
+        self._view = indices
+
+    def row_count(self):
+        if self._view is None:
+            return len(self._rows)
+        return len(self._view)
+
+    def fetch(self, offset, limit):
+        if self._view is None:
+            return self._rows[offset : offset + limit]
+        rows = self._rows
+        return [rows[i] for i in self._view[offset : offset + limit]]
+
+    def sort(self, sortorder):
+        self._sortorder = list(sortorder)
+        self._update_view()
+        return True
+
+    def filter(self, filters):
+        self._filters = list(filters)
+        self._update_view()
+        return True
+
+    def search(self, criteria):
+        self._criteria = str(criteria)
+        self._update_view()
+        return True
+
+
+class IterableDataProvider(DataProvider):
+    """A data provider that reads the records from an iterable, such
+    as a generator or a database cursor, as the pages are requested.
+    The records are read in blocks and only the most recently used
+    blocks are kept, so the memory used does not depend on the number
+    of records.
+
+    When the source is a callable that returns a new iterable of the
+    records, blocks that are no longer kept are read again by
+    restarting the iteration. A one-shot iterator, such as a
+    generator, cannot be restarted, so only the kept blocks can be
+    revisited. The number of records is known once the source is
+    exhausted. Sorting, filtering and searching are not supported.
+    """
+
+    def __init__(self, source, blocksize=1000, cachesize=32):
+        """
+        Parameters:
+
+            source (Union[Iterable, Callable]):
+                An iterable of the values of each record, or a
+                callable that returns a new iterable of the records.
+
+            blocksize (int):
+                The number of records read at a time.
+
+            cachesize (int):
+                The maximum number of blocks that are kept.
+        """
+        self._source = source
+        self._blocksize = blocksize
+        self._cachesize = cachesize
+        self._blocks = OrderedDict()  # block index to list of records
+        self._iterator = None
+        self._position = 0  # index of the next record of the iterator
+        self._count = None
+
+    def _restart(self):
+        """Start reading the records from the first record"""
+        source = self._source
+        if callable(source):
+            self._iterator = iter(source())
+        elif self._iterator is None or iter(source) is not source:
+            self._iterator = iter(source)
+        else:
+            raise ValueError(
+                "The records are no longer cached and the source cannot "
+                "be restarted; pass a callable that returns the records"
+            )
+        self._position = 0
+
+    def _block(self, block):
+        """Return the records of a block, reading the source as needed"""
+        blocks = self._blocks
+        if block in blocks:
+            blocks.move_to_end(block)
+            return blocks[block]
+        start = block * self._blocksize
+        if self._count is not None and start >= self._count:
+            return []
+        if self._iterator is None or self._position > start:
+            self._restart()
+        rows = []
+        while self._position <= start:
+            # read every block up to the requested block
+            index = self._position // self._blocksize
+            rows = [list(v) for v in islice(self._iterator, self._blocksize)]
+            self._position += len(rows)
+            blocks[index] = rows
+            blocks.move_to_end(index)
+            while len(blocks) > self._cachesize:
+                blocks.popitem(last=False)
+            if len(rows) < self._blocksize:
+                self._count = self._position
+                break
+        return rows if self._position > start else []
+
+    def row_count(self):
+        return self._count
+
+    def fetch(self, offset, limit):
+        size = self._blocksize
+        rows = []
+        block = offset // size
+        skip = offset - block * size
+        while len(rows) < limit:
+            records = self._block(block)
+            rows.extend(records[skip : skip + limit - len(rows)])
+            if len(records) < size:
+                break
+            block += 1
+            skip = 0
+        return rows
+
+
+def _quote_identifier(name):
+    """Quote an SQL identifier"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class SqliteDataProvider(DataProvider):
+    """A data provider over a table or query of an sqlite3 database.
+    Sorting is performed with `ORDER BY`, row filters with `WHERE`,
+    searching with `LIKE`, or with a full-text index when one is
+    available, and paging with `LIMIT`, so each page is a single
+    query and the memory used does not depend on the size of the
+    table.
+
+    When the provider is bound to a table, the rowid orders records
+    with equal sort keys and moving to the next page continues from
+    the last record of the previous page (keyset pagination) rather
+    than counting past the records of the previous pages with
+    `OFFSET`, provided the table is not sorted or is sorted by one
+    column.
+    """
+
+    def __init__(
+        self, database, table=None, query=None, parameters=(), ftstable=None
+    ):
+        """
+        Parameters:
+
+            database (Union[str, sqlite3.Connection]):
+                The path of a database, or a connection.
+
+            table (str):
+                The name of the table that provides the records.
+
+            query (str):
+                A `SELECT` statement that provides the records, if a
+                table is not specified.
+
+            parameters (Sequence):
+                The parameters of the query.
+
+            ftstable (str):
+                The name of an FTS5 table indexing the columns of the
+                table, with the same rowids, that is used to search
+                the table. See `create_search_index`.
+        """
+        import sqlite3
+
+        if (table is None) == (query is None):
+            raise ValueError("Specify either a table or a query")
+        if isinstance(database, sqlite3.Connection):
+            self.connection = database
+        else:
+            self.connection = sqlite3.connect(database)
+        self._patterns = {}
+        self.connection.create_function("REGEXP", 2, self._regexp)
+        self.table = table
+        if table is not None:
+            self._source = _quote_identifier(table)
+        else:
+            self._source = f"({query})"
+        self._parameters = list(parameters)
+        cursor = self.connection.execute(
+            f"SELECT * FROM {self._source} LIMIT 0", self._parameters
+        )
+        self.columns = [d[0] for d in cursor.description]
+        self._quoted = [_quote_identifier(c) for c in self.columns]
+        self.ftstable = ftstable
+        self._sortorder = []
+        self._filters = []
+        self._criteria = ""
+        self._count = None
+        self._keyset = None  # offset of the next record, last key and rowid
+
+    def create_search_index(self, name=None):
+        """Create and fill an FTS5 table with the trigram tokenizer
+        indexing the columns of the table, which is used to search the
+        table for criteria of three or more characters. The index is
+        not updated when the table changes; call this method again to
+        rebuild it.
+
+        Parameters:
+
+            name (str):
+                The name of the index table. The default is the name
+                of the table followed by '_search'.
+
+        Returns:
+
+            bool:
+                `True` if the index was created, or `False` if FTS5 or
+                the trigram tokenizer is not available, in which case
+                searching uses `LIKE`.
+        """
+        import sqlite3
+
+        if self.table is None:
+            raise ValueError("A search index requires a table")
+        name = name or f"{self.table}_search"
+        fts = _quote_identifier(name)
+        columns = ", ".join(self._quoted)
+        try:
+            self.connection.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+                f"{columns}, content={_quote_identifier(self.table)}, "
+                f"tokenize='trigram')"
+            )
+            self.connection.execute(
+                f"INSERT INTO {fts}({fts}) VALUES('rebuild')"
+            )
+        except sqlite3.OperationalError:
+            return False
+        self.ftstable = name
+        return True
+
+    def _regexp(self, pattern, value):
+        """The REGEXP function of the connection"""
+        if value is None:
+            return False
+        regex = self._patterns.get(pattern) or re.compile(pattern)
+        return regex.search(str(value)) is not None
+
+    # query building
+
+    def _filter_sql(self, rowfilter):
+        """Return the SQL expression and parameters of a row filter"""
+        column = self._quoted[rowfilter.column.tableindex]
+        predicate = rowfilter.predicate
+        value = rowfilter.value
+        params = []
+        if predicate == "equals":
+            sql = f"{column} IS ?"
+            params = [value]
+        elif predicate == "in":
+            members = [v for v in value if v is not None]
+            terms = []
+            if members:
+                marks = ", ".join("?" * len(members))
+                terms.append(f"{column} IN ({marks})")
+                params = members
+            if None in value:
+                terms.append(f"{column} IS NULL")
+            sql = " OR ".join(terms) or "0"
+        elif predicate == "range":
+            terms = []
+            for bound, operator in zip(value, (">=", "<=")):
+                if bound is not None:
+                    terms.append(f"{column} {operator} ?")
+                    params.append(bound)
+            sql = " AND ".join(terms) or "1"
+        elif predicate == "regex":
+            # keep the flags of the compiled pattern
+            self._patterns[value.pattern] = value
+            sql = f"{column} REGEXP ?"
+            params = [value.pattern]
+        else:
+            sql = f"{column} IS NULL OR {column} = ''"
+        if rowfilter.invert:
+            sql = f"NOT COALESCE(({sql}), 0)"
+        return f"({sql})", params
+
+    def _search_sql(self):
+        """Return the SQL expression and parameters of the search"""
+        criteria = self._criteria
+        if self.ftstable is not None and len(criteria) >= 3:
+            phrase = '"' + criteria.replace('"', '""') + '"'
+            fts = _quote_identifier(self.ftstable)
+            return f"rowid IN (SELECT rowid FROM {fts} WHERE {fts} MATCH ?)", [
+                phrase
+            ]
+        pattern = "%" + re.sub(r"([\\%_])", r"\\\1", criteria) + "%"
+        terms = [f"{c} LIKE ? ESCAPE '\\'" for c in self._quoted]
+        return "(" + " OR ".join(terms) + ")", [pattern] * len(terms)
+
+    def _where_sql(self):
+        """Return the WHERE clause and parameters of the filters and
+        search"""
+        terms = []
+        params = []
+        for rowfilter in self._filters:
+            sql, values = self._filter_sql(rowfilter)
+            terms.append(sql)
+            params.extend(values)
+        if self._criteria:
+            sql, values = self._search_sql()
+            terms.append(sql)
+            params.extend(values)
+        return terms, params
+
+    def _order_sql(self):
+        terms = [
+            self._quoted[index] + (" DESC" if descending else "")
+            for index, descending in self._sortorder
+        ]
+        if self.table is not None:
+            terms.append("rowid")
+        if not terms:
+            return ""
+        return " ORDER BY " + ", ".join(terms)
+
+    def _keyset_sql(self):
+        """Return the condition that selects the records after the
+        last record that was fetched"""
+        _, lastkey, lastrowid = self._keyset
+        if not self._sortorder:
+            return "rowid > ?", [lastrowid]
+        index, descending = self._sortorder[0]
+        column = self._quoted[index]
+        # NULL is ordered first in ascending order and last in
+        # descending order
+        if lastkey is None:
+            if descending:
+                return f"({column} IS NULL AND rowid > ?)", [lastrowid]
+            return f"({column} IS NOT NULL OR rowid > ?)", [lastrowid]
+        # the first comparison lets an index on the column be searched
+        if descending:
+            sql = (
+                f"(({column} <= ? AND ({column} < ? OR rowid > ?)) "
+                f"OR {column} IS NULL)"
+            )
+        else:
+            sql = f"({column} >= ? AND ({column} > ? OR rowid > ?))"
+        return sql, [lastkey, lastkey, lastrowid]
+
+    def _select(self, terms, params, suffix="", rowid=False):
+        columns = ", ".join(self._quoted)
+        if rowid:
+            columns = "rowid, " + columns
+        sql = f"SELECT {columns} FROM {self._source}"
+        if terms:
+            sql += " WHERE " + " AND ".join(terms)
+        sql += self._order_sql() + suffix
+        return self.connection.execute(sql, self._parameters + params)
+
+    def _changed(self):
+        self._count = None
+        self._keyset = None
+
+    # DataProvider interface
+
+    def row_count(self):
+        if self._count is None:
+            terms, params = self._where_sql()
+            sql = f"SELECT COUNT(*) FROM {self._source}"
+            if terms:
+                sql += " WHERE " + " AND ".join(terms)
+            cursor = self.connection.execute(sql, self._parameters + params)
+            self._count = cursor.fetchone()[0]
+        return self._count
+
+    def fetch(self, offset, limit):
+        terms, params = self._where_sql()
+        keyed = self.table is not None and len(self._sortorder) <= 1
+        if keyed and self._keyset is not None and self._keyset[0] == offset:
+            sql, values = self._keyset_sql()
+            terms.append(sql)
+            params.extend(values)
+            suffix = " LIMIT ?"
+            params.append(limit)
+        else:
+            suffix = " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+        rows = self._select(terms, params, suffix, rowid=keyed).fetchall()
+        if not keyed:
+            return [list(row) for row in rows]
+        if rows:
+            last = rows[-1]
+            lastkey = (
+                last[self._sortorder[0][0] + 1] if self._sortorder else None
+            )
+            self._keyset = (offset + len(rows), lastkey, last[0])
+        return [list(row[1:]) for row in rows]
+
+    def sort(self, sortorder):
+        self._sortorder = list(sortorder)
+        self._changed()
+        return True
+
+    def filter(self, filters):
+        self._filters = list(filters)
+        self._changed()
+        return True
+
+    def search(self, criteria):
+        self._criteria = str(criteria)
+        self._changed()
+        return True
+
+    def iter_rows(self, pagesize=1000):
+        """Yield the values of every record, in order, from a single
+        query."""
+        terms, params = self._where_sql()
+        cursor = self._select(terms, params)
+        while True:
+            rows = cursor.fetchmany(pagesize)
+            if not rows:
+                return
+            for row in rows:
+                yield list(row)
+
+
+def _record_ends(chunk, position, quoted):
+    """Return the file offsets that follow each record ending in a
+    chunk of a csv file, and whether the end of the chunk is inside a
+    quoted value. Line breaks inside quoted values do not end a
+    record."""
+    if numpy is not None:
+        data = numpy.frombuffer(chunk, numpy.uint8)
+        newlines = numpy.flatnonzero(data == 10)
+        if quoted or chunk.find(b'"') >= 0:
+            # the parity of the number of quotes before each byte
+            parity = numpy.cumsum(data == 34, dtype=numpy.uint8) & 1
+            newlines = newlines[parity[newlines] == quoted]
+            quoted = bool(parity[-1]) != quoted
+        ends = array("q")
+        ends.frombytes(
+            (newlines + (position + 1)).astype(numpy.int64).tobytes()
+        )
+        return ends, quoted
+    ends = array("q")
+    start = 0
+    while True:
+        index = chunk.find(b"\n", start)
+        if index < 0:
+            break
+        if chunk.count(b'"', start, index) & 1:
+            quoted = not quoted
+        if not quoted:
+            ends.append(position + index + 1)
+        start = index + 1
+    if chunk.count(b'"', start) & 1:
+        quoted = not quoted
+    return ends, quoted
+
+
+class CsvDataProvider(DataProvider):
+    """A data provider that views a csv file without reading it into
+    memory. The offset of each record in the file is indexed in a
+    background thread, and only the records that are requested are
+    read and parsed, with the most recently used records kept. The
+    memory used is proportional to the number of records (8 bytes per
+    record for the index), not to the size of the file.
+
+    The records that are indexed can be viewed while the rest of the
+    file is being indexed; until the index is complete, the number of
+    records is the number indexed so far. Values are read as text.
+    Sorting, filtering and searching are not supported.
+
+    The encoding must be ASCII compatible, such as UTF-8 or Latin-1.
+    """
+
+    def __init__(
+        self,
+        path,
+        delimiter=",",
+        header=True,
+        encoding="utf-8",
+        mmap=True,
+        cachesize=1024,
+        blocksize=1 << 22,
+    ):
+        """
+        Parameters:
+
+            path (str):
+                The path of the csv file.
+
+            delimiter (str):
+                The character that separates the values.
+
+            header (bool):
+                Specifies that the first record contains the column
+                names. Otherwise, the columns are named by number.
+
+            encoding (str):
+                The encoding of the file.
+
+            mmap (bool):
+                Read the records from a memory map of the file rather
+                than by seeking the file.
+
+            cachesize (int):
+                The maximum number of parsed records that are kept.
+
+            blocksize (int):
+                The number of bytes read at a time when indexing.
+        """
+        self.path = path
+        self._delimiter = delimiter
+        self._encoding = encoding
+        self._cachesize = cachesize
+        self._blocksize = blocksize
+        self._rows = OrderedDict()  # record index to values
+        self._file = open(path, "rb")
+        self._size = self._file.seek(0, io.SEEK_END)
+        self._map = None
+        if mmap and self._size > 0:
+            from mmap import mmap as memorymap, ACCESS_READ
+
+            self._map = memorymap(self._file.fileno(), 0, access=ACCESS_READ)
+        self._lock = threading.Lock()  # guards seeking the file
+        self._cancel = threading.Event()
+        self._complete = False
+        self._indexed = 0  # bytes indexed
+
+        # index the first blocks, up to the end of the first record, so
+        # the first records are available immediately, then index the
+        # rest in the background
+        self._file.seek(0)
+        offsets = [0]  # offset of each record and of the end
+        quoted = False
+        while len(offsets) == 1 and self._indexed < self._size:
+            chunk = self._file.read(blocksize)
+            ends, quoted = _record_ends(chunk, self._indexed, quoted)
+            offsets.extend(ends)
+            self._indexed += len(chunk)
+        self._offsets = offsets
+        self._finish_index()
+
+        first = self._parse(0, 1) if self.row_count() > 0 else []
+        if header:
+            self.columns = [str(v) for v in first[0]] if first else []
+            del self._offsets[: len(first)]
+            self._rows.clear()
+        else:
+            width = len(first[0]) if first else 0
+            self.columns = [f"Column {i + 1}" for i in range(width)]
+        self._width = len(self.columns)
+
+        if not self._complete:
+            self._thread = threading.Thread(
+                target=self._build_index, args=(quoted,), daemon=True
+            )
+            self._thread.start()
+        else:
+            self._thread = None
+
+    def _build_index(self, quoted):
+        """Index the records after the first block"""
+        with open(self.path, "rb") as f:
+            position = f.seek(self._indexed)
+            while not self._cancel.is_set():
+                chunk = f.read(self._blocksize)
+                if not chunk:
+                    break
+                ends, quoted = _record_ends(chunk, position, quoted)
+                self._offsets.extend(ends)
+                position += len(chunk)
+                self._indexed = position
+        self._finish_index()
+
+    def _finish_index(self):
+        """Mark the index complete if the whole file has been read,
+        adding a last record that does not end with a line break."""
+        if self._indexed < self._size:
+            return
+        if self._offsets[-1] < self._size:
+            self._offsets.append(self._size)
+        self._complete = True
+
+    @property
+    def progress(self):
+        """The fraction of the file that has been indexed, or `None`
+        when the index is complete or indexing has been cancelled."""
+        if self._complete or self._cancel.is_set():
+            return None
+        return self._indexed / self._size
+
+    def cancel(self):
+        """Stop indexing the file. The records indexed so far can
+        still be viewed."""
+        self._cancel.set()
+
+    def close(self):
+        """Stop indexing and close the file"""
+        self.cancel()
+        if self._thread is not None:
+            self._thread.join()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def _read(self, start, end):
+        if self._map is not None:
+            return self._map[start:end]
+        with self._lock:
+            self._file.seek(start)
+            return self._file.read(end - start)
+
+    def _parse(self, start, stop):
+        """Read and parse the records from start up to stop"""
+        offsets = self._offsets
+        data = self._read(offsets[start], offsets[stop])
+        text = data.decode(self._encoding, errors="replace")
+        reader = csv.reader(
+            io.StringIO(text, newline=""), delimiter=self._delimiter
+        )
+        rows = list(islice(reader, stop - start))
+        rows.extend([] for _ in range(stop - start - len(rows)))
+        cache = self._rows
+        for index, row in enumerate(rows, start):
+            cache[index] = row
+        while len(cache) > self._cachesize:
+            cache.popitem(last=False)
+        return rows
+
+    def row_count(self):
+        return len(self._offsets) - 1
+
+    def fetch(self, offset, limit):
+        stop = min(offset + limit, self.row_count())
+        if offset >= stop:
+            return []
+        cache = self._rows
+        if all(index in cache for index in range(offset, stop)):
+            rows = []
+            for index in range(offset, stop):
+                cache.move_to_end(index)
+                rows.append(cache[index])
+        else:
+            rows = self._parse(offset, stop)
+        width = self._width
+        return [row + [""] * (width - len(row)) for row in rows]
+
+
+class _CsvImport:
+    """Parses a csv file in a worker thread and passes the records to
+    the Tk thread in chunks through a bounded queue. The end of the
+    file, an error, or cancellation is marked by `None`."""
+
+    def __init__(self, path, chunksize, delimiter, encoding, header):
+        self.header = header
+        self.queue = Queue(maxsize=8)  # chunks of records and progress
+        self.cancelled = threading.Event()
+        self.error = None
+        raw = open(path, "rb")
+        self._thread = threading.Thread(
+            target=self._read,
+            args=(raw, chunksize, delimiter, encoding),
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _put(self, item):
+        """Wait for room in the queue unless the import is cancelled"""
+        while not self.cancelled.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return
+            except Full:
+                continue
+
+    def _read(self, raw, chunksize, delimiter, encoding):
+        try:
+            with raw:
+                size = raw.seek(0, io.SEEK_END) or 1
+                raw.seek(0)
+                text = io.TextIOWrapper(
+                    raw, encoding=encoding, errors="replace", newline=""
+                )
+                reader = csv.reader(text, delimiter=delimiter)
+                while not self.cancelled.is_set():
+                    rows = list(islice(reader, chunksize))
+                    if not rows:
+                        break
+                    self._put((rows, raw.tell() / size))
+        except (OSError, csv.Error) as error:
+            self.error = error
+        self._put(None)
+
+    def cancel(self):
+        """Stop reading the file"""
+        self.cancelled.set()
+
+
+class _CsvExport:
+    """Writes records to a csv file in chunks, either in a worker
+    thread or a chunk at a time from the Tk thread. A cancelled export
+    removes the partially written file."""
+
+    def __init__(self, path, headers, records, total, delimiter):
+        self.path = path
+        self.total = total
+        self.written = 0
+        self.done = False
+        self.error = None
+        self.cancelled = threading.Event()
+        self._records = iter(records)
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file, delimiter=delimiter)
+        self._writer.writerow(headers)
+
+    def step(self, chunksize=1000):
+        """Write the next chunk of records"""
+        if self.done:
+            return
+        try:
+            if self.cancelled.is_set():
+                self._finish()
+                return
+            rows = list(islice(self._records, chunksize))
+            self._writer.writerows(rows)
+            self.written += len(rows)
+            if len(rows) < chunksize:
+                self._finish()
+        except Exception as error:
+            self.error = error
+            self._finish()
+
+    def _finish(self):
+        self._file.close()
+        if self.cancelled.is_set():
+            os.remove(self.path)
+        self.done = True
+
+    def run(self):
+        """Write every record"""
+        while not self.done:
+            self.step()
+
+    def cancel(self):
+        """Stop writing and remove the file"""
+        self.cancelled.set()
+
+
 class Tableview(ttk.Frame):
     """A class built on the `ttk.Treeview` widget for arranging data in
     rows and columns. The underlying Treeview object and its methods are
@@ -367,6 +2572,10 @@ class Tableview(ttk.Frame):
     to be loaded very quickly even with hundreds of thousands of
     records.
 
+    When the data should be scrolled rather than paged, the virtual
+    option keeps a fixed pool of `Treeview` items sized to the viewport
+    and rebinds the record values to the pool as the user scrolls.
+
     All table columns are sortable. Clicking a column header will toggle
     between sorting "ascending" and "descending".
 
@@ -425,20 +2634,32 @@ class Tableview(ttk.Frame):
         ```
     """
 
+    FORMATCACHESIZE = 10000  # the number of formatted cells that are cached
+    POOLTHRESHOLD = 100000  # the records needed to use the worker pool
+    PUSHIDLE = 250  # the milliseconds between checks for pushed records
+
     def __init__(
-            self,
-            master=None,
-            bootstyle=DEFAULT,
-            coldata=[],
-            rowdata=[],
-            paginated=False,
-            searchable=False,
-            autofit=False,
-            autoalign=True,
-            stripecolor=None,
-            pagesize=10,
-            height=10,
-            delimiter=",",
+        self,
+        master=None,
+        bootstyle=DEFAULT,
+        coldata=[],
+        rowdata=[],
+        paginated=False,
+        searchable=False,
+        autofit=False,
+        autoalign=True,
+        stripecolor=None,
+        pagesize=10,
+        height=10,
+        delimiter=",",
+        virtual=False,
+        columnar=False,
+        searchindex=False,
+        livesearch=False,
+        provider=None,
+        maxrows=None,
+        followtail=False,
+        workers=None,
     ):
         """
         Parameters:
@@ -456,7 +2677,8 @@ class Tableview(ttk.Frame):
                 An iterable containing either the heading name or a
                 dictionary of column settings. Configurable settings
                 include >> text, image, command, anchor, width, minwidth,
-                maxwidth, stretch. Also see `Tableview.insert_column`.
+                maxwidth, stretch, formatter. Also see
+                `Tableview.insert_column`.
 
             rowdata (List):
                 An iterable of row data. The lenth of each row of data
@@ -517,7 +2739,81 @@ class Tableview(ttk.Frame):
             delimiter (str):
                 The character to use as a delimiter when exporting data
                 to CSV.
+
+            virtual (bool):
+                If `True`, the table uses virtual scrolling. A fixed
+                pool of `Treeview` items sized to the viewport is
+                created once and the values are rebound to the pooled
+                items as the user scrolls. The time to open the table
+                and the memory used by the `Treeview` is constant
+                regardless of the number of records. This is the
+                recommended setting when showing a large dataset
+                without pagination. Sorting, filtering, searching, and
+                selection operate on the logical records.
+
+            columnar (bool):
+                If `True`, the records are kept in a `ColumnStore`
+                rather than as one `TableRow` object per record. The
+                values of each column are stored together, numeric
+                columns in compact arrays, and records are identified
+                by an integer rowid. `TableRow` objects are created
+                on demand as lightweight views of the store. This
+                greatly reduces the memory used per record and allows
+                sorting, searching, filtering and exporting to run
+                directly on the columns.
+
+            searchindex (Union[bool, str]):
+                If `True`, the lowercase text of each record is cached
+                in a search index that is kept up to date as records
+                are inserted, deleted and changed, so that a search
+                does not convert every cell of the table. Use 'ngram'
+                to also keep an inverted index of the character
+                trigrams of each record, which trades memory for
+                faster searches on large tables.
+
+            livesearch (bool):
+                If `True`, the table is searched as you type in the
+                searchbar. The search is started after a short pause in
+                typing and a search that is still running is cancelled
+                when the search criteria changes. A search that extends
+                the previous criteria only tests the records that
+                matched the previous search. Implies a search index.
+
+            provider (DataProvider):
+                A source of records that are fetched a page at a time
+                rather than held by the table. See `set_provider`.
+
+            maxrows (int):
+                The maximum number of records. When records are
+                inserted beyond this number, the oldest records are
+                deleted, so a table fed continuously by `push` uses a
+                constant amount of memory. Not supported for columnar
+                tables.
+
+            followtail (bool):
+                If `True`, the view moves to the last records whenever
+                records are pushed. See `push`.
+
+            workers (int):
+                The number of worker processes that sort, filter and
+                search a columnar table of at least `POOLTHRESHOLD`
+                records, so the application stays responsive while
+                they run. The columns are shared with the workers
+                through shared memory, and are copied again only after
+                the data changes. A busy cursor and the progress of the
+                operation are shown while it runs, and a new sort,
+                filter or search cancels the one that is running. The
+                main module of the application must be guarded by
+                `if __name__ == '__main__':` on platforms that spawn
+                the worker processes, such as Windows and macOS. Only
+                supported by columnar tables.
         """
+        if maxrows is not None and columnar:
+            raise ValueError(
+                "A columnar table cannot limit the number of records"
+            )
+        if workers is not None and not columnar:
+            raise ValueError("Only a columnar table can use worker processes")
         super().__init__(master)
         self._tablecols = []
         self._tablerows = []
@@ -540,13 +2836,76 @@ class Tableview(ttk.Frame):
         self._delimiter = delimiter
         self._iidmap = {}  # maps iid to row object
         self._cidmap = {}  # maps cid to col object
+        self._virtual = virtual
+        self._vpool = []  # pooled treeview items
+        self._vslots = {}  # maps pooled item to row object
+        self._vrows = []  # logical rows that are scrolled
+        self._voffset = 0  # logical index of the first pooled item
+        self._vselected = set()  # iids of selected logical rows
+        self._selection = None  # the selected iids, as a tuple and a set
+        self._viidcnt = count(1)
+        self._columnar = columnar
+        self._store = ColumnStore() if columnar else None
+        self._rowiids = {}  # maps rowid to iid for columnar records
+        self._striped = set()  # iids of records with the stripe tag
+        if columnar:
+            self._tablerows = _RowList(self)
+            self._tablerows_filtered = _RowList(self)
+        self._livesearch = livesearch
+        if searchindex or livesearch:
+            self._searchindex = _SearchIndex(ngram=searchindex == "ngram")
+        else:
+            self._searchindex = None
+        self._lastsearch = None  # source, versions, criteria and matches
+        self._searchjob = None
+        self._searchgen = 0
+        self._searchdelay = 200
+        self._dataversion = 0  # incremented whenever the data changes
+        self._columnedits = {}  # the count of cell edits by position
+        self._sortorder = ()  # sorted columns and directions
+        self._lastsort = None  # sorted rows, data version and sort order
+        self._rowfilters = []
+        self._provider = None
+        self._csvfile = None  # the provider of the file opened by open_csv
+        self._csvimport = None  # the file being loaded by load_csv
+        self._csverror = None  # the error of the last csv import or export
+        self._keycolumn = None
+        self._keyindex = None  # position of the key column, and key to record
+        self._dirtyrows = set()  # records changed since the view was updated
+        self._flushjob = None
+        self._maxrows = maxrows
+        self.followtail = followtail
+        self._pushed = deque()  # records pushed since the view was updated
+        self._pushjob = None
+        self._progressframe = None
+        self._progresstext = tk.StringVar(master=self)
+        self._progressvalue = tk.DoubleVar(master=self)
+        self._progresscancel = None
+        self._aggcolumns = []  # columns whose aggregates are maintained
+        self._aggregates = None
+        self._footer = None
+        self._footercolumns = []
+        self._footerlabels = []
+        self._footerjob = None
+        self._groupby = None
+        self._groups = {}  # maps parent item to value, records and placeholder
+        self._groupsopen = set()  # values of the expanded groups
+        self._formatters = None  # positions and formatters of the columns
+        self._formatcache = OrderedDict()  # maps record and position to text
+        self._textmeasures = {}  # maps scaling and font to a text measure
+        self._workerpool = _WorkerPool(workers) if workers else None
+        self._pooljob = None  # the sort, filter or search in the worker pool
 
         self.view: ttk.Treeview = None
         self._build_tableview_widget(coldata, rowdata, bootstyle)
+        if provider is not None:
+            self.set_provider(provider)
+        self._pushjob = self.after(self.PUSHIDLE, self._append_pushed_rows)
 
     @property
     def tablerows(self):
-        """A list of all tablerow objects"""
+        """A list of all tablerow objects. When the table is columnar,
+        this is a sequence that creates the row views on demand."""
         return self._tablerows
 
     @property
@@ -559,6 +2918,12 @@ class Tableview(ttk.Frame):
         """A list of visible tablerow objects"""
         return self._viewdata
 
+    @property
+    def csv_error(self):
+        """The error of the last csv import or export that failed in
+        the background, or `None`"""
+        return self._csverror
+
     @property
     def tablecolumns(self):
         """A list of table column objects"""
@@ -640,6 +3005,18 @@ class Tableview(ttk.Frame):
 
     # DATA HANDLING
 
+    def destroy(self):
+        """Destroy the widget, stop adding pushed records and stop the
+        worker processes"""
+        if self._pushjob is not None:
+            self.after_cancel(self._pushjob)
+            self._pushjob = None
+        if self._workerpool is not None:
+            self._cancel_pool_job()
+            self._workerpool.shutdown()
+            self._workerpool = None
+        super().destroy()
+
     def build_table_data(self, coldata, rowdata):
         """Insert the specified column and row data.
 
@@ -690,80 +3067,558 @@ class Tableview(ttk.Frame):
         if self._stripecolor is not None:
             self.apply_table_stripes(self._stripecolor)
 
-        self.goto_first_page()
+        self.goto_first_page()
+
+    def set_provider(self, provider):
+        """Show the records of a data provider. Only the records of
+        the current page are fetched from the provider and held by
+        the table, so the time to show the table and the memory used
+        do not depend on the number of records. Paging, sorting,
+        filtering and searching are passed on to the provider; see
+        `DataProvider`. The table should be paginated, otherwise only
+        the first page of records can be viewed.
+
+        !!!warning "Existing table data will be erased."
+
+        Parameters:
+
+            provider (DataProvider):
+                The source of the records, or `None` to hold the
+                records in the table again.
+        """
+        if provider is not None and self._columnar:
+            raise ValueError("A columnar table cannot use a data provider")
+        self._provider = None
+        self._cancel_csv_import()
+        if self._csvfile is not None and provider is not self._csvfile:
+            self._csvfile.close()
+            self._csvfile = None
+            self._hide_progress()
+        self.delete_rows()
+        if provider is not None and not self._tablecols and provider.columns:
+            for index, name in enumerate(provider.columns):
+                self.insert_column(index, name)
+        self._provider = provider
+        self._filtered = False
+        self._rowfilters = []
+        self._sortorder = ()
+        self._column_sort_header_reset()
+        self.goto_first_page()
+
+    def open_csv(
+        self, path, mmap=True, delimiter=None, header=True, encoding="utf-8"
+    ):
+        """View a csv file without reading it into memory. The file is
+        indexed in the background, with the progress shown in the
+        pagination frame, and only the records of the current page are
+        read; see `CsvDataProvider`. The first page is shown
+        immediately and the remaining pages become available as they
+        are indexed.
+
+        !!!warning "Existing table data and columns will be erased."
+
+        Parameters:
+
+            path (str):
+                The path of the csv file.
+
+            mmap (bool):
+                Read the records from a memory map of the file.
+
+            delimiter (str):
+                The character that separates the values. The default
+                is the delimiter of the table.
+
+            header (bool):
+                Specifies that the first record contains the column
+                names.
+
+            encoding (str):
+                The encoding of the file.
+
+        Returns:
+
+            CsvDataProvider:
+                The provider of the file, which is closed when another
+                provider is set on the table.
+        """
+        provider = CsvDataProvider(
+            path,
+            delimiter=delimiter or self._delimiter,
+            header=header,
+            encoding=encoding,
+            mmap=mmap,
+        )
+        self.set_provider(None)
+        self.purge_table_data()
+        self.set_provider(provider)
+        self._csvfile = provider
+        if provider.progress is not None:
+            self._show_progress(
+                MessageCatalog.translate("Indexing"), provider.cancel
+            )
+            self._poll_csv_index(provider)
+        return provider
+
+    def load_csv(
+        self,
+        path,
+        chunksize=10000,
+        delimiter=None,
+        header=True,
+        encoding="utf-8",
+    ):
+        """Load the records of a csv file into the table without
+        blocking the window. The file is parsed in a worker thread and
+        the records are appended in chunks; the first page is shown as
+        soon as the first chunk is read. The progress is shown in the
+        pagination frame, where the import can be cancelled, keeping
+        the records loaded so far. Values are loaded as text.
+
+        If the file cannot be parsed, the import stops as if it was
+        cancelled, the error is stored as `csv_error`, and the
+        `<<CsvImportError>>` virtual event is generated.
+
+        !!!warning "Existing table data and columns will be erased."
+
+        Parameters:
+
+            path (str):
+                The path of the csv file.
+
+            chunksize (int):
+                The number of records appended at a time.
+
+            delimiter (str):
+                The character that separates the values. The default
+                is the delimiter of the table.
+
+            header (bool):
+                Specifies that the first record contains the column
+                names. Otherwise, the columns are named by number.
+
+            encoding (str):
+                The encoding of the file.
+        """
+        job = _CsvImport(
+            path, chunksize, delimiter or self._delimiter, encoding, header
+        )
+        self._csverror = None
+        self.set_provider(None)
+        self.purge_table_data()
+        self._filtered = False
+        self._rowfilters = []
+        self._sortorder = ()
+        self._csvimport = job
+        self._show_progress(
+            MessageCatalog.translate("Loading"), self._cancel_csv_import
+        )
+        self.after(10, self._poll_csv_import, job)
+
+    def insert_row(self, index=END, values=[]) -> TableRow:
+        """Insert a row into the tableview at index.
+
+        You must call `Tableview.load_table_data()` to update the
+        current view. If the data is filtered, you will need to call
+        `Tableview.load_table_data(clear_filters=True)`.
+
+        Parameters:
+
+            index (Union[int, str]):
+                A numerical index that specifieds where to insert
+                the record in the dataset. You may also use the string
+                'end' to append the record to the end of the data set.
+                If the index exceeds the record count, it will be
+                appended to the end of the dataset.
+
+            values (Iterable):
+                An iterable of values to insert into the data set.
+                The number of columns implied by the list of values
+                must match the number of columns in the data set for
+                the values to be visible.
+
+        Returns:
+
+            TableRow:
+                A table row object.
+        """
+        rowcount = len(self._tablerows)
+
+        # validate the index
+        if len(values) == 0:
+            return
+        if index == END:
+            index = -1
+        elif index > rowcount - 1:
+            index = -1
+
+        if self._columnar:
+            self._store.extend_columns(len(self._tablecols))
+            record = _ColumnarTableRow(self, self._store.append(values))
+        else:
+            record = TableRow(self, values)
+        if rowcount == 0 or index == -1:
+            self._tablerows.append(record)
+        else:
+            self._tablerows.insert(index, record)
+        self._index_rows([record])
+        if self._maxrows is not None:
+            self._evict_oldest_rows()
+
+        return record
+
+    def insert_rows(self, index, rowdata):
+        """Insert row after index for each row in *row. If index does
+        not exist then the records are appended to the end of the table.
+        You can also use the string 'end' to append records at the end
+        of the table.
+
+        As with `insert_row`, you must call `load_table_data` to
+        update the current view. Also see `insert_rows_at`.
+
+        Parameters:
+
+            index (Union[int, str]):
+                The location in the data set after where the records
+                will be inserted. You may use a numerical index or
+                the string 'end', which will append the records to the
+                end of the data set.
+
+            rowdata (List[Any, List]):
+                A list of row values to be inserted into the table.
+
+        Examples:
+
+            ```python
+            Tableview.insert_rows('end', ['one', 1], ['two', 2])
+            ```
+        """
+        if len(rowdata) == 0:
+            return
+        self._insert_table_rows(index, rowdata)
+
+    def append_rows(self, rowdata):
+        """Append records to the end of the data set and reload the
+        view once for the whole batch.
+
+        Parameters:
+
+            rowdata (Iterable[List]):
+                An iterable of row values to append to the table.
+        """
+        self._insert_table_rows(END, rowdata)
+        self.load_table_data()
+
+    def push(self, *rows):
+        """Append records to the end of the data set from any thread.
+        The records are added to the table once per frame, in a single
+        batch, and the oldest records are deleted when the table has a
+        maximum number of records. When `followtail` is `True`, the
+        view moves to the last records.
+
+        The records are added by a timer that runs in the thread of
+        the window from the time the table is created, so this method
+        never calls Tk. The timer checks for records each frame while
+        they arrive, and every `PUSHIDLE` milliseconds while they do
+        not.
+
+        Parameters:
+
+            *rows (List[Any]):
+                The values of each record.
+
+        Examples:
+
+            ```python
+            Tableview.push(['one', 1], ['two', 2])
+            ```
+        """
+        self._pushed.extend(rows)
+
+    def insert_rows_at(self, index, rowdata):
+        """Insert records at index in the data set and reload the view
+        once for the whole batch. The records are spliced into the
+        data set in a single operation, so the cost does not depend
+        on the number of records inserted before the index.
+
+        Parameters:
+
+            index (Union[int, str]):
+                The position in the data set of the first inserted
+                record. You may also use the string 'end' to append
+                the records to the end of the data set. If the index
+                exceeds the record count, the records are appended.
+
+            rowdata (Iterable[List]):
+                An iterable of row values to insert into the table.
+        """
+        self._insert_table_rows(index, rowdata)
+        self.load_table_data()
+
+    def replace_rows(self, rowdata, iids=None):
+        """Replace the values of existing records, or the whole data
+        set, and reload the view once.
+
+        If iids is provided, the values of the record identified by
+        each iid are replaced by the row values in the same position
+        of rowdata. Otherwise, all existing records are removed with
+        a single `Treeview` call and rowdata becomes the new data set;
+        any row filters are cleared. The columns are not changed in
+        either case.
+
+        Parameters:
+
+            rowdata (Iterable[List]):
+                An iterable of row values.
+
+            iids (Iterable[str]):
+                The unique record identifiers of the records to update.
+        """
+        if iids is None:
+            self.delete_rows()
+            self._filtered = False
+            self.append_rows(rowdata)
+            return
+
+        for iid, values in zip(iids, rowdata):
+            record: TableRow = self.iidmap.get(iid)
+            if record is None:
+                continue
+            if self._columnar:
+                self._store.set_row(record._rowid, values)
+            else:
+                record._values = list(values)
+            record.refresh()
+
+    @property
+    def keycolumn(self):
+        """The column whose values identify the records, or `None`.
+        Also see `set_key_column`."""
+        return self._keycolumn
+
+    def set_key_column(self, index=None, cid=None):
+        """Set the column whose values identify the records for
+        `get_row_by_key` and `update_cells`, such as a primary key.
+        The values of the column should be unique. The index of keys
+        is built when it is first used and kept up to date as the
+        values change; it is rebuilt after records or columns are
+        inserted or deleted.
+
+        Parameters:
+
+            index (int):
+                The numerical index of the column.
+
+            cid (str):
+                A unique column identifier. If neither index nor cid
+                is given, the key column is cleared.
+        """
+        if cid is not None:
+            column = self.cidmap.get(int(cid))
+        elif index is not None:
+            column = self.get_column(index=index)
+        else:
+            column = None
+        self._keycolumn = column
+        self._keyindex = None
+
+    def get_row_by_key(self, key):
+        """Return the record whose value in the key column is key, or
+        `None` if there is no such record. Also see `set_key_column`.
+
+        Parameters:
+
+            key (Any):
+                The value of the key column.
+
+        Returns:
+
+            Union[TableRow, None]:
+                The record.
+        """
+        row = self._lookup_key(key)
+        if row is not None and self._columnar:
+            return self._row_view(row)
+        return row
+
+    def update_cells(self, updates):
+        """Update cells of records identified by the value of their key
+        column. The values are stored immediately, while the view is
+        updated once per frame for only the records that are in view,
+        so updating the same record many times, or records that are
+        not in view, costs no more than updating the view once. Records
+        that are not in view are updated when they are shown.
+
+        Parameters:
+
+            updates (Dict[Any, Dict[Union[int, str], Any]]):
+                Maps the key of each record to the new values of its
+                cells, by cid. See `set_key_column`.
+
+        Returns:
+
+            List[Any]:
+                The keys that were not found.
 
-    def insert_row(self, index=END, values=[]) -> TableRow:
-        """Insert a row into the tableview at index.
+        Examples:
 
-        You must call `Tableview.load_table_data()` to update the
-        current view. If the data is filtered, you will need to call
-        `Tableview.load_table_data(clear_filters=True)`.
+            ```python
+            table.set_key_column(cid=table.tablecolumns[0].cid)
+            table.update_cells({"AAPL": {2: 187.5, 3: "+0.4%"}})
+            ```
+        """
+        if self._keycolumn is None:
+            raise ValueError("A key column has not been set")
+        columns = {}
+        for cells in updates.values():
+            for cid in cells:
+                if cid not in columns:
+                    # raises KeyError before any cell is written
+                    columns[cid] = self.cidmap[int(cid)]
+        positions = {cid: c.tableindex for cid, c in columns.items()}
+        missing = []
+        store = self._store
+        for key, cells in updates.items():
+            row = self._lookup_key(key)
+            if row is None:
+                missing.append(key)
+                continue
+            for column, value in cells.items():
+                position = positions[column]
+                if self._columnar:
+                    store.set_value(row, position, value)
+                else:
+                    values = row._values
+                    if position >= len(values):
+                        values.extend([""] * (position + 1 - len(values)))
+                    values[position] = value
+            if self._columnar:
+                row = self._row_view(row)
+            self._reindex_row(row, invalidate=False)
+            self._dirtyrows.add(row)
+        if len(missing) < len(updates):
+            self._invalidate_columns(columns.values())
+        if self._dirtyrows and self._flushjob is None:
+            self._flushjob = self.after(16, self._flush_dirty_rows)
+        return missing
+
+    def get_aggregates(self, index=None, cid=None):
+        """Return the aggregates of the values of a column over the
+        records in the current filter. Blank values, `None` and the
+        empty string, are not counted, and the sum and mean are of
+        the numeric values only.
+
+        The values of the column are scanned when its aggregates are
+        first requested and after the filter changes. Otherwise, the
+        aggregates are updated as records are inserted, deleted and
+        changed. Also see `show_footer`.
 
         Parameters:
 
-            index (Union[int, str]):
-                A numerical index that specifieds where to insert
-                the record in the dataset. You may also use the string
-                'end' to append the record to the end of the data set.
-                If the index exceeds the record count, it will be
-                appended to the end of the dataset.
+            index (int):
+                The numerical index of the column.
 
-            values (Iterable):
-                An iterable of values to insert into the data set.
-                The number of columns implied by the list of values
-                must match the number of columns in the data set for
-                the values to be visible.
+            cid (str):
+                A unique column identifier.
 
         Returns:
 
-            TableRow:
-                A table row object.
+            Dict[str, Any]:
+                The count, sum, min, max, mean and distinct count of
+                the values.
         """
-        rowcount = len(self._tablerows)
-
-        # validate the index
-        if len(values) == 0:
-            return
-        if index == END:
-            index = -1
-        elif index > rowcount - 1:
-            index = -1
-
-        record = TableRow(self, values)
-        if rowcount == 0 or index == -1:
-            self._tablerows.append(record)
+        if cid is not None:
+            column = self.cidmap[int(cid)]
         else:
-            self._tablerows.insert(index, record)
+            column = self.get_column(index=index)
+        if column not in self._aggcolumns:
+            self._aggcolumns.append(column)
+        aggregates = self._current_aggregates()
+        return aggregates.columns[self._aggcolumns.index(column)].result()
+
+    def show_footer(self, indices=None, cids=None):
+        """Show a footer below the table with the count, sum, minimum,
+        maximum, mean and distinct count of the values of columns over
+        the records in the current filter. The footer is refreshed
+        when the application is idle after the records change. Also
+        see `get_aggregates`.
 
-        return record
+        Parameters:
 
-    def insert_rows(self, index, rowdata):
-        """Insert row after index for each row in *row. If index does
-        not exist then the records are appended to the end of the table.
-        You can also use the string 'end' to append records at the end
-        of the table.
+            indices (List[int]):
+                The numerical indices of the columns.
 
-        Parameters:
+            cids (List[str]):
+                A list of unique column identifiers. If neither
+                indices nor cids is given, the visible columns are
+                shown.
+        """
+        if cids is not None:
+            columns = [self.cidmap[int(cid)] for cid in cids]
+        elif indices is not None:
+            columns = [self.get_column(index=index) for index in indices]
+        else:
+            columns = self.tablecolumns_visible
+        self.hide_footer()
+        self._footer = ttk.Frame(self)
+        self._footer.pack(fill=X, after=self.hbar)
+        self._footercolumns = list(columns)
+        self._footerlabels = []
+        for column in columns:
+            if column not in self._aggcolumns:
+                self._aggcolumns.append(column)
+            label = ttk.Label(self._footer)
+            label.pack(anchor=W, padx=5)
+            self._footerlabels.append(label)
+        self._schedule_footer()
+
+    def hide_footer(self):
+        """Remove the footer and stop maintaining the aggregates"""
+        if self._footer is None:
+            return
+        if self._footerjob is not None:
+            self.after_cancel(self._footerjob)
+            self._footerjob = None
+        self._footer.destroy()
+        self._footer = None
+        self._footercolumns = []
+        self._footerlabels = []
+        self._aggcolumns = []
+        self._aggregates = None
 
-            index (Union[int, str]):
-                The location in the data set after where the records
-                will be inserted. You may use a numerical index or
-                the string 'end', which will append the records to the
-                end of the data set.
+    @property
+    def groupcolumn(self):
+        """The column whose values group the records, or `None`. Also
+        see `group_by`."""
+        return self._groupby
+
+    def group_by(self, index=None, cid=None):
+        """Group the records in the current filter by the values of a
+        column. Each group is shown as a collapsible parent row with
+        the value and the number of records. The groups are in the
+        order of their first record, so sorting the table also orders
+        the groups. The records of a group are added to the view when
+        the group is first expanded. Not supported by a virtual table
+        or a table with a data provider.
 
-            rowdata (List[Any, List]):
-                A list of row values to be inserted into the table.
+        Parameters:
 
-        Examples:
+            index (int):
+                The numerical index of the column.
 
-            ```python
-            Tableview.insert_rows('end', ['one', 1], ['two', 2])
-            ```
+            cid (str):
+                A unique column identifier. If neither index nor cid
+                is given, the records are no longer grouped.
         """
-        if len(rowdata) == 0:
-            return
-        for values in reversed(rowdata):
-            self.insert_row(index, values)
+        if cid is not None:
+            column = self.cidmap[int(cid)]
+        elif index is not None:
+            column = self.get_column(index=index)
+        else:
+            column = None
+        self._set_group_column(column)
+        self._rowindex.set(0)
+        self.load_table_data()
 
     def delete_column(self, index=None, cid=None, visible=True):
         """Delete the specified column based on the column index or the
@@ -879,37 +3734,85 @@ class Tableview(ttk.Frame):
 
         If both indices and iids are None, then all records in the
         table will be deleted.
+
+        The records are removed from the data set in a single pass,
+        the `Treeview` items are deleted in a single call, and the
+        view is reloaded once, regardless of the number of records.
+
+        Parameters:
+
+            indices (List[int]):
+                A list of record indices. Also see `delete_row`.
+
+            iids (List[str]):
+                A list of unique record identifiers.
+
+            visible (bool):
+                Indicates that the record indices are relative to the
+                current records in view, otherwise, the original data
+                set index is used if False.
         """
         # remove records by iid
         if iids is not None:
-            for iid in iids:
-                self.delete_row(iid=iid)
+            records = [self.iidmap.get(iid) for iid in iids]
+            self._delete_table_rows([r for r in records if r is not None])
         # remove records by index
         elif indices is not None:
-            for index in indices:
-                self.delete_row(index=index, visible=visible)
+            if visible:
+                records = []
+                for index in indices:
+                    try:
+                        records.append(self.tablerows_visible[index])
+                    except IndexError:
+                        continue
+            else:
+                indices = set(indices)
+                records = [r for r in self.tablerows if r._sort in indices]
+            self._delete_table_rows(records)
         # remove ALL records
         else:
+            # detached records of other pages are deleted as well
+            records = set(self._iidmap)
+            self._cancel_pool_job()
+            self._dataversion += 1
+            self._keyindex = None
+            self._dirtyrows.clear()
+            self._aggregates = None
+            self._formatcache.clear()
+            if self._searchindex is not None:
+                self._searchindex.clear()
+            self._striped.clear()
             self._tablerows.clear()
             self._tablerows_filtered.clear()
             self._viewdata.clear()
             self._iidmap.clear()
-            records = self.view.get_children()
-            self.view.delete(*records)
+            if self._columnar:
+                self._store.clear()
+                self._rowiids.clear()
+            if self._virtual:
+                # keep the item pool; only the logical rows are removed
+                self._vrows = []
+                self._vslots.clear()
+                self._vselected.clear()
+                self.view.detach(*self._vpool)
+            else:
+                records.update(self.view.get_children())
+                self.view.delete(*records)
         # route to new page if no records visible
         if len(self._viewdata) == 0:
             self.goto_page()
 
     def insert_column(
-            self,
-            index,
-            text="",
-            image="",
-            command="",
-            anchor=W,
-            width=200,
-            minwidth=20,
-            stretch=False,
+        self,
+        index,
+        text="",
+        image="",
+        command="",
+        anchor=W,
+        width=200,
+        minwidth=20,
+        stretch=False,
+        formatter=None,
     ) -> TableColumn:
         """
         Parameters:
@@ -945,10 +3848,26 @@ class Tableview(ttk.Frame):
                 adjusted whenever the widget is resized or the user
                 drags the column separator.
 
+            formatter (Callable[[Any], str]):
+                A function that returns the text shown for a value of
+                the column, such as `'{:,.2f}'.format`. The records
+                keep the raw values, so the column is still sorted,
+                filtered and exported by value. Values are formatted
+                only when their record is shown in the view, and the
+                text is kept in a bounded cache. Blank values, `None`
+                and the empty string, are not formatted.
+
         Returns:
 
             TableColumn:
                 A table column object.
+
+        Examples:
+
+            ```python
+            price = "${:,.2f}".format
+            table.insert_column(END, "Price", anchor=E, formatter=price)
+            ```
         """
         self.reset_table()
         colcount = len(self.tablecolumns)
@@ -992,6 +3911,7 @@ class Tableview(ttk.Frame):
             width=width,
             minwidth=minwidth,
             stretch=stretch,
+            formatter=formatter,
         )
         self._tablecols.append(column)
         # must be called to show the header after initially creating it
@@ -1003,6 +3923,8 @@ class Tableview(ttk.Frame):
         for column in self._tablecols:
             column.restore_settings()
 
+        self._keyindex = None
+        self._reset_formatters()
         return column
 
     def purge_table_data(self):
@@ -1012,6 +3934,9 @@ class Tableview(ttk.Frame):
         The table will need to be completely rebuilt after using this
         method.
         """
+        if self._groupby is not None:
+            self.group_by()
+        self.hide_footer()
         self.delete_rows()
         self.cidmap.clear()
         self.tablecolumns.clear()
@@ -1019,27 +3944,49 @@ class Tableview(ttk.Frame):
 
     def unload_table_data(self):
         """Unload all data from the table"""
-        for row in self.tablerows_visible:
-            row.hide()
+        if self._virtual:
+            # the pooled items are rebound when the data is loaded
+            self._virtual_sync_selection()
+            self.tablerows_visible.clear()
+            return
+        self.view.set_children("")
         self.tablerows_visible.clear()
 
     def load_table_data(self, clear_filters=False):
         """Load records into the tableview.
 
+        The view is updated by comparing the records currently in the
+        view with the records of the target page. Only new records
+        are created, the records of the page are attached and ordered
+        with a single `Treeview` call, and stripes are added to or
+        removed from only the records whose stripe has changed.
+
         Parameters:
 
             clear_filters (bool):
                 Specifies that the table filters should be cleared
                 before loading the data into the view.
         """
+        self._selection = None
+        self._schedule_footer()
+        if self._provider is not None:
+            if clear_filters:
+                self.reset_table()
+            self._load_provider_page()
+            return
+
+        if self._groupby is not None:
+            if clear_filters:
+                self.reset_table()
+            self._load_groups()
+            return
+
         if len(self.tablerows) == 0:
             return
 
         if clear_filters:
             self.reset_table()
 
-        self.unload_table_data()
-
         if self._paginated:
             page_start = self._rowindex.get()
             page_end = self._rowindex.get() + self._pagesize.get()
@@ -1060,12 +4007,27 @@ class Tableview(ttk.Frame):
         pagelimit = self._pagelimit.get()
         self._pageindex.set(min([pagelimit, pageindex]))
 
-        for i, row in enumerate(rowdata):
-            if self._stripecolor is not None and i % 2 == 0:
-                row.show(True)
-            else:
-                row.show(False)
-            self._viewdata.append(row)
+        if self._virtual:
+            if not self._paginated:
+                # scroll the dataset directly rather than a copy
+                rowdata = (
+                    self._tablerows_filtered
+                    if self._filtered
+                    else self._tablerows
+                )
+            self._vrows = rowdata
+            self._virtual_bind()
+            return
+
+        for row in rowdata:
+            row.build()
+        iids = [row.iid for row in rowdata]
+        if list(self.view.get_children()) != iids:
+            self.view.set_children("", *iids)
+        self._update_row_stripes(iids)
+        self._viewdata[:] = rowdata
+        if self._dirtyrows:
+            self._flush_dirty_rows()
 
     def fill_empty_columns(self, fillvalue=""):
         """Fill empty columns with the fillvalue.
@@ -1083,6 +4045,14 @@ class Tableview(ttk.Frame):
         if rowcount == 0:
             return
         colcount = len(self._tablecols)
+        self._dataversion += 1
+        if self._searchindex is not None:
+            self._searchindex.clear()
+        if self._columnar:
+            self._store.extend_columns(colcount, fillvalue)
+            for row in self.iidmap.values():
+                row.refresh()
+            return
         for row in self._tablerows:
             var = colcount - len(row._values)
             if var <= 0:
@@ -1182,7 +4152,13 @@ class Tableview(ttk.Frame):
         elif filtered:
             return self._tablerows_filtered
         elif selected:
-            return [row for row in self._viewdata if row.iid in self.view.selection()]
+            if self._virtual:
+                self._virtual_sync_selection()
+                return [
+                    row for row in self._vrows if row.iid in self._vselected
+                ]
+            selected = self._get_selected_iid_set()
+            return [row for row in self._viewdata if row.iid in selected]
         else:
             return self._tablerows
 
@@ -1241,6 +4217,9 @@ class Tableview(ttk.Frame):
     # PAGE NAVIGATION
 
     def _select_first_visible_item(self):
+        if self._virtual:
+            self._virtual_select_slot(0)
+            return
         try:
             iid = self.tablerows_visible[0].iid
             self.view.selection_set(iid)
@@ -1261,6 +4240,11 @@ class Tableview(ttk.Frame):
 
     def goto_last_page(self):
         """Update table with the last page of data"""
+        if self._provider is not None:
+            self._rowindex.set(self._provider_last_offset())
+            self.load_table_data()
+            self._select_first_visible_item()
+            return
         pagelimit = self._pagelimit.get() - 1
         self._rowindex.set(self.pagesize * pagelimit)
         self.load_table_data()
@@ -1288,6 +4272,9 @@ class Tableview(ttk.Frame):
         """Go to a specific page indicated by the page entry widget."""
         pagelimit = self._pagelimit.get()
         pageindex = self._pageindex.get()
+        if self._provider is not None and self._provider.row_count() is None:
+            # the page is looked up when the number of pages is unknown
+            pagelimit = max(pageindex, 1)
         if pageindex > pagelimit:
             pageindex = pagelimit
             self._pageindex.set(pageindex)
@@ -1301,10 +4288,19 @@ class Tableview(ttk.Frame):
 
     # COLUMN SORTING
 
-    def sort_column_data(self, event=None, cid=None, sort=None):
+    def sort_column_data(
+        self, event=None, cid=None, sort=None, multisort=False
+    ):
         """Sort the table rows by the specified column. This method
         may be trigged by an event or manually.
 
+        The values are never converted; a column with values of more
+        than one datatype is ordered by datatype and then by value,
+        and blank values are placed together. The sort order of each
+        column is cached until the data changes, and sorting the same
+        column again in the opposite direction reverses the current
+        order.
+
         Parameters:
 
             event (Event):
@@ -1316,14 +4312,18 @@ class Tableview(ttk.Frame):
 
             sort (int):
                 Determines the sort direction. 0 = ASCENDING. 1 = DESCENDING.
+
+            multisort (bool):
+                If `True`, the column is added to the current sort as
+                the next sort key, or its direction is changed if it is
+                already sorted, rather than replacing the current sort.
+                Shift-clicking a column header sorts this way.
         """
         if event is not None:
             eo = self._get_event_objects(event)
             column = eo.column
-            index = column.tableindex
         elif cid is not None:
             column: TableColumn = self.cidmap.get(int(cid))
-            index = column.tableindex
         else:
             return
 
@@ -1336,35 +4336,62 @@ class Tableview(ttk.Frame):
         if sort is not None:
             columnsort = sort
         else:
-            columnsort = self.tablecolumns[index].columnsort
+            columnsort = column.columnsort
 
         if columnsort == ASCENDING:
-            self._tablecols[index].columnsort = DESCENDING
+            column.columnsort = DESCENDING
         else:
-            self._tablecols[index].columnsort = ASCENDING
+            column.columnsort = ASCENDING
 
-        try:
-            sortedrows = sorted(
-                tablerows, reverse=columnsort, key=lambda x: x.values[index]
-            )
-        except:
-            # when data is missing, or sometimes with numbers
-            # this is still not right, but it works most of the time
-            # fix sometime down the road when I have time
-            self.fill_empty_columns()
-            sortedrows = sorted(
-                tablerows, reverse=columnsort, key=lambda x: int(x.values[index])
-            )
+        if multisort:
+            sortorder = list(self._sortorder)
+            for i, (col, _) in enumerate(sortorder):
+                if col is column:
+                    sortorder[i] = (column, columnsort)
+                    break
+            else:
+                sortorder.append((column, columnsort))
+            sortorder = tuple(sortorder)
+        else:
+            sortorder = ((column, columnsort),)
+
+        if self._provider is not None:
+            keys = [(col.tableindex, bool(d)) for col, d in sortorder]
+            if not self._provider.sort(keys):
+                # the provider cannot sort
+                column.columnsort = columnsort
+                return
+            self._sortorder = sortorder
+            self._column_sort_header_set(sortorder)
+            self._rowindex.set(0)
+            self.load_table_data()
+            self._select_first_visible_item()
+            return
+
+        if self._use_pool(tablerows) and not self._sort_is_cached(
+            tablerows, sortorder
+        ):
+            self._sort_in_pool(tablerows, sortorder)
+            return
+        self._cancel_pool_job()
+        self._apply_sort(sortorder)
+
+    def _apply_sort(self, sortorder, sortedrows=None):
+        """Show the records in the sort order, sorting the records if
+        they are not given"""
+        self._sortorder = sortorder
+        if sortedrows is None:
+            if self.is_filtered:
+                tablerows = self.tablerows_filtered
+            else:
+                tablerows = self.tablerows
+            sortedrows = self._sort_table_rows(tablerows, sortorder)
         if self.is_filtered:
-            self._tablerows_filtered = sortedrows
+            self._replace_filtered_rows(sortedrows)
         else:
             self._tablerows = sortedrows
 
-        # update headers
-        self._column_sort_header_reset()
-        self._column_sort_header_update(column.cid)
-
-        self.unload_table_data()
+        self._column_sort_header_set(sortorder)
         self.load_table_data()
         self._select_first_visible_item()
 
@@ -1373,8 +4400,12 @@ class Tableview(ttk.Frame):
     def reset_row_filters(self):
         """Remove all row level filters; unhide all rows."""
         self._filtered = False
+        self._rowfilters = []
         self.searchcriteria = ""
-        self.unload_table_data()
+        if self._provider is not None:
+            self._provider.filter([])
+            self._provider.search("")
+            self._rowindex.set(0)
         self.load_table_data()
 
     def reset_column_filters(self):
@@ -1393,15 +4424,21 @@ class Tableview(ttk.Frame):
 
     def reset_table(self):
         """Remove all table data filters and column sorts"""
+        if self._provider is not None:
+            self._sortorder = ()
+            self._provider.sort([])
+            self.reset_column_filters()
+            self.reset_column_sort()
+            self._column_sort_header_reset()
+            self.reset_row_filters()
+            return
+        self._cancel_pool_job()
         self._filtered = False
+        self._rowfilters = []
         self.searchcriteria = ""
-        try:
-            sortedrows = sorted(self.tablerows, key=lambda x: x._sort)
-        except IndexError:
-            self.fill_empty_columns()
-            sortedrows = sorted(self.tablerows, key=lambda x: x._sort)
-        self._tablerows = sortedrows
-        self.unload_table_data()
+        self._sortorder = ()
+        self._lastsort = None
+        self._tablerows = self._rows_in_insert_order()
 
         # reset the columns
         self.reset_column_filters()
@@ -1410,6 +4447,178 @@ class Tableview(ttk.Frame):
         self._column_sort_header_reset()
         self.goto_first_page()  # needed?
 
+    def get_view_state(self):
+        """Return the state of the view; the sort order, the row
+        filters or search criteria, the order and visibility of the
+        columns, the width and alignment of each column, the group
+        column, and the page. The state contains only lists, strings,
+        numbers, booleans and `None`, so it can be saved as JSON, as
+        long as the values of the row filters can. The state is
+        restored with `set_view_state`.
+
+        Records that were hidden by `hide_selected_rows` or
+        `filter_to_selected_rows` are not part of the state, since
+        they are selected by hand rather than by criteria; they are
+        shown again when the state is restored.
+
+        Returns:
+
+            Dict[str, Any]:
+                The state of the view.
+
+        Examples:
+
+            ```python
+            with open("view.json", "w") as f:
+                json.dump(dt.get_view_state(), f)
+
+            with open("view.json") as f:
+                dt.set_view_state(json.load(f))
+            ```
+        """
+        columns = []
+        for column in self._tablecols:
+            cid = column.cid
+            columns.append(
+                {
+                    "cid": cid,
+                    "width": int(self.view.column(cid, "width")),
+                    "anchor": str(self.view.column(cid, "anchor")),
+                    "headinganchor": str(self.view.heading(cid, "anchor")),
+                }
+            )
+        filters = []
+        for rowfilter in self._rowfilters:
+            value = rowfilter.value
+            if rowfilter.predicate == "regex":
+                value = [value.pattern, value.flags]
+            elif rowfilter.predicate == "in":
+                value = list(value)
+            elif rowfilter.predicate == "range":
+                value = list(value)
+            filters.append(
+                [
+                    rowfilter.column.cid,
+                    rowfilter.predicate,
+                    value,
+                    rowfilter.invert,
+                ]
+            )
+        if self._filtered and not self._rowfilters:
+            search = self._searchcriteria.get()
+        else:
+            search = ""
+        return {
+            "sort": [
+                [column.cid, columnsort]
+                for column, columnsort in self._sortorder
+            ],
+            "filters": filters,
+            "search": search,
+            "displaycolumns": [
+                column.cid for column in self.tablecolumns_visible
+            ],
+            "columns": columns,
+            "groupby": None if self._groupby is None else self._groupby.cid,
+            "page": self._pageindex.get(),
+        }
+
+    def set_view_state(self, state):
+        """Restore a state of the view returned by `get_view_state`.
+        The sort order, row filters, columns and page are applied
+        together and the view is refreshed once. Keys missing from the
+        state are left unchanged, and columns that no longer exist are
+        ignored.
+
+        Parameters:
+
+            state (Dict[str, Any]):
+                The state of the view.
+        """
+        view = self.view
+        for settings in state.get("columns", ()):
+            column = self.cidmap.get(int(settings["cid"]))
+            if column is None:
+                continue
+            options = {
+                k: settings[k] for k in ("width", "anchor") if k in settings
+            }
+            if options:
+                view.column(column.cid, **options)
+            if "headinganchor" in settings:
+                view.heading(column.cid, anchor=settings["headinganchor"])
+
+        if "displaycolumns" in state:
+            cids = [
+                str(cid)
+                for cid in state["displaycolumns"]
+                if int(cid) in self.cidmap
+            ]
+            view.configure(displaycolumns=cids or ["#all"])
+
+        if "groupby" in state:
+            cid = state["groupby"]
+            column = None if cid is None else self.cidmap.get(int(cid))
+            self._set_group_column(column)
+
+        sortorder = self._sortorder
+        if "sort" in state:
+            sortorder = tuple(
+                (self.cidmap[int(cid)], columnsort)
+                for cid, columnsort in state["sort"]
+                if int(cid) in self.cidmap
+            )
+        rowfilters = self._rowfilters
+        if "filters" in state:
+            rowfilters = []
+            for cid, predicate, *args in state["filters"]:
+                if int(cid) not in self.cidmap:
+                    continue
+                if predicate == "regex" and args and isinstance(args[0], list):
+                    # the pattern and its flags
+                    args[0] = re.compile(*args[0])
+                rowfilters.append(
+                    RowFilter(self.cidmap[int(cid)], predicate, *args)
+                )
+        criteria = state.get("search", "")
+        if rowfilters:
+            criteria = ""
+
+        # restore the records; the search variable is set without
+        # starting a live search
+        self._cancel_pool_job()
+        self._searchcriteria.set(criteria)
+        self._cancel_live_search()
+        if "sort" in state or "filters" in state or "search" in state:
+            if self._provider is not None:
+                self._restore_provider_view(sortorder, rowfilters, criteria)
+            else:
+                self._restore_table_view(sortorder, rowfilters, criteria)
+            sortorder = self._sortorder
+            for column, columnsort in sortorder:
+                column.columnsort = (
+                    DESCENDING if columnsort == ASCENDING else ASCENDING
+                )
+            if sortorder:
+                self._column_sort_header_set(sortorder)
+            else:
+                self._column_sort_header_reset()
+
+        # the rows of the page, which is limited to the last page
+        rowindex = self._rowindex.get()
+        if "page" in state and self._paginated:
+            pagesize = self._pagesize.get()
+            rowindex = max(0, int(state["page"]) - 1) * pagesize
+            if self._provider is None:
+                if self._filtered:
+                    rowcount = len(self._tablerows_filtered)
+                else:
+                    rowcount = len(self._tablerows)
+                lastpage = max(1, ceil(rowcount / pagesize))
+                rowindex = min(rowindex, (lastpage - 1) * pagesize)
+        self._rowindex.set(rowindex)
+        self.load_table_data()
+
     def filter_column_to_value(self, event=None, cid=None, value=None):
         """Hide all records except for records where the current
         column exactly matches the provided value. This method may
@@ -1429,64 +4638,200 @@ class Tableview(ttk.Frame):
         """
         if event is not None:
             eo = self._get_event_objects(event)
-            index = eo.column.tableindex
-            value = value or eo.row.values[index]
+            column = eo.column
+            if eo.row is not None:
+                value = value or eo.row.values[column.tableindex]
+            else:
+                # a group row; only the grouped column has a value
+                group = self._groups.get(self.view.identify_row(event.y))
+                if group is None or column is not self._groupby:
+                    return
+                value = value or group[0]
         elif cid is not None:
             column: TableColumn = self.cidmap.get(cid)
-            index = column.tableindex
         else:
             return
 
-        self._filtered = True
-        self.tablerows_filtered.clear()
-        self.unload_table_data()
+        self.set_row_filters([RowFilter(column, "equals", value)])
 
-        for row in self.tablerows:
-            if row.values[index] == value:
-                self.tablerows_filtered.append(row)
+    @property
+    def row_filters(self):
+        """The stacked row filters applied to the table"""
+        return tuple(self._rowfilters)
 
-        self._rowindex.set(0)
-        self.load_table_data()
+    def add_row_filter(self, cid, predicate, value=None, invert=False):
+        """Add a filter to the stacked row filters and show only the
+        records that pass every filter. The new filter is evaluated
+        only on the records that are currently shown, so narrowing
+        the results is faster than filtering the whole table.
+
+        Parameters:
+
+            cid (int):
+                A unique column identifier; typically the numerical
+                index of the column within the original dataset.
+
+            predicate (str):
+                One of 'equals', 'in', 'range', 'regex', or 'null'.
+                See `RowFilter` for the meaning of each predicate.
+
+            value (Any):
+                The criteria of the predicate.
+
+            invert (bool):
+                If `True`, the filter hides the records that match
+                the predicate rather than showing them.
+
+        Returns:
+
+            RowFilter:
+                The row filter, which may be passed to
+                `remove_row_filter`.
+        """
+        column: TableColumn = self.cidmap.get(int(cid))
+        rowfilter = RowFilter(column, predicate, value, invert)
+        if self._provider is not None:
+            self.set_row_filters(self._rowfilters + [rowfilter])
+            return rowfilter
+        if self.is_filtered:
+            tablerows = self.tablerows_filtered
+        else:
+            tablerows = self.tablerows
+        self._apply_row_filters(
+            tablerows, [rowfilter], self._rowfilters + [rowfilter]
+        )
+        return rowfilter
+
+    def remove_row_filter(self, rowfilter):
+        """Remove a filter from the stacked row filters and filter all
+        records again with the remaining filters.
+
+        Parameters:
+
+            rowfilter (RowFilter):
+                A row filter returned by `add_row_filter`.
+        """
+        filters = [f for f in self._rowfilters if f is not rowfilter]
+        self.set_row_filters(filters)
+
+    def set_row_filters(self, filters):
+        """Replace the stacked row filters and filter all records. The
+        filters are evaluated a column at a time and their masks
+        combined, so stacking several filters costs little more than
+        a single filter. Any search or other row filter is replaced.
+
+        Parameters:
+
+            filters (Iterable[Union[RowFilter, Tuple]]):
+                The row filters. A filter may be given as a tuple of
+                the arguments of `add_row_filter`; (cid, predicate,
+                value, invert).
+        """
+        rowfilters = []
+        for rowfilter in filters:
+            if not isinstance(rowfilter, RowFilter):
+                cid, *args = rowfilter
+                rowfilter = RowFilter(self.cidmap.get(int(cid)), *args)
+            rowfilters.append(rowfilter)
+        if self._provider is not None:
+            if self._provider.filter(rowfilters):
+                self._rowfilters = rowfilters
+                self._filtered = len(rowfilters) > 0
+                self._rowindex.set(0)
+                self.load_table_data()
+            return
+        if not rowfilters:
+            self.reset_row_filters()
+            return
+        self._apply_row_filters(self._tablerows, rowfilters, rowfilters)
 
     def filter_to_selected_rows(self):
         """Hide all records except for the selected rows"""
-        criteria = self.view.selection()
+        if self._provider is not None:
+            return  # the records are filtered by the provider
+        criteria = self._get_selected_iid_set()
         if len(criteria) == 0:
             return  # nothing is selected
 
+        if self._virtual:
+            candidates = list(self._vrows)
+        else:
+            candidates = self.tablerows_visible
+
         if self.is_filtered:
-            for row in self.tablerows_visible:
-                if row.iid not in criteria:
-                    row.hide()
-                    self.tablerows_filtered.remove(row)
+            hidden = {row for row in candidates if row.iid not in criteria}
+            for row in hidden:
+                row.hide()
+            self._tablerows_filtered = self._row_list(
+                row for row in self._tablerows_filtered if row not in hidden
+            )
         else:
             self._filtered = True
-            self.tablerows_filtered.clear()
-            for row in self.tablerows_visible:
-                if row.iid in criteria:
-                    self.tablerows_filtered.append(row)
+            self._tablerows_filtered = self._row_list(
+                row for row in candidates if row.iid in criteria
+            )
         self._rowindex.set(0)
         self.load_table_data()
 
+    def select_all_rows(self):
+        """Select all records in view. In virtual mode, this selects
+        every logical record, including those that are scrolled out of
+        view."""
+        rows = self._vrows if self._virtual else self._viewdata
+        self._set_selected_iids([row.iid for row in rows])
+
+    def invert_selected_rows(self):
+        """Select the records in view that are not selected, and
+        unselect the records that are"""
+        selected = self._get_selected_iid_set()
+        rows = self._vrows if self._virtual else self._viewdata
+        self._set_selected_iids(
+            [row.iid for row in rows if row.iid not in selected]
+        )
+
+    def select_rows_by(self, predicate):
+        """Select the records in view whose values satisfy a predicate,
+        replacing the current selection.
+
+        Parameters:
+
+            predicate (Callable[[List[Any]], bool]):
+                Called with the values of each record.
+
+        Examples:
+
+            ```python
+            Tableview.select_rows_by(lambda values: values[2] > 100)
+            ```
+        """
+        rows = self._vrows if self._virtual else self._viewdata
+        self._set_selected_iids(
+            [row.iid for row in rows if predicate(row.values)]
+        )
+
     def hide_selected_rows(self):
         """Hide the currently selected rows"""
-        selected = self.view.selection()
-        view_cnt = len(self._viewdata)
+        selected = self._get_selected_iid_set()
+        if self._virtual:
+            candidates = self._vrows
+            view_cnt = len(self._vrows)
+            self._vselected.clear()
+        else:
+            candidates = self.tablerows_visible
+            view_cnt = len(self._viewdata)
+            self.view.detach(*selected)
+            self._selection = None
         hide_cnt = len(selected)
-        self.view.detach(*selected)
 
-        tablerows = []
-        for row in self.tablerows_visible:
-            if row.iid in selected:
-                tablerows.append(row)
+        hidden = {row for row in candidates if row.iid in selected}
 
         if not self.is_filtered:
             self._filtered = True
             self._tablerows_filtered = self.tablerows.copy()
 
-        for row in tablerows:
-            if self.is_filtered:
-                self.tablerows_filtered.remove(row)
+        self._tablerows_filtered = self._row_list(
+            row for row in self._tablerows_filtered if row not in hidden
+        )
 
         if hide_cnt == view_cnt:
             # assuming that if the count of the records on the page are
@@ -1546,124 +4891,226 @@ class Tableview(ttk.Frame):
 
     def export_all_records(self):
         """Export all records to a csv file"""
-        headers = [col.headertext for col in self.tablecolumns]
-        records = [row.values for row in self.tablerows]
-        self.save_data_to_csv(headers, records, self._delimiter)
+        self._export_to_file("all")
 
     def export_current_page(self):
         """Export records on current page to csv file"""
-        headers = [col.headertext for col in self.tablecolumns]
-        records = [row.values for row in self.tablerows_visible]
-        self.save_data_to_csv(headers, records, self._delimiter)
+        self._export_to_file("page")
 
     def export_current_selection(self):
         """Export rows currently selected to csv file"""
+        self._export_to_file("selection")
+
+    def export_records_in_filter(self):
+        """Export rows currently filtered to csv file"""
+        if not self.is_filtered:
+            return
+        self._export_to_file("filter")
+
+    def export_to_path(self, path, scope="all", delimiter=None, wait=True):
+        """Export records to a csv file without a file dialog.
+
+        The order of the records is taken when the export starts, so
+        changes to the table while the records are written do not
+        change which records are exported. When the table uses a data
+        provider, the records of the 'all' and 'filter' scopes are read
+        from the provider.
+
+        Parameters:
+
+            path (str):
+                The path of the csv file.
+
+            scope (str):
+                The records to export: 'all' records, the records in
+                the 'filter', the current 'page', or the 'selection'.
+                When the table is not filtered, the 'filter' scope
+                exports all records.
+
+            delimiter (str):
+                The character to use for delimiting the values. The
+                default is the delimiter of the table.
+
+            wait (bool):
+                If `True`, the records are written before returning.
+                Otherwise, the records are written in the background
+                with the progress shown in the pagination frame, where
+                the export can be cancelled. If writing fails, the
+                error is stored as `csv_error` and the
+                `<<CsvExportError>>` virtual event is generated.
+
+        Returns:
+
+            Union[int, None]:
+                The number of records written, when waiting.
+        """
         headers = [col.headertext for col in self.tablecolumns]
-        selected = self.view.selection()
-        records = []
-        for iid in selected:
-            record: TableRow = self.iidmap.get(iid)
-            records.append(record.values)
-        self.save_data_to_csv(headers, records, self._delimiter)
+        records, total, threaded = self._export_records(scope)
+        job = _CsvExport(
+            path, headers, records, total, delimiter or self._delimiter
+        )
+        if wait:
+            job.run()
+            if job.error is not None:
+                raise job.error
+            return job.written
+        self._csverror = None
+        self._start_export(job, threaded)
+
+    def _export_to_file(self, scope):
+        """Ask for the name of a csv file and export the records of the
+        scope in the background"""
+        from tkinter.filedialog import asksaveasfilename
+
+        filename = asksaveasfilename(**self._export_dialog_options())
+        if filename:
+            self.export_to_path(filename, scope, wait=False)
 
-    def export_records_in_filter(self):
-        """Export rows currently filtered to csv file"""
-        headers = [col.headertext for col in self.tablecolumns]
-        if not self.is_filtered:
-            return
-        records = [row.values for row in self.tablerows_filtered]
-        self.save_data_to_csv(headers, records, self._delimiter)
+    def _export_dialog_options(self):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return dict(
+            confirmoverwrite=True,
+            filetypes=[
+                ("CSV UTF-8 (Comma delimited)", "*.csv"),
+                ("All file types", "*.*"),
+            ],
+            defaultextension="csv",
+            initialfile=f"tabledata_{timestamp}.csv",
+        )
+
+    def _export_records(self, scope):
+        """Return an iterator of the values of the records of an export
+        scope, the number of records or `None` if not known, and whether
+        the records can be read from a worker thread."""
+        provider = self._provider
+        if scope in ("all", "filter") and provider is not None:
+            # a provider may not be usable from another thread, such
+            # as an sqlite3 connection
+            return provider.iter_rows(), provider.row_count(), False
+        if scope == "all":
+            tablerows = self.tablerows
+        elif scope == "filter":
+            tablerows = (
+                self.tablerows_filtered if self.is_filtered else self.tablerows
+            )
+        elif scope == "page":
+            tablerows = self.tablerows_visible
+        elif scope == "selection":
+            tablerows = [
+                self.iidmap.get(iid) for iid in self._get_selected_iids()
+            ]
+            tablerows = [row for row in tablerows if row is not None]
+        else:
+            raise ValueError(f"Unknown export scope: {scope!r}")
+        return self._get_records(tablerows), len(tablerows), True
+
+    def _get_records(self, tablerows):
+        """Return an iterator of the values of each row. The order of
+        the rows is copied when called, so later changes to the table
+        do not change which records are returned. Columnar records are
+        read directly from the columns of the store as they are when
+        called, so the records can be read from a worker thread while
+        columns are inserted or deleted."""
+        if self._columnar:
+            if isinstance(tablerows, _RowList):
+                rowids = array("q", tablerows.ids)
+            else:
+                rowids = array("q", [row._rowid for row in tablerows])
+            columns = list(self._store.columns)
+            return ([col[rowid] for col in columns] for rowid in rowids)
+        return (row.values for row in list(tablerows))
 
-    def save_data_to_csv(self, headers, records, delimiter=","):
-        """Save data records to a csv file.
+    def save_data_to_csv(self, headers, records, delimiter=",", wait=True):
+        """Save data records to a csv file. Also see `export_to_path`.
 
         Parameters:
 
             headers (List[str]):
                 A list of header labels.
 
-            records (List[Tuple[...]]):
-                A list of table records.
+            records (Iterable[Tuple[...]]):
+                An iterable of table records.
 
             delimiter (str):
                 The character to use for delimiting the values.
+
+            wait (bool):
+                If `True`, the records are written before returning.
+                Otherwise, the records are read and written in a worker
+                thread, so they must not be changed until the export
+                is done, with the progress shown in the pagination
+                frame.
         """
         from tkinter.filedialog import asksaveasfilename
-        import csv
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        initialfile = f"tabledata_{timestamp}.csv"
-        filetypes = [
-            ("CSV UTF-8 (Comma delimited)", "*.csv"),
-            ("All file types", "*.*"),
-        ]
-        filename = asksaveasfilename(
-            confirmoverwrite=True,
-            filetypes=filetypes,
-            defaultextension="csv",
-            initialfile=initialfile,
-        )
-        if filename:
-            with open(filename, "w", encoding="utf-8", newline="") as f:
-                writer = csv.writer(f, delimiter=delimiter)
-                writer.writerow(headers)
-                writer.writerows(records)
+        filename = asksaveasfilename(**self._export_dialog_options())
+        if not filename:
+            return
+        total = len(records) if hasattr(records, "__len__") else None
+        job = _CsvExport(filename, headers, records, total, delimiter)
+        if wait:
+            job.run()
+            if job.error is not None:
+                raise job.error
+        else:
+            self._csverror = None
+            self._start_export(job, threaded=True)
 
     # ROW MOVEMENT
 
     def move_selected_rows_to_top(self):
         """Move the selected rows to the top of the data set"""
-        selected = self.view.selection()
+        selected = self._get_selected_iids()
         if len(selected) == 0:
             return
 
         if self.is_filtered:
-            tablerows = self.tablerows_filtered.copy()
+            tablerows = self.tablerows_filtered
         else:
-            tablerows = self.tablerows.copy()
+            tablerows = self.tablerows
 
-        for i, iid in enumerate(selected):
-            row = self.iidmap.get(iid)
-            tablerows.remove(row)
-            tablerows.insert(i, row)
+        moved = [self.iidmap.get(iid) for iid in selected]
+        members = set(moved)
+        tablerows = self._row_list(
+            moved + [row for row in tablerows if row not in members]
+        )
 
         if self.is_filtered:
-            self._tablerows_filtered = tablerows
+            self._replace_filtered_rows(tablerows)
         else:
             self._tablerows = tablerows
 
         # refresh the table data
-        self.unload_table_data()
         self.load_table_data()
 
     def move_selected_rows_to_bottom(self):
         """Move the selected rows to the bottom of the dataset"""
-        selected = self.view.selection()
+        selected = self._get_selected_iids()
         if len(selected) == 0:
             return
 
         if self.is_filtered:
-            tablerows = self.tablerows_filtered.copy()
+            tablerows = self.tablerows_filtered
         else:
-            tablerows = self.tablerows.copy()
+            tablerows = self.tablerows
 
-        for iid in selected:
-            row = self.iidmap.get(iid)
-            tablerows.remove(row)
-            tablerows.append(row)
+        moved = [self.iidmap.get(iid) for iid in selected]
+        members = set(moved)
+        tablerows = self._row_list(
+            [row for row in tablerows if row not in members] + moved
+        )
 
         if self.is_filtered:
-            self._tablerows_filtered = tablerows
+            self._replace_filtered_rows(tablerows)
         else:
             self._tablerows = tablerows
 
         # refresh the table data
-        self.unload_table_data()
         self.load_table_data()
 
     def move_selected_row_up(self):
         """Move the selected rows up one position in the dataset"""
-        selected = self.view.selection()
+        selected = self._get_selected_iids()
         if len(selected) == 0:
             return
 
@@ -1672,24 +5119,29 @@ class Tableview(ttk.Frame):
         else:
             tablerows = self.tablerows.copy()
 
-        for iid in selected:
-            row = self.iidmap.get(iid)
-            index = tablerows.index(row) - 1
-            tablerows.remove(row)
-            tablerows.insert(index, row)
+        # each selected row changes places with the unselected row
+        # above it, in a single pass
+        members = {self.iidmap.get(iid) for iid in selected}
+        for index in range(1, len(tablerows)):
+            row = tablerows[index]
+            if row in members and tablerows[index - 1] not in members:
+                tablerows[index - 1], tablerows[index] = (
+                    row,
+                    tablerows[index - 1],
+                )
 
         if self.is_filtered:
-            self._tablerows_filtered = tablerows
+            self._replace_filtered_rows(tablerows)
         else:
             self._tablerows = tablerows
+            self._dataversion += 1
 
         # refresh the table data
-        self.unload_table_data()
         self.load_table_data()
 
     def move_row_down(self):
         """Move the selected rows down one position in the dataset"""
-        selected = self.view.selection()
+        selected = self._get_selected_iids()
         if len(selected) == 0:
             return
 
@@ -1698,19 +5150,24 @@ class Tableview(ttk.Frame):
         else:
             tablerows = self._tablerows
 
-        for iid in selected:
-            row = self.iidmap.get(iid)
-            index = tablerows.index(row) + 1
-            tablerows.remove(row)
-            tablerows.insert(index, row)
+        # each selected row changes places with the unselected row
+        # below it, in a single pass
+        members = {self.iidmap.get(iid) for iid in selected}
+        for index in range(len(tablerows) - 2, -1, -1):
+            row = tablerows[index]
+            if row in members and tablerows[index + 1] not in members:
+                tablerows[index + 1], tablerows[index] = (
+                    row,
+                    tablerows[index + 1],
+                )
 
         if self._filtered:
-            self._tablerows_filtered = tablerows
+            self._replace_filtered_rows(tablerows)
         else:
             self._tablerows = tablerows
+            self._dataversion += 1
 
         # refresh the table data
-        self.unload_table_data()
         self.load_table_data()
 
     # COLUMN MOVEMENT
@@ -1867,27 +5324,59 @@ class Tableview(ttk.Frame):
                 kw["foreground"] = fg
             self.view.tag_configure("striped", **kw)
 
-    def autofit_columns(self):
-        """Autofit all columns in the current view"""
+    def autofit_columns(self, sample=None):
+        """Autofit all columns in the current view.
+
+        Text is measured from a cached table of the character widths
+        of the font, and the width of the values of each column is
+        kept until the records in view or their values change.
+
+        Parameters:
+
+            sample (int):
+                If set, only this number of the longest distinct
+                values of each column are measured.
+        """
         f = font.nametofont("TkDefaultFont")
+        scaling = self.tk.call("tk", "scaling")
+        textmeasure = _TextMeasure.for_font(f, self._textmeasures, scaling)
+        measure = textmeasure.measure
         pad = utility.scale_size(self, 20)
-        col_widths = []
+        rows = tuple(self.tablerows_visible)
+        if self._columnar:
+            records = [row._rowid for row in rows]
+        else:
+            records = rows
 
-        # measure header sizes
         for col in self.tablecolumns:
-            width = f.measure(f"{col._headertext} {DOWNARROW}") + pad
-            col_widths.append(width)
-
-        for row in self.tablerows_visible:
-            values = row.values
-            for i, value in enumerate(values):
-                old_width = col_widths[i]
-                new_width = f.measure(str(value)) + pad
-                width = max(old_width, new_width)
-                col_widths[i] = width
-
-        for i, width in enumerate(col_widths):
-            self.view.column(i, width=width)
+            index = col.tableindex
+            cache = col._autofitcache
+            if cache and cache[:4] == (
+                self._dataversion,
+                sample,
+                rows,
+                textmeasure,
+            ):
+                width = cache[4]
+            else:
+                values = self._column_values(index, records)
+                if col._formatter is not None:
+                    values = [
+                        self._format_value(col._formatter, v) for v in values
+                    ]
+                texts = set(map(str, values))
+                if sample is not None and len(texts) > sample:
+                    texts = nlargest(sample, texts, key=len)
+                width = max(map(measure, texts), default=0)
+                col._autofitcache = (
+                    self._dataversion,
+                    sample,
+                    rows,
+                    textmeasure,
+                    width,
+                )
+            header = measure(f"{col._headertext} {DOWNARROW}")
+            self.view.column(index, width=max(width, header) + pad)
 
     # COLUMN AND HEADER ALIGNMENT
 
@@ -2034,27 +5523,1275 @@ class Tableview(ttk.Frame):
         col = self.view.identify_column(event.x)
         cid = int(self.view.column(col, "id"))
         column: TableColumn = self.cidmap.get(cid)
-        row: TableRow = self.iidmap.get(iid)
+        if self._virtual:
+            row: TableRow = self._vslots.get(iid)
+        else:
+            row: TableRow = self.iidmap.get(iid)
         data = TableEvent(column, row)
         return data
 
-    def _search_table_data(self, _):
+    def _search_table_data(self, _=None):
         """Search the table data for records that meet search criteria.
         Currently, this search locates any records that contain the
         specified text; it is also case insensitive.
         """
         criteria = self._searchcriteria.get()
+        if self._provider is not None:
+            self._cancel_live_search()
+            if self._provider.search(criteria):
+                self._filtered = bool(criteria) or len(self._rowfilters) > 0
+                self._rowindex.set(0)
+                self.load_table_data()
+            return
+        self._rowfilters = []
+        if self._searchindex is not None:
+            self._cancel_live_search()
+            steps = self._search_index_steps(criteria)
+            while True:
+                try:
+                    next(steps)
+                except StopIteration as done:
+                    self._show_search_results(done.value)
+                    return
+        if self._use_pool(self._tablerows):
+            self._search_in_pool(criteria)
+            return
+        self._cancel_pool_job()
         self._filtered = True
-        self.tablerows_filtered.clear()
-        self.unload_table_data()
+        self._tablerows_filtered = self._search_rows(criteria)
+        self._rowindex.set(0)
+        self.load_table_data()
+
+    def _search_rows(self, criteria):
+        """Return the records that contain the search criteria, in
+        the order of the records"""
+        if self._searchindex is not None:
+            steps = self._search_index_steps(criteria)
+            while True:
+                try:
+                    next(steps)
+                except StopIteration as done:
+                    matches = done.value
+                    break
+            if self._columnar:
+                return _RowList(self, matches)
+            return list(matches)
+        if self._columnar:
+            return _RowList(
+                self, self._store.search(self._tablerows.ids, criteria)
+            )
+        criteria = str(criteria).lower()
+        tablerows = []
         for row in self.tablerows:
             for col in row.values:
-                if str(criteria).lower() in str(col).lower():
-                    self.tablerows_filtered.append(row)
+                if criteria in str(col).lower():
+                    tablerows.append(row)
                     break
+        return tablerows
+
+    # PRIVATE METHODS - DATA PROVIDER
+
+    def _load_provider_page(self):
+        """Fetch the records of the current page from the provider and
+        replace the records of the previous page."""
+        provider = self._provider
+        pagesize = self._pagesize.get()
+        offset = self._rowindex.get()
+        rowdata = provider.fetch(offset, pagesize)
+        if len(rowdata) == 0 and offset > 0:
+            # beyond the last record
+            offset = self._provider_last_offset()
+            self._rowindex.set(offset)
+            rowdata = provider.fetch(offset, pagesize)
+
+        rowcount = provider.row_count()
+        if rowcount is None:
+            # a full page may be followed by more records
+            rowcount = offset + len(rowdata) + (len(rowdata) == pagesize)
+        self._pagelimit.set(max(1, ceil(rowcount / pagesize)))
+        self._pageindex.set(offset // pagesize + 1)
+
+        previous = [row.iid for row in self._tablerows if row._iid is not None]
+        for iid in previous:
+            self._iidmap.pop(iid, None)
+        self._striped.difference_update(previous)
+        records = [TableRow(self, values) for values in rowdata]
+        self._tablerows = records
+        self._dataversion += 1
+        self._keyindex = None
+        self._aggregates = None
+        self._dirtyrows.clear()
+
+        if self._virtual:
+            self._vselected.clear()
+            self._vslots.clear()
+            self._vrows = records
+            self._virtual_bind()
+            return
+
+        for row in records:
+            row.build()
+        iids = [row.iid for row in records]
+        self.view.set_children("", *iids)
+        if previous:
+            self.view.delete(*previous)
+        self._update_row_stripes(iids)
+        self._viewdata[:] = records
+
+    def _poll_csv_index(self, provider):
+        """Update the page count and progress while a csv file is
+        being indexed, and fill the current page if it is not full."""
+        if self._provider is not provider:
+            return
+        progress = provider.progress
+        pagesize = self._pagesize.get()
+        if len(self._tablerows) < pagesize:
+            self._load_provider_page()
+        else:
+            self._pagelimit.set(max(1, ceil(provider.row_count() / pagesize)))
+        if progress is None:
+            self._hide_progress()
+            return
+        text = MessageCatalog.translate("Indexing")
+        self._update_progress(progress, f"{text} {provider.row_count():,}")
+        self.after(100, self._poll_csv_index, provider)
+
+    def _poll_csv_import(self, job):
+        """Append the chunks of records that have been read by a csv
+        import, for up to 50ms at a time, and refresh the view when the
+        current page is not yet full."""
+        if self._csvimport is not job:
+            return
+        start = perf_counter()
+        first = not self._tablecols
+        loaded = done = False
+        while perf_counter() - start < 0.05:
+            try:
+                item = job.queue.get_nowait()
+            except Empty:
+                break
+            if item is None:
+                done = True
+                break
+            rows, fraction = item
+            if not self._tablecols:
+                if job.header:
+                    names = rows.pop(0)
+                else:
+                    names = [f"Column {i + 1}" for i in range(len(rows[0]))]
+                for index, name in enumerate(names):
+                    self.insert_column(index, name)
+            self._insert_table_rows(END, rows)
+            loaded = True
+            text = MessageCatalog.translate("Loading")
+            self._update_progress(fraction, f"{text} {len(self._tablerows):,}")
+            if first:
+                # show the first page as soon as possible
+                break
+
+        if loaded or done:
+            pagesize = self._pagesize.get()
+            if (
+                first
+                or done
+                or self._virtual
+                or (self._paginated and len(self._viewdata) < pagesize)
+            ):
+                self.load_table_data()
+                if first and self._autofit:
+                    self.autofit_columns()
+                if first and self._autoalign:
+                    self.autoalign_columns()
+            elif self._paginated:
+                rowcount = len(
+                    self._tablerows_filtered
+                    if self._filtered
+                    else self._tablerows
+                )
+                self._pagelimit.set(ceil(rowcount / pagesize))
+
+        if done:
+            self._csvimport = None
+            self._hide_progress()
+            if job.error is not None:
+                # raising here would be lost in the event loop
+                self._csverror = job.error
+                self.event_generate("<<CsvImportError>>")
+            return
+        self.after(1 if job.queue.qsize() else 50, self._poll_csv_import, job)
+
+    def _start_export(self, job, threaded):
+        """Write the records of an export in the background, in a
+        worker thread or in slices of the event loop"""
+        self._show_progress(MessageCatalog.translate("Exporting"), job.cancel)
+        if threaded:
+            threading.Thread(target=job.run, daemon=True).start()
+        self._poll_export(job, threaded)
+
+    def _poll_export(self, job, threaded):
+        """Update the progress of an export, writing the next records
+        for up to 50ms when the export is not threaded"""
+        if not threaded:
+            start = perf_counter()
+            while not job.done and perf_counter() - start < 0.05:
+                job.step()
+        if job.done:
+            self._hide_progress()
+            if job.error is not None:
+                # raising here would be lost in the event loop
+                self._csverror = job.error
+                self.event_generate("<<CsvExportError>>")
+            return
+        fraction = job.written / job.total if job.total else 0
+        text = MessageCatalog.translate("Exporting")
+        self._update_progress(fraction, f"{text} {job.written:,}")
+        self.after(100 if threaded else 1, self._poll_export, job, threaded)
+
+    def _cancel_csv_import(self):
+        """Stop loading a csv file, keeping the records loaded so far"""
+        job = self._csvimport
+        if job is None:
+            return
+        job.cancel()
+        self._csvimport = None
+        self._hide_progress()
+        self.load_table_data()
+
+    def _provider_last_offset(self):
+        """Return the offset of the last page of the provider. When the
+        number of records is not known, pages are fetched until the
+        last page is found."""
+        provider = self._provider
+        pagesize = self._pagesize.get()
+        offset = self._rowindex.get()
+        if offset > 0 and len(provider.fetch(offset, 1)) == 0:
+            offset = 0
+        while provider.row_count() is None:
+            if len(provider.fetch(offset + pagesize, pagesize)) == 0:
+                return offset
+            offset += pagesize
+        pagelimit = max(1, ceil(provider.row_count() / pagesize))
+        return (pagelimit - 1) * pagesize
+
+    # PRIVATE METHODS - CELL UPDATES
+
+    def _row_key(self, row, position):
+        """Return the value of a record in the key column"""
+        if self._columnar:
+            rowid = row if isinstance(row, int) else row._rowid
+            return self._store.get_value(rowid, position)
+        values = row._values
+        return values[position] if position < len(values) else None
+
+    def _lookup_key(self, key):
+        """Return the record, or the rowid of a columnar record, with
+        the key, building the index of keys if needed"""
+        if self._keyindex is None:
+            position = self._keycolumn.tableindex
+            if self._columnar:
+                rows = self._tablerows.ids
+            else:
+                rows = self._tablerows
+            values = self._column_values(position, rows)
+            self._keyindex = (position, dict(zip(values, rows)))
+        position, keys = self._keyindex
+        row = keys.get(key)
+        if row is None or self._row_key(row, position) != key:
+            # the key of the record has changed
+            return None
+        return row
+
+    def _flush_dirty_rows(self):
+        """Update the items of the changed records that are in view.
+        Changed records that are not in view stay marked until they are
+        loaded into the view."""
+        if self._flushjob is not None:
+            # the timer is not needed when the view is updated directly
+            self.after_cancel(self._flushjob)
+            self._flushjob = None
+        dirty = self._dirtyrows
+        if not dirty:
+            return
+        if self._virtual:
+            # records scrolled into view are drawn from their values
+            for row in dirty:
+                item = self._virtual_slot(row)
+                if item is not None:
+                    self.view.item(item, values=self._display_values(row))
+            dirty.clear()
+            return
+        for row in self._viewdata:
+            if row in dirty:
+                dirty.discard(row)
+                if row._iid is not None:
+                    self.view.item(row.iid, values=self._display_values(row))
+
+    # PRIVATE METHODS - FORMATTERS
+
+    def _display_values(self, row):
+        """Return the values of a record as shown in the view, with the
+        values of columns that have a formatter replaced by their text.
+        The text is cached by record and column, and is reused for as
+        long as the value of the cell is unchanged."""
+        formatters = self._formatters
+        if formatters is None:
+            formatters = self._formatters = [
+                (column.tableindex, column._formatter)
+                for column in self._tablecols
+                if column._formatter is not None
+            ]
+        if not formatters:
+            return row.values
+        values = list(row.values)
+        size = len(values)
+        key = row._rowid if self._columnar else row
+        cache = self._formatcache
+        for position, formatter in formatters:
+            if position >= size:
+                continue
+            value = values[position]
+            entry = cache.get((key, position))
+            if (
+                entry is not None
+                and type(entry[0]) is type(value)
+                and entry[0] == value
+            ):
+                cache.move_to_end((key, position))
+                values[position] = entry[1]
+                continue
+            text = self._format_value(formatter, value)
+            cache[(key, position)] = (value, text)
+            if len(cache) > self.FORMATCACHESIZE:
+                cache.popitem(last=False)
+            values[position] = text
+        return values
+
+    @staticmethod
+    def _format_value(formatter, value):
+        """Format a value that is not blank"""
+        if value is None or value == "":
+            return value
+        return formatter(value)
+
+    def _reset_formatters(self):
+        """Discard the formatted text after a formatter or the columns
+        have changed, and update the records in view. Other records
+        are updated when they are next shown."""
+        self._formatters = None
+        self._formatcache.clear()
+        if self._virtual:
+            self._dirtyrows.update(self._vslots.values())
+        else:
+            self._dirtyrows.update(self._iidmap.values())
+        if self._dirtyrows and self._flushjob is None:
+            self._flushjob = self.after(16, self._flush_dirty_rows)
+
+    # PRIVATE METHODS - AGGREGATES
+
+    def _current_aggregates(self):
+        """Return the aggregates of the tracked columns over the
+        records in the current filter. The records are only scanned
+        when the filter or the tracked columns have changed."""
+        source = self._tablerows_filtered if self._filtered else None
+        positions = tuple(column.tableindex for column in self._aggcolumns)
+        aggregates = self._aggregates
+        if (
+            aggregates is not None
+            and aggregates.source is source
+            and aggregates.positions == positions
+        ):
+            return aggregates
+        aggregates = _Aggregates(positions, source)
+        self._add_records(
+            aggregates, self._tablerows if source is None else source
+        )
+        self._aggregates = aggregates
+        return aggregates
+
+    def _row_list(self, rows):
+        """Return the records in a new list of the kind used by the
+        table; a `_RowList` in a column store."""
+        if self._columnar:
+            return _RowList(self, [row._rowid for row in rows])
+        return list(rows)
+
+    def _replace_filtered_rows(self, tablerows):
+        """Replace the filtered records with the same records in a new
+        list, such as after they are sorted, while keeping the
+        aggregates of the filtered records."""
+        aggregates = self._aggregates
+        if (
+            aggregates is not None
+            and aggregates.source is self._tablerows_filtered
+        ):
+            aggregates.source = tablerows
+        self._tablerows_filtered = tablerows
+
+    def _untrack_aggregates(self, column):
+        """Stop maintaining the aggregates of a column that is being
+        deleted"""
+        self._aggregates = None
+        if column in self._aggcolumns:
+            self._aggcolumns.remove(column)
+        if column in self._footercolumns:
+            columns = [c for c in self._footercolumns if c is not column]
+            self.show_footer(cids=[c.cid for c in columns])
+
+    def _schedule_footer(self):
+        """Refresh the footer once the application is idle"""
+        if self._footer is not None and self._footerjob is None:
+            self._footerjob = self.after_idle(self._update_footer)
+
+    def _update_footer(self):
+        """Show the aggregates of the footer columns"""
+        self._footerjob = None
+        if self._footer is None or not self._footercolumns:
+            return
+        aggregates = self._current_aggregates()
+        for label, column in zip(self._footerlabels, self._footercolumns):
+            result = aggregates.columns[
+                self._aggcolumns.index(column)
+            ].result()
+            translate = MessageCatalog.translate
+            text = "   ".join(
+                f"{translate(name)} {self._format_aggregate(value)}"
+                for name, value in result.items()
+                if value is not None
+            )
+            label.configure(text=f"{column.headertext}:   {text}")
+
+    @staticmethod
+    def _format_aggregate(value):
+        """Format an aggregate for the footer"""
+        if isinstance(value, float):
+            return f"{value:,.6g}"
+        if isinstance(value, int) and not isinstance(value, bool):
+            return f"{value:,}"
+        return str(value)
+
+    # PRIVATE METHODS - GROUPS
+
+    def _set_group_column(self, column):
+        """Group the records by the column, or ungroup them if the
+        column is `None`, without loading the view"""
+        if column is not None and (
+            self._virtual or self._provider is not None
+        ):
+            raise ValueError(
+                "Records cannot be grouped in a virtual table or a table "
+                "with a data provider"
+            )
+        self._clear_groups()
+        self._groupsopen.clear()
+        self._groupby = column
+        if column is None:
+            self.view.configure(show=HEADINGS)
+        else:
+            self.view.configure(show=TREEHEADINGS)
+            self.view.heading("#0", text=column.headertext, anchor=W)
+
+    def _load_groups(self):
+        """Show a collapsed parent row for each group of the records in
+        the current filter. The groups that were expanded are expanded
+        again."""
+        self._clear_groups()
+        self.view.set_children("")
+        self._viewdata.clear()
+        self._update_row_stripes([])
+        self._pagelimit.set(1)
+        self._pageindex.set(1)
+
+        records = (
+            self._tablerows_filtered if self._filtered else self._tablerows
+        )
+        index = self._groupby.tableindex
+        if self._columnar:
+            values = self._column_values(index, records.ids)
+        else:
+            values = self._column_values(index, records)
+        groups = {}
+        for value, row in zip(values, records):
+            members = groups.get(value)
+            if members is None:
+                groups[value] = [row]
+            else:
+                members.append(row)
+
+        for value, members in groups.items():
+            label = "" if value is None else value
+            parent = self.view.insert(
+                "", END, text=f"{label} ({len(members)})"
+            )
+            # the placeholder shows the indicator of a collapsed group
+            placeholder = self.view.insert(parent, END)
+            self._groups[parent] = [value, members, placeholder]
+            if value in self._groupsopen:
+                self._expand_group(parent)
+                self.view.item(parent, open=True)
+
+    def _expand_group(self, parent):
+        """Create the records of a group and show them in place of its
+        placeholder item"""
+        group = self._groups.get(parent)
+        if group is None or group[2] is None:
+            return
+        members = group[1]
+        for row in members:
+            row.build()
+        self.view.set_children(parent, *[row.iid for row in members])
+        self.view.delete(group[2])
+        group[2] = None
+        self._viewdata.extend(members)
+        if self._dirtyrows:
+            self._flush_dirty_rows()
+
+    def _clear_groups(self):
+        """Remove the parent rows of the groups from the view. The
+        records of the groups are detached rather than deleted."""
+        if not self._groups:
+            return
+        for parent, group in self._groups.items():
+            if group[2] is None:
+                self.view.set_children(parent)
+        self.view.delete(*self._groups)
+        self._groups.clear()
+        self._selection = None
+
+    def _open_group(self, _):
+        """Callback for expanding a group"""
+        parent = self.view.focus()
+        group = self._groups.get(parent)
+        if group is not None:
+            self._groupsopen.add(group[0])
+            self._expand_group(parent)
+
+    def _close_group(self, _):
+        """Callback for collapsing a group"""
+        group = self._groups.get(self.view.focus())
+        if group is not None:
+            self._groupsopen.discard(group[0])
+
+    # PRIVATE METHODS - WORKER POOL
+
+    def _use_pool(self, tablerows):
+        """Return `True` if the records are processed in the worker pool"""
+        return (
+            self._workerpool is not None
+            and len(tablerows) >= self.POOLTHRESHOLD
+        )
+
+    def _sort_is_cached(self, tablerows, sortorder):
+        """Return `True` if the records can be sorted from the cached
+        sort orders rather than sorted again"""
+        last = self._lastsort
+        if (
+            last is not None
+            and last[0] is tablerows
+            and last[1] == self._dataversion
+        ):
+            return True
+        if len(sortorder) == 1:
+            cache = sortorder[0][0]._sortcache
+            return cache is not None and cache[0] == self._dataversion
+        return False
+
+    def _sort_in_pool(self, tablerows, sortorder):
+        """Sort the records in the worker pool"""
+        keys = []
+        for column, columnsort in sortorder:
+            cache = column._datatype
+            if cache is not None and cache[0] == self._dataversion:
+                datatype = cache[1]
+            else:
+                # inferred by the worker from the values
+                datatype = None
+            keys.append((column.tableindex, datatype, bool(columnsort)))
+        records = array("q", tablerows.ids)
+
+        def finish(data):
+            sortedrows = _RowList(self)
+            sortedrows.ids.frombytes(data)
+            self._lastsort = (sortedrows, self._dataversion, sortorder)
+            self._apply_sort(sortorder, sortedrows)
+
+        self._start_pool_job(
+            MessageCatalog.translate("Sorting"),
+            _pool_sort,
+            records,
+            {position for position, _, _ in keys},
+            [(0, len(records))],
+            len(records) * 8,
+            (keys,),
+            finish,
+            partial(self._apply_sort, sortorder),
+        )
+
+    def _filter_in_pool(self, tablerows, filters, finish):
+        """Filter the records in the worker pool"""
+        records = array("q", tablerows.ids)
+        # filtering the filtered records
+        subset = tablerows is not self._tablerows
+        criteria = [
+            (f.column.tableindex, f.predicate, f.value, f.invert)
+            for f in filters
+        ]
+        rowfilters = list(filters)
+
+        def collect(mask):
+            finish(self._masked_rows(records, mask))
+
+        def fallback():
+            # the same records as the job, from the current data
+            if subset and self._filtered:
+                rows = self._tablerows_filtered
+            else:
+                rows = self._tablerows
+            finish(self._filter_table_rows(rows, rowfilters))
+
+        self._start_pool_job(
+            MessageCatalog.translate("Filtering"),
+            _pool_filter,
+            records,
+            {position for position, *_ in criteria},
+            self._workerpool.chunks(len(records)),
+            len(records),
+            (criteria,),
+            collect,
+            fallback,
+        )
+
+    def _search_in_pool(self, criteria):
+        """Search the records in the worker pool"""
+        records = array("q", self._tablerows.ids)
+
+        def show(tablerows):
+            self._filtered = True
+            self._tablerows_filtered = tablerows
+            self._rowindex.set(0)
+            self.load_table_data()
+
+        def finish(mask):
+            show(self._masked_rows(records, mask))
+
+        def fallback():
+            show(
+                _RowList(
+                    self, self._store.search(self._tablerows.ids, criteria)
+                )
+            )
+
+        self._start_pool_job(
+            MessageCatalog.translate("Searching"),
+            _pool_search,
+            records,
+            range(self._store.colcount),
+            self._workerpool.chunks(len(records)),
+            len(records),
+            (str(criteria).lower(),),
+            finish,
+            fallback,
+        )
+
+    def _masked_rows(self, records, mask):
+        """Return the records selected by a mask of bytes"""
+        if numpy is not None and len(records) > 0:
+            rowids = numpy.frombuffer(records, dtype="q")
+            rows = _RowList(self)
+            rows.ids.frombytes(
+                rowids[numpy.frombuffer(mask, dtype=bool)].tobytes()
+            )
+            return rows
+        return _RowList(self, compress(records, mask))
+
+    def _start_pool_job(
+        self,
+        text,
+        function,
+        records,
+        positions,
+        chunks,
+        size,
+        args,
+        finish,
+        fallback,
+    ):
+        """Run a task in the worker pool for each chunk of the records,
+        cancelling the job that is running. The busy cursor and the
+        progress are shown until the job is done."""
+        self._cancel_pool_job()
+        pool = self._workerpool
+        version = self._pool_version(positions)
+        edits = self._columnedits
+        specs = {
+            p: pool.share_column(
+                self._store, p, (self._dataversion, edits.get(p, 0))
+            )
+            for p in positions
+        }
+        rowids = pool.share(records)
+        result = pool.block(size)
+        futures = [
+            pool.submit(
+                function,
+                (version, specs),
+                rowids.name,
+                result.name,
+                start,
+                stop,
+                *args,
+            )
+            for start, stop in chunks
+        ]
+        self._pooljob = _PoolJob(
+            futures,
+            [rowids, result],
+            size,
+            positions,
+            version,
+            finish,
+            fallback,
+        )
+        self.view.configure(cursor="watch")
+        self._show_progress(text, self._cancel_pool_job)
+        self.after(20, self._poll_pool_job, self._pooljob)
+
+    def _poll_pool_job(self, job):
+        """Show the progress of a job in the worker pool and its result
+        when it is done. If the job failed, such as when a worker
+        process was terminated, the operation is done in this thread."""
+        if job is not self._pooljob:
+            # cancelled or replaced by a newer job
+            return
+        done = job.done
+        if done < len(job.futures):
+            self._update_progress(done / len(job.futures))
+            self.after(20, self._poll_pool_job, job)
+            return
+        self._pooljob = None
+        self.view.configure(cursor="")
+        self._hide_progress()
+        try:
+            failed = any(
+                future.exception() is not None for future in job.futures
+            )
+            version = self._pool_version(job.positions)
+            if failed or job.version != version:
+                # a worker failed, or the records changed while the job
+                # was running
+                job.fallback()
+            else:
+                job.finish(bytes(job.blocks[1].buf[: job.size]))
+        finally:
+            job.release()
+
+    def _cancel_pool_job(self):
+        """Cancel the job that is running in the worker pool"""
+        job = self._pooljob
+        if job is None:
+            return
+        self._pooljob = None
+        job.cancel()
+        self.view.configure(cursor="")
+        self._hide_progress()
+
+    # PRIVATE METHODS - PUSHED RECORDS
+
+    def _append_pushed_rows(self):
+        """Append the records pushed since the previous frame and update
+        the view once for the batch"""
+        pending = self._pushed
+        if not pending:
+            self._pushjob = self.after(self.PUSHIDLE, self._append_pushed_rows)
+            return
+        self._pushjob = self.after(16, self._append_pushed_rows)
+        rows = [pending.popleft() for _ in range(len(pending))]
+        previous = list(self._viewdata)
+        self._insert_table_rows(END, rows)
+        pagesize = self._pagesize.get()
+        if self.followtail:
+            if self._paginated:
+                # the last page of the records after the insert; the
+                # selection and focus are left as they are
+                rowcount = len(
+                    self._tablerows_filtered
+                    if self._filtered
+                    else self._tablerows
+                )
+                self._rowindex.set(
+                    pagesize * max(ceil(rowcount / pagesize) - 1, 0)
+                )
+                self.load_table_data()
+                return
+            self.load_table_data()
+            if self._virtual:
+                self._virtual_scroll_to(len(self._vrows))
+            elif self._viewdata:
+                self.view.see(self._viewdata[-1].iid)
+        elif (
+            not self._paginated
+            or len(previous) < pagesize
+            or previous != self._viewdata
+        ):
+            # the page is not full or some of its records were deleted
+            self.load_table_data()
+        else:
+            rowcount = len(
+                self._tablerows_filtered if self._filtered else self._tablerows
+            )
+            self._pagelimit.set(ceil(rowcount / pagesize))
+
+    # PRIVATE METHODS - PROGRESS
+
+    def _show_progress(self, text, cancel=None):
+        """Show the progress widgets of the pagination frame.
+
+        Parameters:
+
+            text (str):
+                The description of the operation.
+
+            cancel (Callable):
+                The function called when the operation is cancelled.
+        """
+        self._progresscancel = cancel
+        self._progresstext.set(text)
+        self._progressvalue.set(0)
+        if self._progressframe is not None:
+            self._progressframe.pack(side=LEFT, fill=Y)
+
+    def _update_progress(self, fraction, text=None):
+        """Set the completed fraction, and optionally the description,
+        of the operation in progress."""
+        self._progressvalue.set(fraction)
+        if text is not None:
+            self._progresstext.set(text)
+
+    def _hide_progress(self):
+        """Hide the progress widgets of the pagination frame"""
+        self._progresscancel = None
+        if self._progressframe is not None:
+            self._progressframe.pack_forget()
+
+    def _cancel_progress(self):
+        """Cancel the operation in progress"""
+        if self._progresscancel is not None:
+            self._progresscancel()
+
+    # PRIVATE METHODS - ROW FILTERS
+
+    def _filter_values(self, column, records):
+        """Return the values of the column for the records, or rowids
+        when the table is columnar. Numeric values are returned as a
+        numpy array when numpy is installed. The values of all records
+        are cached until the data changes."""
+        index = column.tableindex
+        if self._columnar:
+            values = self._store.numeric(index)
+            if values is not None:
+                return values[numpy.frombuffer(records, dtype="q")]
+        cache = column._filtercache
+        if (
+            cache is not None
+            and cache[0] == self._dataversion
+            and cache[1] is records
+        ):
+            return cache[2]
+        values = self._column_values(index, records)
+        if numpy is None or len(records) < len(self._tablerows):
+            return values
+        datatype = self._column_datatype(column)
+        if datatype == "numeric":
+            vector = numpy.asarray(values)
+            if vector.dtype.kind in "iuf":
+                values = vector
+        elif datatype in ("text", "datetime", "date"):
+            # equal values of these datatypes are indistinguishable,
+            # so each distinct value need only be tested once
+            values = _EncodedValues(values)
+        column._filtercache = (self._dataversion, records, values)
+        return values
+
+    def _filter_table_rows(self, tablerows, filters):
+        """Return the records of tablerows that pass every filter"""
+        records = tablerows.ids if self._columnar else tablerows
+        mask = None
+        for rowfilter in filters:
+            values = self._filter_values(rowfilter.column, records)
+            result = rowfilter.mask(values)
+            if mask is None:
+                mask = result
+            elif numpy is not None:
+                mask &= result
+            else:
+                mask = list(map(and_, mask, result))
+        if self._columnar:
+            if numpy is not None and len(records) > 0:
+                rowids = numpy.frombuffer(records, dtype="q")[mask]
+                tablerows = _RowList(self)
+                tablerows.ids.frombytes(rowids.tobytes())
+                return tablerows
+            return _RowList(self, compress(records, mask))
+        if numpy is not None:
+            mask = mask.tolist()
+        return list(compress(records, mask))
+
+    def _apply_row_filters(self, tablerows, filters, rowfilters):
+        """Show the records of tablerows that pass the filters, with
+        rowfilters as the stacked row filters. Large tables are filtered
+        in the worker pool."""
+
+        def finish(filtered):
+            self._rowfilters = rowfilters
+            self._show_filtered_rows(filtered)
+
+        if self._use_pool(tablerows):
+            self._filter_in_pool(tablerows, filters, finish)
+        else:
+            self._cancel_pool_job()
+            finish(self._filter_table_rows(tablerows, filters))
+
+    def _show_filtered_rows(self, tablerows):
+        """Show the filtered records from the first page"""
+        self._filtered = True
+        self._tablerows_filtered = tablerows
+        self._rowindex.set(0)
+        self.load_table_data()
+
+    # PRIVATE METHODS - SEARCH INDEX
+
+    def _build_search_index(self):
+        """Index the text of every record in the data set"""
+        index = self._searchindex
+        index.clear()
+        if self._columnar:
+            rowids = self._tablerows.ids
+            for rowid, values in zip(rowids, self._store.iter_rows(rowids)):
+                index.add(rowid, values)
+        else:
+            for row in self._tablerows:
+                index.add(row, row._values)
+        index.built = True
+
+    def _index_rows(self, records):
+        """Note that records were inserted and add them to the search
+        index if it has been built"""
+        self._dataversion += 1
+        self._keyindex = None
+        self._schedule_footer()
+        aggregates = self._aggregates
+        if aggregates is not None and aggregates.source is None:
+            # only records of an unfiltered table are aggregated
+            self._add_records(aggregates, records)
+        index = self._searchindex
+        if index is None or not index.built:
+            return
+        self._add_records(index, records)
+
+    def _add_records(self, index, records):
+        """Add the values of the records to an index"""
+        if self._columnar:
+            if isinstance(records, _RowList):
+                rowids = records.ids
+            else:
+                rowids = [r._rowid for r in records]
+            for rowid, values in zip(rowids, self._store.iter_rows(rowids)):
+                index.add(rowid, values)
+        else:
+            for row in records:
+                index.add(row, row._values)
+
+    def _reindex_row(self, row, invalidate=True):
+        """Update the search index after the values of a record have
+        changed. Unless invalidate is `False`, the cached sorts and
+        filters of every column are invalidated; otherwise the caller
+        invalidates those of the edited columns."""
+        if invalidate:
+            self._dataversion += 1
+        if self._keyindex is not None:
+            position, keys = self._keyindex
+            key = self._row_key(row, position)
+            keys[key] = row._rowid if self._columnar else row
+        if self._aggregates is not None:
+            if self._columnar:
+                self._aggregates.update(
+                    row._rowid, self._store.get_row(row._rowid)
+                )
+            else:
+                self._aggregates.update(row, row._values)
+            self._schedule_footer()
+        index = self._searchindex
+        if index is None or not index.built:
+            return
+        if self._columnar:
+            index.update(row._rowid, self._store.get_row(row._rowid))
+        else:
+            index.update(row, row._values)
+
+    def _invalidate_columns(self, columns):
+        """Invalidate the cached sorts, filters, datatypes and widths of
+        the columns after their cells were edited. The caches of the
+        other columns, and the previous sort unless it is sorted by one
+        of the columns, remain valid."""
+        edits = self._columnedits
+        for column in columns:
+            position = column.tableindex
+            edits[position] = edits.get(position, 0) + 1
+            column._datatype = column._sortcache = None
+            column._filtercache = column._autofitcache = None
+        last = self._lastsort
+        if last is not None and any(c in columns for c, _ in last[2]):
+            self._lastsort = None
+
+    def _pool_version(self, positions):
+        """Return the version of the columns at the positions, which
+        changes when the data changes or their cells are edited"""
+        edits = self._columnedits
+        return (
+            self._dataversion,
+            tuple((p, edits.get(p, 0)) for p in sorted(positions)),
+        )
+
+    def _search_index_steps(self, criteria):
+        """A generator that searches the indexed records in chunks and
+        returns the matching keys. When the data has not changed since
+        the previous search and the criteria contains the previous
+        criteria, only the previous matches are searched."""
+        index = self._searchindex
+        if not index.built:
+            self._build_search_index()
+        criteria = str(criteria).lower()
+        source = self._tablerows
+        keys = source.ids if self._columnar else source
+        last = self._lastsearch
+        # the records may be reordered in place, which changes the data
+        # version, or replaced by a sorted list
+        versions = (self._dataversion, index.version)
+        if (
+            last is not None
+            and last[0] is source
+            and last[1] == versions
+            and last[2] in criteria
+        ):
+            keys = last[3]
+        matches = yield from index.search(keys, criteria)
+        self._lastsearch = (source, versions, criteria, matches)
+        return matches
+
+    def _show_search_results(self, matches):
+        """Filter the table to the keys found by a search"""
+        self._filtered = True
+        self._rowfilters = []
+        if self._columnar:
+            self._tablerows_filtered = _RowList(self, matches)
+        else:
+            self._tablerows_filtered = list(matches)
         self._rowindex.set(0)
         self.load_table_data()
 
+    # PRIVATE METHODS - LIVE SEARCH
+
+    def _trace_searchcriteria(self, *_):
+        """Restart the debounce timer when the search criteria changes"""
+        self._cancel_live_search()
+        self._searchjob = self.after(self._searchdelay, self._live_search)
+
+    def _cancel_live_search(self):
+        """Cancel the pending or running live search"""
+        self._searchgen += 1
+        if self._searchjob is not None:
+            self.after_cancel(self._searchjob)
+            self._searchjob = None
+
+    def _live_search(self):
+        """Start a live search for the current criteria. An empty
+        criteria removes the search filter."""
+        self._searchjob = None
+        if self._provider is not None:
+            self._search_table_data()
+            return
+        criteria = self._searchcriteria.get()
+        if not criteria:
+            self._rowfilters = []
+            if self._filtered:
+                self._filtered = False
+                self._rowindex.set(0)
+                self.load_table_data()
+            return
+        steps = self._search_index_steps(criteria)
+        self._live_search_step(self._searchgen, steps)
+
+    def _live_search_step(self, generation, steps):
+        """Search the next chunk of records and schedule the next step.
+        The search is abandoned if the criteria has changed since it
+        was started."""
+        self._searchjob = None
+        if generation != self._searchgen:
+            steps.close()
+            return
+        try:
+            next(steps)
+        except StopIteration as done:
+            self._show_search_results(done.value)
+            return
+        self._searchjob = self.after(
+            1, self._live_search_step, generation, steps
+        )
+
+    # PRIVATE METHODS - VIEW REFRESH
+
+    def _update_row_stripes(self, iids):
+        """Stripe the even records of the page. The stripe is a pure
+        function of the position on the page, so the tags are never
+        read back from the `Treeview`; only the records whose stripe
+        changed are updated, using one call to add and one call to
+        remove the tag."""
+        if self._stripecolor is not None:
+            target = set(iids[::2])
+        else:
+            target = set()
+        added = target - self._striped
+        removed = self._striped - target
+        if added:
+            self.view.tk.call(self.view, "tag", "add", "striped", list(added))
+        if removed:
+            self.view.tk.call(
+                self.view, "tag", "remove", "striped", list(removed)
+            )
+        self._striped = target
+
+    # PRIVATE METHODS - BULK ROW OPERATIONS
+
+    def _insert_table_rows(self, index, rowdata):
+        """Create records for each row of values and splice them into
+        the data set at index in a single operation."""
+        if self._columnar:
+            self._store.extend_columns(len(self._tablecols))
+            append = self._store.append
+            records = _RowList(self)
+            records.ids.extend(
+                append(values) for values in rowdata if len(values)
+            )
+        else:
+            records = [
+                TableRow(self, values) for values in rowdata if len(values)
+            ]
+
+        rowcount = len(self._tablerows)
+        if index == END or index > rowcount - 1:
+            index = rowcount
+        if self._columnar:
+            self._tablerows.ids[index:index] = records.ids
+        else:
+            self._tablerows[index:index] = records
+        self._index_rows(records)
+        if self._maxrows is not None:
+            self._evict_oldest_rows()
+
+    def _delete_table_rows(self, records, reload=True):
+        """Remove the records from the data set, filter and view using
+        set membership, delete their items from the `Treeview` with a
+        single call, and reload the view once. Records at the start of
+        the data set, such as the oldest records of a table with a
+        maximum number of records, are removed with a single slice."""
+        if len(records) == 0:
+            return
+        if self._virtual:
+            self._virtual_sync_selection()
+        doomed = set(records)
+        self._dataversion += 1
+        self._selection = None
+        self._keyindex = None
+        self._dirtyrows.difference_update(doomed)
+        index = self._searchindex
+        if index is not None and index.built:
+            for r in doomed:
+                index.remove(r._rowid if self._columnar else r)
+        if self._aggregates is not None:
+            for r in doomed:
+                self._aggregates.remove(r._rowid if self._columnar else r)
+            self._schedule_footer()
+        iids = [r.iid for r in doomed if r._iid is not None]
+        for iid in iids:
+            self._iidmap.pop(iid, None)
+        self._striped.difference_update(iids)
+
+        if self._columnar:
+            rowids = {r._rowid for r in doomed}
+            for rowid in rowids:
+                self._rowiids.pop(rowid, None)
+            self._tablerows = _RowList(
+                self, [i for i in self._tablerows.ids if i not in rowids]
+            )
+            self._replace_filtered_rows(
+                _RowList(
+                    self,
+                    [
+                        i
+                        for i in self._tablerows_filtered.ids
+                        if i not in rowids
+                    ],
+                )
+            )
+        else:
+            self._tablerows = self._without_rows(
+                self._tablerows, records, doomed
+            )
+            self._replace_filtered_rows(
+                self._without_rows(self._tablerows_filtered, records, doomed)
+            )
+        self._viewdata[:] = [r for r in self._viewdata if r not in doomed]
+
+        if self._virtual:
+            self._vselected.difference_update(iids)
+            self._vslots.clear()
+        elif iids:
+            self.view.delete(*iids)
+
+        if reload:
+            self.load_table_data()
+
+    @staticmethod
+    def _without_rows(tablerows, records, doomed):
+        """Return the rows that are not doomed"""
+        count = len(records)
+        if isinstance(records, list) and tablerows[:count] == records:
+            del tablerows[:count]
+            return tablerows
+        return [r for r in tablerows if r not in doomed]
+
+    def _evict_oldest_rows(self):
+        """Delete the oldest records beyond the maximum number of
+        records, without reloading the view.
+
+        Returns:
+
+            List[TableRow]:
+                The records that were deleted.
+        """
+        excess = len(self._tablerows) - self._maxrows
+        if excess <= 0:
+            return []
+        if self._sortorder:
+            oldest = nsmallest(
+                excess, self._tablerows, key=attrgetter("_sort")
+            )
+        else:
+            oldest = self._tablerows[:excess]
+        self._delete_table_rows(oldest, reload=False)
+        return oldest
+
+    # PRIVATE METHODS - COLUMN STORE
+
+    def _row_view(self, rowid):
+        """Return the row view of a columnar record. Records that
+        exist in the Treeview keep a single view object."""
+        iid = self._rowiids.get(rowid)
+        if iid is not None:
+            row = self._iidmap.get(iid)
+            if row is not None:
+                return row
+        return _ColumnarTableRow(self, rowid)
+
     # PRIVATE METHODS - SORTING
 
     def _column_sort_header_reset(self):
@@ -2062,13 +6799,432 @@ class Tableview(ttk.Frame):
         for col in self.tablecolumns:
             self.view.heading(col.cid, text=col.headertext)
 
-    def _column_sort_header_update(self, cid):
-        """Add sort character to the sorted column"""
+    def _column_sort_header_set(self, sortorder):
+        """Show the sort character on each sorted column"""
+        self._column_sort_header_reset()
+        if len(sortorder) == 1:
+            self._column_sort_header_update(sortorder[0][0].cid)
+        else:
+            for position, (col, _) in enumerate(sortorder, start=1):
+                self._column_sort_header_update(col.cid, position)
+
+    def _column_sort_header_update(self, cid, position=None):
+        """Add sort character to the sorted column. The position of
+        the column in a multi-column sort follows the sort
+        character."""
         column: TableColumn = self.cidmap.get(int(cid))
         arrow = UPARROW if column.columnsort == ASCENDING else DOWNARROW
         headertext = f"{column.headertext} {arrow}"
+        if position is not None:
+            headertext += str(position)
         self.view.heading(column.cid, text=headertext)
 
+    def _column_values(self, index, records):
+        """Return the values of the records in the column at index.
+        Values missing from short records are `None`."""
+        if self._columnar:
+            col = self._store.columns[index]
+            return [col[rowid] for rowid in records]
+        try:
+            return [row._values[index] for row in records]
+        except IndexError:
+            return [
+                row._values[index] if len(row._values) > index else None
+                for row in records
+            ]
+
+    def _column_datatype(self, column):
+        """Return the datatype of the column, inferring it from the
+        data when the data has changed since it was inferred."""
+        cache = column._datatype
+        if cache is not None and cache[0] == self._dataversion:
+            return cache[1]
+        index = column.tableindex
+        if self._columnar and isinstance(self._store.columns[index], array):
+            datatype = "numeric"
+        else:
+            records = (
+                self._tablerows.ids if self._columnar else self._tablerows
+            )
+            datatype = _infer_datatype(self._column_values(index, records))
+        column._datatype = (self._dataversion, datatype)
+        return datatype
+
+    def _column_sort_cache(self, column):
+        """Return the cached sort order of all records by the column,
+        sorting the records only when the data has changed since the
+        order was cached. Records are rowids when the table is
+        columnar."""
+        cache = column._sortcache
+        if cache is not None and cache[0] == self._dataversion:
+            return cache
+        index = column.tableindex
+        datatype = self._column_datatype(column)
+        if self._columnar:
+            records = self._tablerows.ids
+            if self._store.numeric(index) is not None:
+                order = self._store.sort(records, index)
+            else:
+                values = self._column_values(index, records)
+                order = array("q", _sort_order(records, values, datatype))
+        else:
+            records = self._tablerows
+            values = self._column_values(index, records)
+            order = _sort_order(records, values, datatype)
+        column._sortcache = [self._dataversion, order, None]
+        return column._sortcache
+
+    def _column_sort_ranks(self, column):
+        """Return the rank of the value of each record in the
+        column; equal values share a rank."""
+        cache = self._column_sort_cache(column)
+        if cache[2] is None:
+            order = cache[1]
+            values = self._column_values(column.tableindex, order)
+            cache[2] = _sort_ranks(
+                order, values, self._column_datatype(column)
+            )
+        return cache[2]
+
+    def _rows_in_insert_order(self):
+        """Return all records in the order they were inserted"""
+        if self._columnar:
+            # the rowid is the insert order
+            return _RowList(self, sorted(self._tablerows.ids))
+        try:
+            return sorted(self.tablerows, key=lambda x: x._sort)
+        except IndexError:
+            self.fill_empty_columns()
+            return sorted(self.tablerows, key=lambda x: x._sort)
+
+    def _restore_table_view(self, sortorder, rowfilters, criteria):
+        """Filter or search all records and sort them, without loading
+        the view"""
+        tablerows = self._rows_in_insert_order()
+        self._tablerows = tablerows
+        self._lastsort = None
+        self._rowfilters = rowfilters
+        if rowfilters:
+            filtered = self._filter_table_rows(tablerows, rowfilters)
+        elif criteria:
+            filtered = self._search_rows(criteria)
+        else:
+            filtered = None
+        self._filtered = filtered is not None
+        self._sortorder = sortorder
+        if sortorder:
+            if filtered is None:
+                self._tablerows = self._sort_table_rows(tablerows, sortorder)
+            else:
+                filtered = self._sort_table_rows(filtered, sortorder)
+        if filtered is not None:
+            self._tablerows_filtered = filtered
+
+    def _restore_provider_view(self, sortorder, rowfilters, criteria):
+        """Pass the sort order, row filters and search criteria to the
+        data provider. An order the provider cannot sort by is
+        dropped."""
+        provider = self._provider
+        keys = [(column.tableindex, bool(d)) for column, d in sortorder]
+        if not provider.sort(keys):
+            sortorder = ()
+            provider.sort([])
+        self._sortorder = sortorder
+        provider.filter(rowfilters)
+        provider.search(criteria)
+        self._rowfilters = rowfilters
+        self._filtered = bool(criteria) or len(rowfilters) > 0
+
+    def _sort_table_rows(self, tablerows, sortorder):
+        """Sort the table rows by each column of the sort order, the
+        first column being the primary sort key. When the rows are
+        the result of the previous sort, and the data is unchanged,
+        the previous order is reused or reversed rather than sorted
+        again."""
+        last = self._lastsort
+        if (
+            last is not None
+            and last[0] is tablerows
+            and last[1] == self._dataversion
+        ):
+            lastorder = last[2]
+            if lastorder == sortorder:
+                return tablerows
+            if (
+                len(sortorder) == 1
+                and len(lastorder) == 1
+                and lastorder[0][0] is sortorder[0][0]
+            ):
+                if self._columnar:
+                    sortedrows = _RowList(self, tablerows.ids[::-1])
+                else:
+                    sortedrows = tablerows[::-1]
+                self._lastsort = (sortedrows, self._dataversion, sortorder)
+                return sortedrows
+
+        records = tablerows.ids if self._columnar else tablerows
+        if len(sortorder) == 1:
+            # select the records from the cached order of all records
+            column, columnsort = sortorder[0]
+            order = self._column_sort_cache(column)[1]
+            if len(records) == len(self._tablerows):
+                records = list(order)
+            else:
+                members = set(records)
+                records = [r for r in order if r in members]
+            if columnsort == DESCENDING:
+                records.reverse()
+        else:
+            # stable sort by each column from the last to the first
+            for column, columnsort in reversed(sortorder):
+                ranks = self._column_sort_ranks(column)
+                records = sorted(
+                    records, key=ranks.__getitem__, reverse=bool(columnsort)
+                )
+        if self._columnar:
+            sortedrows = _RowList(self, records)
+        else:
+            sortedrows = records
+        self._lastsort = (sortedrows, self._dataversion, sortorder)
+        return sortedrows
+
+    # PRIVATE METHODS - SELECTION
+
+    def _get_selected_iids(self):
+        """Return the iids of the selected records. In virtual mode,
+        these are the logical record iids rather than the pooled
+        items."""
+        if self._virtual:
+            self._virtual_sync_selection()
+            return [
+                row.iid for row in self._vrows if row.iid in self._vselected
+            ]
+        return self._selected_iids()[0]
+
+    def _get_selected_iid_set(self):
+        """Return the set of iids of the selected records"""
+        if self._virtual:
+            self._virtual_sync_selection()
+            return set(self._vselected)
+        return self._selected_iids()[1]
+
+    def _selected_iids(self):
+        """Return the selected items of the `Treeview` as a tuple and a
+        set. The selection is read once and kept until the next
+        `<<TreeviewSelect>>` event or change to the view."""
+        if self._selection is None:
+            selection = self.view.selection()
+            if self._groups:
+                iidmap = self._iidmap
+                selection = tuple(iid for iid in selection if iid in iidmap)
+            self._selection = (selection, set(selection))
+        return self._selection
+
+    def _clear_selection_cache(self, *_):
+        self._selection = None
+
+    def _set_selected_iids(self, iids):
+        """Replace the selection with the records of iids, with a single
+        `Treeview` call"""
+        if self._virtual:
+            self._vselected = set(iids)
+            slots = [
+                slot
+                for slot, row in self._vslots.items()
+                if row.iid in self._vselected
+            ]
+            self.view.selection_set(slots)
+        else:
+            iids = list(iids)
+            self.view.selection_set(iids)
+            self._selection = (tuple(iids), set(iids))
+
+    # PRIVATE METHODS - VIRTUAL SCROLLING
+
+    def _virtual_iid(self):
+        """Return a new logical iid for a virtual record"""
+        return f"V{next(self._viidcnt)}"
+
+    def _virtual_slot(self, row):
+        """Return the pooled item currently bound to the row, or None
+        if the row is not in the viewport."""
+        for slot, bound in self._vslots.items():
+            if bound == row:
+                return slot
+
+    def _virtual_sync_selection(self):
+        """Capture the selection state of the pooled items into the
+        set of selected logical records."""
+        if not self._vslots:
+            return
+        selection = set(self.view.selection())
+        for slot, row in self._vslots.items():
+            if slot in selection:
+                self._vselected.add(row.iid)
+            else:
+                self._vselected.discard(row.iid)
+
+    def _virtual_bind(self):
+        """Bind the logical rows at the current offset to the pooled
+        items and update the scrollbar."""
+        self._virtual_sync_selection()
+        rowcount = len(self._vrows)
+        poolsize = len(self._vpool)
+        offset = max(0, min(self._voffset, rowcount - poolsize))
+        self._voffset = offset
+        window = self._vrows[offset : offset + poolsize]
+
+        self._viewdata.clear()
+        self._vslots.clear()
+        selection = []
+        detached = []
+        striped = self._stripecolor is not None
+        for i, slot in enumerate(self._vpool):
+            if i >= len(window):
+                detached.append(slot)
+                continue
+            row = window[i]
+            row.build()
+            self._viewdata.append(row)
+            self._vslots[slot] = row
+            # stripes follow the logical index so they do not flicker
+            if striped and (offset + i) % 2 == 0:
+                tags = ["striped"]
+            else:
+                tags = []
+            self.view.item(slot, values=self._display_values(row), tags=tags)
+            self.view.move(slot, "", i)
+            if row.iid in self._vselected:
+                selection.append(slot)
+        if detached:
+            self.view.detach(*detached)
+        self.view.selection_set(selection)
+        self._virtual_update_scrollbar()
+
+    def _virtual_update_scrollbar(self):
+        """Set the scrollbar thumb to the logical position"""
+        rowcount = len(self._vrows)
+        if rowcount == 0:
+            self.vbar.set(0.0, 1.0)
+            return
+        first = self._voffset / rowcount
+        last = min(1.0, (self._voffset + len(self._vpool)) / rowcount)
+        self.vbar.set(first, last)
+
+    def _virtual_scroll_to(self, offset):
+        """Scroll the viewport to the logical offset"""
+        maxoffset = max(0, len(self._vrows) - len(self._vpool))
+        offset = max(0, min(int(offset), maxoffset))
+        if offset == self._voffset:
+            return
+        self._voffset = offset
+        self._virtual_bind()
+
+    def _virtual_yview(self, *args):
+        """Callback for the vertical scrollbar in virtual mode"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            offset = float(args[1]) * len(self._vrows)
+        elif args[0] == "scroll":
+            number = int(args[1])
+            if args[2] == "pages":
+                number *= max(1, len(self._vpool) - 1)
+            offset = self._voffset + number
+        else:
+            return
+        self._virtual_scroll_to(offset)
+
+    def _virtual_select_slot(self, index):
+        """Select and focus the record bound to the pooled item at
+        index."""
+        try:
+            slot = self._vpool[index]
+            row = self._vslots[slot]
+        except (IndexError, KeyError):
+            return
+        self._vselected = {row.iid}
+        self.view.selection_set(slot)
+        self.view.focus_force()
+        self.view.focus(slot)
+
+    def _virtual_on_mousewheel(self, event):
+        """Callback for mousewheel events in virtual mode"""
+        if event.num == 4:
+            delta = -3
+        elif event.num == 5:
+            delta = 3
+        elif self.tk.call("tk", "windowingsystem") == "aqua":
+            delta = -event.delta
+        else:
+            delta = -3 * int(event.delta / 120)
+        self._virtual_scroll_to(self._voffset + delta)
+        return "break"
+
+    def _virtual_on_click(self, event):
+        """A click without the shift or control modifier replaces the
+        selection, including the selected records that are scrolled
+        out of the viewport."""
+        if not event.state & 0x0005:
+            self._vselected.clear()
+
+    def _virtual_on_key(self, event):
+        """Scroll the viewport when the keyboard focus moves past the
+        first or last pooled item."""
+        slots = [s for s in self._vpool if s in self._vslots]
+        if not slots:
+            return
+        self._virtual_on_click(event)
+        focus = self.view.focus()
+        if event.keysym == "Up" and focus == slots[0]:
+            if self._voffset == 0:
+                return
+            self._virtual_scroll_to(self._voffset - 1)
+            self._virtual_select_slot(0)
+        elif event.keysym == "Down" and focus == slots[-1]:
+            if self._voffset + len(slots) >= len(self._vrows):
+                return
+            self._virtual_scroll_to(self._voffset + 1)
+            self._virtual_select_slot(len(slots) - 1)
+        elif event.keysym == "Prior":
+            self._virtual_yview("scroll", -1, "pages")
+            self._virtual_select_slot(0)
+        elif event.keysym == "Next":
+            self._virtual_yview("scroll", 1, "pages")
+            self._virtual_select_slot(len(slots) - 1)
+        else:
+            return
+        return "break"
+
+    def _virtual_resize_pool(self, *_):
+        """Grow or shrink the item pool to fill the viewport"""
+        if not self._vslots:
+            return
+        bbox = self.view.bbox(self._vpool[0])
+        if not bbox:
+            return
+        x, y, _, rowheight = bbox
+        capacity = max(1, (self.view.winfo_height() - y - x) // rowheight)
+        poolsize = len(self._vpool)
+        if capacity == poolsize:
+            return
+        elif capacity > poolsize:
+            for _ in range(capacity - poolsize):
+                slot = self.view.insert("", END)
+                self._vpool.append(slot)
+        else:
+            extra = self._vpool[capacity:]
+            del self._vpool[capacity:]
+            for slot in extra:
+                self._vslots.pop(slot, None)
+            self.view.delete(*extra)
+        self._virtual_bind()
+
+    def _trace_rowindex(self, *_):
+        """Callback for changes to the row index; a new page is always
+        shown from the top in virtual mode."""
+        self._voffset = 0
+
     # PRIVATE METHODS - WIDGET BUILDERS
 
     def _build_tableview_widget(self, coldata, rowdata, bootstyle):
@@ -2085,6 +7241,15 @@ class Tableview(ttk.Frame):
             bootstyle=f"{bootstyle}-table",
         )
         self.view.pack(fill=BOTH, expand=YES, side=TOP)
+        if self._virtual:
+            self.vbar = ttk.Scrollbar(
+                master=self, command=self._virtual_yview, orient=VERTICAL
+            )
+            self.vbar.pack(side=RIGHT, fill=Y, before=self.view)
+            self._vpool = [
+                self.view.insert("", END) for _ in range(self._height)
+            ]
+            self.view.detach(*self._vpool)
         self.hbar = ttk.Scrollbar(
             master=self, command=self.view.xview, orient=HORIZONTAL
         )
@@ -2112,6 +7277,8 @@ class Tableview(ttk.Frame):
         searchterm.pack(fill=X, side=LEFT, expand=YES)
         searchterm.bind("<Return>", self._search_table_data)
         searchterm.bind("<KP_Enter>", self._search_table_data)
+        if self._livesearch:
+            self._searchcriteria.trace_add("write", self._trace_searchcriteria)
         if not self._paginated:
             ttk.Button(
                 frame,
@@ -2176,6 +7343,26 @@ class Tableview(ttk.Frame):
 
         ttk.Label(pageframe, text=MessageCatalog.translate("Page")).pack(side=RIGHT, padx=5)
 
+        self._build_progress_frame(pageframe)
+
+    def _build_progress_frame(self, master):
+        """Build the progress widgets of the pagination frame, which are
+        shown while a long running operation is in progress."""
+        frame = ttk.Frame(master)
+        ttk.Label(frame, textvariable=self._progresstext).pack(
+            side=LEFT, padx=5
+        )
+        ttk.Progressbar(
+            frame, variable=self._progressvalue, maximum=1.0, length=120
+        ).pack(side=LEFT)
+        ttk.Button(
+            frame,
+            text="✕",
+            command=self._cancel_progress,
+            style="symbol.Link.TButton",
+        ).pack(side=LEFT)
+        self._progressframe = frame
+
     def _build_table_rows(self, rowdata):
         """Build, load, and configure the DataTableRow objects
 
@@ -2223,10 +7410,27 @@ class Tableview(ttk.Frame):
         else:
             sequence = "<Button-3>"
         self.view.bind(sequence, self._table_rightclick)
+        self.view.bind("<<TreeviewSelect>>", self._clear_selection_cache, "+")
+        self.view.bind("<<TreeviewOpen>>", self._open_group, "+")
+        self.view.bind("<<TreeviewClose>>", self._close_group, "+")
 
         # add trace to track pagesize changes
         self._pagesize.trace_add("write", self._trace_pagesize)
 
+        if self._virtual:
+            self._rowindex.trace_add("write", self._trace_rowindex)
+            self.view.bind("<MouseWheel>", self._virtual_on_mousewheel)
+            self.view.bind("<Button-4>", self._virtual_on_mousewheel)
+            self.view.bind("<Button-5>", self._virtual_on_mousewheel)
+            for sequence in ("<Up>", "<Down>", "<Prior>", "<Next>"):
+                self.view.bind(sequence, self._virtual_on_key)
+            self.view.bind("<Configure>", self._virtual_resize_pool, "+")
+            self.view.bind(
+                "<<TreeviewSelect>>",
+                lambda _: self._virtual_sync_selection(),
+                "+",
+            )
+
     # def _select_pagesize(self, event):
     #     cbo: ttk.Combobox = self.nametowidget(event.widget)
     #     cbo.select_clear()
@@ -2246,7 +7450,10 @@ class Tableview(ttk.Frame):
         """Callback for left-click events"""
         region = self.view.identify_region(event.x, event.y)
         if region == "heading":
-            self.sort_column_data(event)
+            # shift-click adds the column to the current sort
+            self.sort_column_data(event, multisort=bool(event.state & 0x0001))
+        elif self._virtual:
+            self._virtual_on_click(event)
 
     def _table_rightclick(self, event):
         """Callback for right-click events"""
@@ -2473,8 +7680,10 @@ class TableCellRightClickMenu(tk.Menu):
 
     def delete_selected_rows(self):
         """Delete the selected rows"""
-        iids = self.view.selection()
-        if len(iids) > 0:
+        iids = self.master._get_selected_iids()
+        if len(iids) > 0 and self.master._virtual:
+            self.master.delete_rows(iids=iids)
+        elif len(iids) > 0:
             # setting to prev should be in master?
             prev_item = self.view.prev(iids[0])
             self.master.delete_rows(iids=iids)
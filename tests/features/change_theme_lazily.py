@@ -0,0 +1,34 @@
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from time import perf_counter
+
+ttk.Style.lazy_build = True
+
+app = ttk.Window(themename='litera')
+colors = ['primary', 'secondary', 'success', 'info', 'warning', 'danger']
+
+notebook = ttk.Notebook(app)
+notebook.pack(fill=BOTH, expand=YES, padx=10, pady=10)
+
+# many styles on tabs that are not visible; built in idle time
+for color in colors:
+    tab = ttk.Frame(notebook, padding=10)
+    notebook.add(tab, text=color)
+    ttk.Button(tab, text='Button', bootstyle=color).pack(pady=2)
+    ttk.Button(tab, text='Outline', bootstyle=f'{color}-outline').pack(pady=2)
+    ttk.Checkbutton(tab, text='Toggle', bootstyle=f'{color}-round-toggle').pack(pady=2)
+    ttk.Radiobutton(tab, text='Radio', bootstyle=color).pack(pady=2)
+    ttk.Entry(tab, bootstyle=color).pack(pady=2)
+    ttk.Scale(tab, bootstyle=color).pack(pady=2)
+    ttk.Progressbar(tab, value=50, bootstyle=f'{color}-striped').pack(pady=2)
+
+
+def change_theme():
+    theme = 'darkly' if app.style.theme_use() != 'darkly' else 'litera'
+    start = perf_counter()
+    app.style.theme_use(theme)
+    print(f'{theme}: {(perf_counter() - start) * 1000:.1f} ms')
+
+
+ttk.Button(app, text='Change theme', command=change_theme).pack(pady=10)
+app.mainloop()
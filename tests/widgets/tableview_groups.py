@@ -0,0 +1,41 @@
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from ttkbootstrap.tableview import Tableview
+from random import Random
+
+app = ttk.Window(themename='flatly')
+colors = app.style.colors
+
+random = Random(0)
+regions = ['North', 'South', 'East', 'West']
+rowdata = [
+    [f'A{i:05d}', random.choice(regions), random.randint(1, 500)]
+    for i in range(20000)
+]
+
+dt = Tableview(
+    master=app,
+    coldata=['License', 'Region', 'UserCount'],
+    rowdata=rowdata,
+    paginated=True,
+    searchable=True,
+    bootstyle=PRIMARY,
+    stripecolor=(colors.light, None),
+)
+dt.pack(fill=BOTH, expand=YES, padx=5, pady=5)
+dt.show_footer(indices=[1, 2])
+
+frame = ttk.Frame(app)
+frame.pack(fill=X, padx=5, pady=5)
+ttk.Button(frame, text='Group by region', command=lambda: dt.group_by(index=1)).pack(side=LEFT)
+ttk.Button(frame, text='Ungroup', command=dt.group_by).pack(side=LEFT, padx=5)
+
+
+def add_row():
+    """Insert a record every 100ms; the footer is updated incrementally"""
+    dt.insert_row(END, [f'B{random.randint(0, 99999):05d}', random.choice(regions), random.randint(1, 500)])
+    app.after(100, add_row)
+
+
+add_row()
+app.mainloop()
@@ -0,0 +1,39 @@
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from ttkbootstrap.tableview import Tableview
+from random import Random
+
+app = ttk.Window(themename='flatly')
+colors = app.style.colors
+
+random = Random(0)
+symbols = [f'SYM{i:04d}' for i in range(2000)]
+prices = {symbol: random.uniform(10, 500) for symbol in symbols}
+
+dt = Tableview(
+    master=app,
+    coldata=['Symbol', 'Price', 'Change'],
+    rowdata=[[symbol, f'{price:.2f}', '0.00%'] for symbol, price in prices.items()],
+    paginated=True,
+    pagesize=25,
+    searchable=True,
+    bootstyle=PRIMARY,
+    stripecolor=(colors.light, None),
+)
+dt.pack(fill=BOTH, expand=YES, padx=5, pady=5)
+dt.set_key_column(index=0)
+
+
+def tick():
+    """Update 500 random prices, 50 times per second"""
+    updates = {}
+    for symbol in random.sample(symbols, 500):
+        change = random.uniform(-0.01, 0.01)
+        prices[symbol] *= 1 + change
+        updates[symbol] = {1: f'{prices[symbol]:.2f}', 2: f'{change:+.2%}'}
+    dt.update_cells(updates)
+    app.after(20, tick)
+
+
+tick()
+app.mainloop()
@@ -0,0 +1,47 @@
+import threading
+import time
+from datetime import datetime
+from random import Random
+
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from ttkbootstrap.tableview import Tableview
+
+app = ttk.Window(themename='flatly')
+colors = app.style.colors
+
+dt = Tableview(
+    master=app,
+    coldata=['Time', 'Level', 'Source', 'Message'],
+    paginated=True,
+    pagesize=25,
+    bootstyle=PRIMARY,
+    stripecolor=(colors.light, None),
+    maxrows=10_000,
+    followtail=True,
+)
+dt.pack(fill=BOTH, expand=YES, padx=5, pady=5)
+
+ttk.Checkbutton(
+    app,
+    text='Follow',
+    variable=ttk.BooleanVar(value=True),
+    command=lambda: setattr(dt, 'followtail', not dt.followtail),
+).pack(anchor=W, padx=5, pady=5)
+
+
+def worker(name):
+    """Log about 200 events per second"""
+    random = Random(name)
+    count = 0
+    while True:
+        count += 1
+        level = random.choice(['DEBUG', 'INFO', 'INFO', 'WARNING', 'ERROR'])
+        dt.push([datetime.now().strftime('%H:%M:%S.%f'), level, name, f'event {count}'])
+        time.sleep(0.005)
+
+
+for name in ('worker-1', 'worker-2'):
+    threading.Thread(target=worker, args=(name,), daemon=True).start()
+
+app.mainloop()
@@ -0,0 +1,37 @@
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from ttkbootstrap.tableview import Tableview, IterableDataProvider
+from random import Random
+
+app = ttk.Window(themename='flatly')
+colors = app.style.colors
+
+coldata = [
+    {"text": "SerialNumber", "stretch": False},
+    "CompanyName",
+    {"text": "UserCount", "stretch": False},
+]
+
+companies = ['IzzyCo', 'Kimdee Inc.', 'Farmadding Co.', 'Marzale LLC']
+
+
+def records():
+    """Generate the same 10 million records each time it is called"""
+    random = Random(0)
+    for i in range(10_000_000):
+        yield (f'A{i:08d}', random.choice(companies), random.randint(1, 500))
+
+
+dt = Tableview(
+    master=app,
+    coldata=coldata,
+    paginated=True,
+    pagesize=25,
+    bootstyle=PRIMARY,
+    stripecolor=(colors.light, None),
+    provider=IterableDataProvider(records),
+    height=25,
+)
+dt.pack(fill=BOTH, expand=YES, padx=5, pady=5)
+
+app.mainloop()
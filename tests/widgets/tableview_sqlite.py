@@ -0,0 +1,38 @@
+import sqlite3
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from ttkbootstrap.tableview import Tableview, SqliteDataProvider
+from random import Random
+
+app = ttk.Window(themename='flatly')
+colors = app.style.colors
+
+companies = ['IzzyCo', 'Kimdee Inc.', 'Farmadding Co.', 'Marzale LLC']
+random = Random(0)
+
+connection = sqlite3.connect(':memory:')
+connection.execute(
+    'CREATE TABLE users (SerialNumber TEXT, CompanyName TEXT, UserCount INTEGER)'
+)
+connection.executemany(
+    'INSERT INTO users VALUES (?, ?, ?)',
+    ((f'A{i:08d}', random.choice(companies), random.randint(1, 500))
+     for i in range(1_000_000))
+)
+
+provider = SqliteDataProvider(connection, table='users')
+provider.create_search_index()
+
+dt = Tableview(
+    master=app,
+    paginated=True,
+    pagesize=25,
+    searchable=True,
+    bootstyle=PRIMARY,
+    stripecolor=(colors.light, None),
+    provider=provider,
+    height=25,
+)
+dt.pack(fill=BOTH, expand=YES, padx=5, pady=5)
+
+app.mainloop()
@@ -0,0 +1,33 @@
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from ttkbootstrap.tableview import Tableview
+from random import choice, randint
+
+app = ttk.Window(themename='flatly')
+colors = app.style.colors
+
+coldata = [
+    {"text": "SerialNumber", "stretch": False},
+    "CompanyName",
+    {"text": "UserCount", "stretch": False},
+]
+
+companies = ['IzzyCo', 'Kimdee Inc.', 'Farmadding Co.', 'Marzale LLC']
+rowdata = [
+    (f'A{i:06d}', choice(companies), randint(1, 500))
+    for i in range(500_000)
+]
+
+dt = Tableview(
+    master=app,
+    coldata=coldata,
+    rowdata=rowdata,
+    searchable=True,
+    bootstyle=PRIMARY,
+    stripecolor=(colors.light, None),
+    virtual=True,
+    height=20,
+)
+dt.pack(fill=BOTH, expand=YES, padx=5, pady=5)
+
+app.mainloop()